@@ -0,0 +1,90 @@
+"""리뷰 텍스트 키워드 주석 작업.
+
+리뷰 코퍼스를 청크로 나눠 프로세스 풀에서 분류하고, review_id별 이슈 비트마스크와 긍정
+여부를 Parquet으로 저장한다. 대시보드(loader.load_reviews)는 이 결과를 읽기만 한다.
+
+사용법:
+    python claude_eda/annotate_reviews.py [--workers N] [--chunk-size 5000]
+    python claude_eda/annotate_reviews.py --throughput [--workers N] [--repeat 3]
+
+--throughput: 워커 수(1, 2, 4, ... N, 기본 CPU 수)별 처리량(reviews/sec)만 측정하고
+              저장하지 않는다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from claude_eda.dashboard.data.review_annotations import (  # noqa: E402
+    DEFAULT_CHUNK_SIZE,
+    annotate_corpus,
+    annotations_path,
+    build_review_annotations,
+    load_review_texts,
+)
+from claude_eda.dashboard.engine.review_analyzer import (  # noqa: E402
+    ISSUE_CATEGORIES,
+    ISSUE_BITS,
+    ISSUE_MASK_COL,
+    POSITIVE_COL,
+)
+
+
+def _worker_counts(max_workers: int) -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def report_throughput(max_workers: int, chunk_size: int, repeat: int) -> None:
+    """워커 수별 처리량 — 프로세스 풀 기동 비용 포함, repeat회 중 최솟값."""
+    texts = load_review_texts()["review_comment_message"]
+    print(f"리뷰 수: {len(texts):,} (텍스트 있음 {texts.notna().sum():,}), CPU {os.cpu_count()}개")
+    print(f"{'workers':>7}  {'sec':>7}  {'reviews/sec':>12}")
+    for workers in _worker_counts(max_workers):
+        best = float("inf")
+        for _ in range(repeat):
+            t = time.perf_counter()
+            annotate_corpus(texts, workers, chunk_size)
+            best = min(best, time.perf_counter() - t)
+        print(f"{workers:>7}  {best:>7.2f}  {len(texts) / best:>12,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--throughput", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.throughput:
+        report_throughput(args.workers, args.chunk_size, args.repeat)
+        return
+
+    t = time.perf_counter()
+    annotations = build_review_annotations(args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - t
+    print(f"주석 완료: {len(annotations):,}건, {elapsed:.2f}s "
+          f"({len(annotations) / elapsed:,.0f} reviews/sec, workers={args.workers})")
+    print(f"저장: {annotations_path()}")
+
+    masks = annotations[ISSUE_MASK_COL]
+    for cat in ISSUE_CATEGORIES:
+        print(f"  {cat}: {(masks & ISSUE_BITS[cat]).gt(0).sum():,}")
+    print(f"  긍정: {annotations[POSITIVE_COL].sum():,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""대시보드 데이터 계층 성능 벤치마크.
+
+사용법:
+    python claude_eda/benchmark_dashboard.py {cache,store,ids,partition,season,geo,hubs} [--repeat 3]
+
+cache: 원본 CSV 파싱 vs Parquet 캐시 읽기 (콜드 스타트 비용 비교)
+store: st.cache_data 방식(히트마다 역직렬화 복사) vs 공유 프레임 저장소 히트 비용
+ids:   32자리 문자열 ID vs int32 코드 — 조인/필터 시간과 컬럼 메모리
+partition: 셀러 슬라이스 — 전체 스캔(==) vs 셀러 분할 인덱스
+season: 배송 기본 테이블 계절 할당 — 행 단위 apply vs 권역×월 테이블 (콜드 빌드 포함)
+geo:   고객→창고 거리 — 창고별 haversine 반복(약 13회) vs 고객×창고 거리 행렬 1회
+hubs:  전체 고객의 최근접 후보 거점 — 거리 행렬 최소값 vs SiteIndex(BallTree) (거점 5~200개)
+"""
+
+from __future__ import annotations
+
+import argparse
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit.logger  # noqa: E402
+
+# 스트림릿 런타임 밖에서 실행되므로 캐시 경고 로그를 숨긴다
+streamlit.logger.set_log_level("error")
+
+from claude_eda.dashboard import config  # noqa: E402
+from claude_eda.dashboard.data.columnar_cache import (  # noqa: E402
+    PARQUET_AVAILABLE,
+    read_csv_cached,
+)
+from claude_eda.dashboard.data import schema  # noqa: E402
+from claude_eda.dashboard.data.delivery_analyzer import (  # noqa: E402
+    DEFAULT_RAINY_MONTHS,
+    _build_delivery_base,
+    assign_season,
+)
+from claude_eda.dashboard.data.geo import (  # noqa: E402
+    SiteIndex,
+    distance_matrix,
+    haversine_km,
+)
+from claude_eda.dashboard.data.loader import (  # noqa: E402
+    ORDER_DATE_COLS,
+    build_merged_table,
+    encode_ids,
+    load_orders,
+    load_warehouse_recommendations,
+    merged_by_seller,
+)
+
+# (표시명, 경로, read_csv_cached 옵션) — loader.py의 읽기 옵션과 동일하게 유지
+CACHE_TARGETS = [
+    ("orders", config.ORDERS_PATH, {
+        "dtype": schema.ORDERS_DTYPES,
+        "parse_dates": ORDER_DATE_COLS,
+        "date_format": schema.TIMESTAMP_FORMAT,
+    }),
+    ("order_items", config.ORDER_ITEMS_PATH, {
+        "dtype": schema.ORDER_ITEMS_DTYPES,
+        "parse_dates": ["shipping_limit_date"],
+        "date_format": schema.TIMESTAMP_FORMAT,
+    }),
+    ("reviews", config.REVIEWS_PATH, {"dtype": schema.REVIEWS_DTYPES}),
+    ("customers", config.CUSTOMERS_PATH, {"dtype": schema.CUSTOMERS_DTYPES}),
+    ("payments", config.PAYMENTS_PATH, {"dtype": schema.PAYMENTS_DTYPES}),
+    ("products", config.PRODUCTS_PATH, {"dtype": schema.PRODUCTS_DTYPES}),
+    ("sellers", config.SELLERS_PATH, {"dtype": schema.SELLERS_DTYPES}),
+    ("geolocation", config.GEOLOCATION_PATH, {
+        "usecols": schema.GEOLOCATION_COLUMNS,
+        "dtype": schema.GEOLOCATION_DTYPES,
+    }),
+]
+
+
+def _best_of(fn, repeat: int) -> float:
+    """repeat회 실행 중 최소 소요 시간 (초)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_cache(repeat: int) -> None:
+    if not PARQUET_AVAILABLE:
+        print("pyarrow가 설치되어 있지 않아 Parquet 캐시를 사용할 수 없습니다.")
+        return
+
+    print(f"{'table':<14}{'rows':>10}{'csv(s)':>10}{'parquet(s)':>12}{'speedup':>10}")
+    total_csv = total_cached = 0.0
+    for name, path, options in CACHE_TARGETS:
+        if not path.exists():
+            print(f"{name:<14}{'(없음)':>10}")
+            continue
+        rows = len(read_csv_cached(path, **options))  # 캐시 생성 (warm-up)
+        csv_t = _best_of(lambda: read_csv_cached(path, use_cache=False, **options), repeat)
+        cached_t = _best_of(lambda: read_csv_cached(path, **options), repeat)
+        total_csv += csv_t
+        total_cached += cached_t
+        print(f"{name:<14}{rows:>10,}{csv_t:>10.3f}{cached_t:>12.3f}{csv_t / cached_t:>9.1f}x")
+
+    if total_cached > 0:
+        print(
+            f"{'total':<14}{'':>10}{total_csv:>10.3f}{total_cached:>12.3f}"
+            f"{total_csv / total_cached:>9.1f}x"
+        )
+
+
+def bench_store(repeat: int) -> None:
+    print(f"{'table':<16}{'MB/hit(copy)':>14}{'copy hit(ms)':>14}{'shared hit(ms)':>16}")
+    for name, loader_fn in [
+        ("merged", build_merged_table),
+        ("delivery_base", _build_delivery_base),
+        ("orders", load_orders),
+    ]:
+        df = loader_fn()
+        # st.cache_data는 값을 pickle로 저장하고 히트마다 역직렬화한다
+        blob = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+        copy_mb = df.memory_usage(deep=True).sum() / 1e6
+        copy_t = _best_of(lambda: pickle.loads(blob), repeat)
+        shared_t = _best_of(loader_fn, repeat)
+        print(f"{name:<16}{copy_mb:>14.1f}{copy_t * 1e3:>14.2f}{shared_t * 1e3:>16.3f}")
+
+
+def bench_ids(repeat: int) -> None:
+    items = read_csv_cached(config.ORDER_ITEMS_PATH, **CACHE_TARGETS[1][2])
+    orders = read_csv_cached(config.ORDERS_PATH, **CACHE_TARGETS[0][2])
+    items_c, orders_c = encode_ids(items), encode_ids(orders)
+    seller = items["seller_id"].iloc[0]
+    seller_c = items_c["seller_id"].iloc[0]
+
+    print(f"{'operation':<28}{'string':>12}{'int32':>12}{'speedup':>10}")
+    for name, fn_str, fn_code in [
+        ("items ⋈ orders (ms)",
+         lambda: items.merge(orders, on="order_id", how="left"),
+         lambda: items_c.merge(orders_c, on="order_id", how="left")),
+        ("seller filter (ms)",
+         lambda: items[items["seller_id"] == seller],
+         lambda: items_c[items_c["seller_id"] == seller_c]),
+        ("order nunique (ms)",
+         lambda: items["order_id"].nunique(),
+         lambda: items_c["order_id"].nunique()),
+    ]:
+        str_t = _best_of(fn_str, repeat)
+        code_t = _best_of(fn_code, repeat)
+        print(f"{name:<28}{str_t * 1e3:>12.2f}{code_t * 1e3:>12.2f}{str_t / code_t:>9.1f}x")
+
+    id_cols = ["order_id", "product_id", "seller_id"]
+    str_mb = items[id_cols].memory_usage(deep=True, index=False).sum() / 1e6
+    code_mb = items_c[id_cols].memory_usage(deep=True, index=False).sum() / 1e6
+    print(f"{'items ID columns (MB)':<28}{str_mb:>12.1f}{code_mb:>12.1f}{str_mb / code_mb:>9.1f}x")
+
+
+def bench_partition(repeat: int) -> None:
+    merged = build_merged_table()
+    partition = merged_by_seller()
+    # 행이 많은 셀러 / 중간 셀러 / 적은 셀러
+    sizes = np.diff(partition.offsets)
+    ranked = np.argsort(sizes)[::-1]
+    picks = [ranked[0], ranked[len(ranked) // 2], ranked[np.count_nonzero(sizes) - 1]]
+
+    print(f"{'seller rows':<14}{'scan(ms)':>12}{'partition(ms)':>16}{'speedup':>10}")
+    for code in picks:
+        scan_t = _best_of(lambda: merged[merged["seller_id"] == code], repeat)
+        part_t = _best_of(lambda: partition.rows_for_code(code), repeat)
+        print(f"{sizes[code]:<14,}{scan_t * 1e3:>12.3f}{part_t * 1e3:>16.3f}{scan_t / part_t:>9.1f}x")
+
+
+def _season_apply(df):
+    """이전 방식 — 행마다 파이썬 함수 호출."""
+    def _season(row):
+        rainy = config.RAINY_MONTHS.get(row["customer_region"], DEFAULT_RAINY_MONTHS)
+        return "우기" if row["order_month"] in rainy else "건기"
+
+    return df.apply(_season, axis=1)
+
+
+def bench_season(repeat: int) -> None:
+    base = _build_delivery_base()
+    frame = base[["customer_region", "order_month"]]
+    apply_t = _best_of(lambda: _season_apply(frame), repeat)
+    lookup_t = _best_of(lambda: assign_season(frame["customer_region"], frame["order_month"]), repeat)
+
+    def cold_build():
+        _build_delivery_base.clear()
+        _build_delivery_base()
+
+    build_t = _best_of(cold_build, repeat)  # 원본 테이블 로드는 캐시 히트
+    # 이전 빌드 = 현재 빌드에서 계절 단계만 apply로 바꾼 것 (나머지 단계는 동일)
+    legacy_t = build_t - lookup_t + apply_t
+
+    print(f"rows: {len(base):,}")
+    print(f"{'step':<22}{'apply(ms)':>12}{'lookup(ms)':>12}{'speedup':>10}")
+    print(f"{'season':<22}{apply_t * 1e3:>12.1f}{lookup_t * 1e3:>12.2f}{apply_t / lookup_t:>9.1f}x")
+    print(f"{'delivery base build':<22}{legacy_t * 1e3:>12.1f}{build_t * 1e3:>12.1f}"
+          f"{legacy_t / build_t:>9.1f}x")
+
+
+def _warehouse_distances_loop(lat, lng, wh):
+    """이전 방식 — 창고 평균 5회 + 최근접 1회 + 상위 3개 3회 + 전체 5회 haversine 호출."""
+    means = [haversine_km(lat, lng, r["lat"], r["lng"]).mean() for _, r in wh.iterrows()]
+    order = np.argsort(means)
+    top = wh.iloc[order]
+    haversine_km(lat, lng, top.iloc[0]["lat"], top.iloc[0]["lng"]).mean()
+    np.column_stack([haversine_km(lat, lng, r["lat"], r["lng"])
+                     for _, r in top.head(3).iterrows()]).min(axis=1)
+    return np.column_stack([haversine_km(lat, lng, r["lat"], r["lng"])
+                            for _, r in top.iterrows()]).min(axis=1)
+
+
+def _warehouse_distances_matrix(lat, lng, wh):
+    """현재 방식 — 거리 행렬 1회에서 창고 순위·상위 3개·전체 최소 거리를 모두 꺼낸다."""
+    dist = distance_matrix(lat, lng, wh["lat"].values, wh["lng"].values)
+    order = np.argsort(dist.mean(axis=0, dtype=np.float64), kind="stable")
+    dist[:, order[:3]].min(axis=1)
+    return dist.min(axis=1)
+
+
+def bench_geo(repeat: int) -> None:
+    merged = build_merged_table()
+    cust = merged[merged["order_status"].eq("delivered") & merged["customer_lat"].notna()]
+    lat = cust["customer_lat"].to_numpy(dtype="float64")
+    lng = cust["customer_lng"].to_numpy(dtype="float64")
+    wh = load_warehouse_recommendations()
+
+    loop_t = _best_of(lambda: _warehouse_distances_loop(lat, lng, wh), repeat)
+    matrix_t = _best_of(lambda: _warehouse_distances_matrix(lat, lng, wh), repeat)
+    gap = np.abs(_warehouse_distances_loop(lat, lng, wh) - _warehouse_distances_matrix(lat, lng, wh))
+
+    print(f"customers: {len(cust):,}  warehouses: {len(wh)}  max |diff| km: {gap.max():.4f}")
+    print(f"{'step':<22}{'loop(ms)':>12}{'matrix(ms)':>12}{'speedup':>10}")
+    print(f"{'warehouse distances':<22}{loop_t * 1e3:>12.1f}{matrix_t * 1e3:>12.1f}"
+          f"{loop_t / matrix_t:>9.1f}x")
+
+
+def bench_hubs(repeat: int) -> None:
+    merged = build_merged_table()
+    cust = merged[merged["order_status"].eq("delivered") & merged["customer_lat"].notna()]
+    lat = cust["customer_lat"].to_numpy(dtype="float64")
+    lng = cust["customer_lng"].to_numpy(dtype="float64")
+    rng = np.random.default_rng(0)
+
+    print(f"customers: {len(cust):,}")
+    print(f"{'hubs':<8}{'matrix(ms)':>12}{'balltree(ms)':>14}{'speedup':>10}{'max |diff| km':>16}")
+    for n_hubs in [5, 50, 200]:
+        pick = rng.choice(len(cust), size=n_hubs, replace=False)
+        hub_lat, hub_lng = lat[pick], lng[pick]
+        matrix_t = _best_of(
+            lambda: distance_matrix(lat, lng, hub_lat, hub_lng).min(axis=1), repeat
+        )
+        tree_t = _best_of(lambda: SiteIndex(hub_lat, hub_lng).nearest(lat, lng), repeat)
+        gap = np.abs(
+            distance_matrix(lat, lng, hub_lat, hub_lng).min(axis=1)
+            - SiteIndex(hub_lat, hub_lng).nearest(lat, lng)[1]
+        )
+        print(f"{n_hubs:<8}{matrix_t * 1e3:>12.1f}{tree_t * 1e3:>14.1f}"
+              f"{matrix_t / tree_t:>9.1f}x{gap.max():>16.4f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target", choices=["cache", "store", "ids", "partition", "season", "geo", "hubs"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.target == "cache":
+        bench_cache(args.repeat)
+    elif args.target == "store":
+        bench_store(args.repeat)
+    elif args.target == "ids":
+        bench_ids(args.repeat)
+    elif args.target == "partition":
+        bench_partition(args.repeat)
+    elif args.target == "season":
+        bench_season(args.repeat)
+    elif args.target == "geo":
+        bench_geo(args.repeat)
+    elif args.target == "hubs":
+        bench_hubs(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,9 @@ if _project_root not in sys.path:
 import streamlit as st
 
 from claude_eda.dashboard.config import APP_ICON, APP_LAYOUT, APP_TITLE
-from claude_eda.dashboard.data.loader import get_seller_list, load_seller_clusters
+from claude_eda.dashboard.data.id_codec import MISSING_CODE
+from claude_eda.dashboard.data.loader import get_seller_list, load_seller_clusters, seller_codec
+from claude_eda.dashboard.data.memo import dataset_version
 from claude_eda.dashboard.data.preprocessor import compute_seller_metrics
 from claude_eda.dashboard.views.consulting import render_consulting
 from claude_eda.dashboard.views.dashboard import render_dashboard
@@ -31,6 +33,9 @@ st.set_page_config(
     layout=APP_LAYOUT,
 )
 
+# 원본 데이터 파일이 바뀌었으면 스트림릿 캐시를 모두 비운다 (memo.dataset_version)
+dataset_version()
+
 # --- 사이드바 ---
 with st.sidebar:
     st.title(f"{APP_ICON} {APP_TITLE}")
@@ -57,14 +62,15 @@ with st.sidebar:
     # 매출 상위 셀러 selectbox — format_func으로 표시
     seller_list = get_seller_list()
     top50 = seller_list.head(50)
+    top50_ids = seller_codec().decode(top50["seller_id"])
 
     # seller_id 리스트 (None = 미선택)
-    seller_id_options = [""] + top50["seller_id"].tolist()
+    seller_id_options = [""] + top50_ids.tolist()
     # 라벨 매핑 딕셔너리 (한 번만 생성)
     _label_cache = {}
-    for _, r in top50.iterrows():
-        name = r.get("company_name_en", "") or r["seller_id"][:12]
-        _label_cache[r["seller_id"]] = (
+    for sid, (_, r) in zip(top50_ids, top50.iterrows()):
+        name = r.get("company_name_en", "") or sid[:12]
+        _label_cache[sid] = (
             f"#{int(r['rank'])} | {name} | "
             f"{fmt_currency_short(r['total_revenue'])} | "
             f"{SELLER_CLUSTER_SHORT.get(int(r['cluster']), '?')}"
@@ -100,7 +106,8 @@ if page == "분석 방법론":
 elif selected_seller_id:
     # 셀러 존재 확인
     all_sellers = load_seller_clusters()
-    if selected_seller_id not in all_sellers["seller_id"].values:
+    selected_code = seller_codec().encode_one(selected_seller_id)
+    if selected_code == MISSING_CODE or selected_code not in all_sellers["seller_id"].values:
         st.error(f"셀러 ID `{selected_seller_id}`를 찾을 수 없습니다.")
         st.info("올바른 32자리 셀러 ID를 입력해주세요.")
         st.stop()
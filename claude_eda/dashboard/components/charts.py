@@ -531,16 +531,16 @@ def price_boxplot(price_stats_df, seller_prices: dict | None = None) -> go.Figur
 
     fig = go.Figure()
 
-    # 시장 가격 범위 (P25-P75 박스)
+    # 시장 가격 범위 (P25-P75 박스, P5-P95 수염)
     for _, row in top10.iterrows():
         cat = row["category"]
         fig.add_trace(go.Box(
             x=[cat],
-            lowerfence=[row["p25"]],
+            lowerfence=[row["p5"]],
             q1=[row["p25"]],
             median=[row["median_price"]],
             q3=[row["p75"]],
-            upperfence=[row["p75"]],
+            upperfence=[row["p95"]],
             name="시장",
             marker_color=COLORS["info"],
             showlegend=False,
@@ -564,7 +564,7 @@ def price_boxplot(price_stats_df, seller_prices: dict | None = None) -> go.Figur
             ))
 
     fig.update_layout(
-        title="카테고리별 가격 분포 (P25-P75) vs 내 가격",
+        title="카테고리별 가격 분포 (P5-P25-P75-P95) vs 내 가격",
         yaxis=dict(title="가격 (R$)"),
         height=400,
         margin=dict(t=60, b=80),
@@ -625,7 +625,7 @@ def revenue_simulation_chart(simulation_data: list[dict]) -> go.Figure:
     fig.add_trace(go.Bar(
         x=labels,
         y=revenues,
-        marker_color=bar_colors[:len(labels)],
+        marker_color=[bar_colors[i % len(bar_colors)] for i in range(len(labels))],
         text=[f"R${r:,.0f}\n({o:.1f}건/월, {s:.0%})"
               for r, o, s in zip(revenues, orders, shares)],
         textposition="outside",
@@ -790,7 +790,7 @@ def logistics_scenario_bar(simulation: list[dict]) -> go.Figure:
     fig = go.Figure(go.Bar(
         x=scenarios,
         y=distances,
-        marker_color=bar_colors[:len(scenarios)],
+        marker_color=[bar_colors[min(i, len(bar_colors) - 1)] for i in range(len(scenarios))],
         text=[f"{d:.0f}km" for d in distances],
         textposition="outside",
     ))
@@ -803,7 +803,7 @@ def logistics_scenario_bar(simulation: list[dict]) -> go.Figure:
             fig.add_annotation(
                 x=scenarios[i], y=distances[i] + 15,
                 text=f"-{pct:.0f}%", showarrow=False,
-                font=dict(size=12, color=bar_colors[i], weight="bold"),
+                font=dict(size=12, color=bar_colors[min(i, len(bar_colors) - 1)], weight="bold"),
             )
 
     fig.update_layout(
@@ -856,7 +856,7 @@ def logistics_savings_bar(simulation: list[dict]) -> go.Figure:
 
 
 def region_effect_bar(region_effect) -> go.Figure:
-    """권역별 5개 창고 활용 시 거리 감소 효과."""
+    """권역별 전체 창고 활용 시 거리 감소 효과."""
     if region_effect is None or region_effect.empty:
         return _empty_chart("권역별 데이터 없음")
 
@@ -877,7 +877,7 @@ def region_effect_bar(region_effect) -> go.Figure:
         textposition="outside",
     ))
     fig.update_layout(
-        title="권역별 거리 감소 효과 (5개 창고)",
+        title="권역별 거리 감소 효과 (전체 창고)",
         xaxis=dict(title="평균 거리 감소 (km)"),
         height=350,
         margin=dict(t=50, b=40, l=100, r=120),
@@ -36,9 +36,45 @@ WAREHOUSE_RECOMMENDATIONS_PATH = CLUSTER_DIR / "warehouse_recommendations.csv"
 WAREHOUSE_SCENARIO_PATH = CLUSTER_DIR / "warehouse_scenario_comparison.csv"
 WAREHOUSE_STATE_GAP_PATH = CLUSTER_DIR / "warehouse_state_gap_analysis.csv"
 
+# 창고 입지 최적화 결과 (claude_eda/plan_warehouses.py) — 기본은 별도 파일에 쓰고,
+# --apply일 때만 대시보드가 읽는 위 두 CSV를 덮어쓴다
+WAREHOUSE_PLAN_RECOMMENDATIONS_PATH = CLUSTER_DIR / "warehouse_recommendations_planned.csv"
+WAREHOUSE_PLAN_SCENARIO_PATH = CLUSTER_DIR / "warehouse_scenario_comparison_planned.csv"
+
+# 전체 셀러 성장 가능 지역 Top 5 (claude_eda/export_growth_regions.py가 생성)
+GROWTH_REGIONS_EXPORT_PATH = CLUSTER_DIR / "seller_growth_regions.csv"
+# 창고 활용 효과(거리 절감 총량) 셀러 순위 (claude_eda/export_warehouse_benefit.py가 생성)
+WAREHOUSE_BENEFIT_EXPORT_PATH = CLUSTER_DIR / "seller_warehouse_benefit.csv"
+
+# 창고 시나리오 시뮬레이션 — 셀러에게 유리한 순 상위 k개 창고만 운영하는 시나리오
+# (전체 창고 운영 시나리오는 항상 마지막에 추가, 창고 수 이상인 값은 무시)
+WAREHOUSE_SCENARIO_SIZES = (1, 3)
+
+# 거리 → 운임·배송일 선형 모델 (data/distance_model.py, 배송 완료 주문에서 적합)
+DISTANCE_MODEL_GROUP_BY = "region"  # None(전체) | "region"(고객 권역) | "weight_band"(과금 중량)
+DISTANCE_MODEL_MIN_ROWS = 30  # 행 수가 이보다 적은 그룹은 전체 계수 사용
+# 전체 적합 기울기가 0 이하일 때 쓰는 기본 계수 — warehouse EDA 도출값 (절편은 데이터가 없을 때만)
+DISTANCE_MODEL_DEFAULT_FREIGHT = (0.0104, 13.70)  # (km당 운임 R$, 절편)
+DISTANCE_MODEL_DEFAULT_DAYS = (0.00606, 8.64)  # (km당 배송일, 절편)
+VOLUMETRIC_DIVISOR = 6  # 부피중량(g) = 부피(cm³) / 6  (6000 cm³/kg)
+WEIGHT_BAND_EDGES_G = [0, 500, 2_000, 5_000, 10_000, float("inf")]
+WEIGHT_BAND_LABELS = ["~0.5kg", "0.5~2kg", "2~5kg", "5~10kg", "10kg+"]
+
 # 재고 관리 데이터 경로
 INVENTORY_DATA_DIR = RAW_DATA_DIR / "inventory"
 
+# 원본 CSV의 Parquet 캐시 경로 (CSV 크기/수정시각이 바뀌면 자동 재생성)
+COLUMNAR_CACHE_DIR = PROJECT_ROOT / ".cache" / "columnar"
+
+# 리뷰 텍스트 키워드 주석 (claude_eda/annotate_reviews.py가 생성, 대시보드는 읽기만 한다)
+REVIEW_ANNOTATIONS_DIR = PROJECT_ROOT / ".cache" / "review_annotations"
+
+# 셀러별 분석 함수 메모이제이션 한도 (data/memo.py, 함수별 적용)
+MEMO_MAX_ENTRIES = 256
+MEMO_TTL_SECONDS = 30 * 60
+MEMO_MAX_BYTES = 64 * 1024 * 1024
+MEMO_VERSION_CHECK_SECONDS = 5  # 원본 파일 식별자(크기/mtime) 재확인 주기
+
 # 브라질 권역 매핑
 REGION_MAP = {
     "SP": "Southeast", "RJ": "Southeast", "MG": "Southeast", "ES": "Southeast",
@@ -68,6 +104,21 @@ RAINY_MONTHS_DISPLAY = {
     "Central-West": "10~3월",
 }
 
+# 셀러→고객 거리 구간 (거리 구간별 배송일 차트)
+DISTANCE_BINS_KM = [0, 200, 500, 1000, 2000, 10000]
+DISTANCE_BIN_LABELS = ["0-200km", "200-500km", "500-1000km", "1000-2000km", "2000km+"]
+
+# 가격대별 매출 시뮬레이션 — 기본 가격대 (하한, 상한, 라벨), 상한 50000 이상은 "상한 없음"
+PRICE_BANDS = [
+    (0, 30, "저가 (R$0-30)"),
+    (30, 100, "볼륨존 (R$30-100)"),
+    (100, 200, "프리미엄 (R$100-200)"),
+    (200, 50000, "고가 (R$200+)"),
+]
+# 가격 히스토그램 버킷 — 구간 안은 유효숫자 2자리 로그 눈금 (10배마다 90개), 바깥은 양끝 버킷
+PRICE_HIST_RANGE = (1, 10_000)
+PRICE_HIST_DIGITS = 2
+
 # 앱 설정
 APP_TITLE = "Olist 셀러 컨설팅 대시보드"
 APP_ICON = "📊"
@@ -0,0 +1,205 @@
+"""전체 셀러 성장 가능 지역 일괄 추천 엔진.
+
+``compute_seller_growth_regions``의 점수를 셀러 한 명씩 필터·그룹핑하지 않고 행렬 연산으로
+계산한다. 카테고리 × 셀러 주 매트릭스(``compute_category_state_matrix``)를 (카테고리 × 주)
+밀집 행렬로 펼쳐 두면, 셀러 × 카테고리 선택 행렬 W에 대해
+
+- 시장 매출·주문·경쟁 셀러 = ``W @ 매출``, ``W @ 주문``, ``W @ 셀러수``
+- 평균가 = ``W @ 평균가`` / ``W @ 존재 여부`` (셀러 카테고리가 있는 주의 카테고리 평균가 평균)
+
+이고, 정규화(셀러별로 시장이 있는 주 기준 최소-최대)와 가중합, 자기 주 제외, 상위 5개
+선택도 셀러 축으로 한 번에 끝난다. 셀러 카테고리는 셀러 페이지와 같이 매출 상위 10개
+카테고리(``category_incidence``의 매출 행렬 기준)다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.data.category_incidence import category_incidence
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.loader import load_sellers
+
+TOP_REGIONS = 5
+SELLER_TOP_CATEGORIES = 10  # 셀러 페이지 category_revenue와 같은 상위 N개
+
+# 기회 점수 = 수급비율 × 0.4 + 시장매출 × 0.3 + 셀러당 주문 × 0.3 (각각 0~100 정규화)
+SCORE_WEIGHTS = {"ratio": 0.4, "market_revenue": 0.3, "orders_per_seller": 0.3}
+
+GROWTH_COLUMNS = [
+    "state", "opportunity_score", "opportunity_grade", "market_revenue", "market_orders",
+    "competitors", "orders_per_seller", "avg_price", "customers", "reason",
+]
+
+
+@dataclass(frozen=True)
+class MarketGrid:
+    """카테고리 × 주 밀집 행렬 + 주별 수급 지표 (점수 계산 입력)."""
+
+    categories: pd.Index
+    states: pd.Index
+    revenue: np.ndarray
+    orders: np.ndarray
+    sellers: np.ndarray
+    avg_price: np.ndarray
+    present: np.ndarray
+    ratio: np.ndarray  # 주별 고객/셀러 비율 (수급 데이터 없으면 NaN)
+    customers: np.ndarray
+    grade: np.ndarray
+
+    def selection(self, categories_per_row: list[list[str]]) -> np.ndarray:
+        """행별 카테고리 이름 목록 → (행 수, 카테고리 수) 0/1 선택 행렬."""
+        w = np.zeros((len(categories_per_row), len(self.categories)))
+        for i, cats in enumerate(categories_per_row):
+            pos = self.categories.get_indexer(pd.Index(list(cats), dtype=object))
+            w[i, pos[pos >= 0]] = 1.0
+        return w
+
+
+@st.cache_resource
+def market_grid() -> MarketGrid:
+    """카테고리 × 셀러 주 매트릭스와 주별 수급을 점수 계산용 밀집 행렬로 변환."""
+    from claude_eda.dashboard.data.market_analyzer import (
+        compute_category_state_matrix,
+        compute_regional_supply_demand,
+    )
+
+    matrix = compute_category_state_matrix()
+    matrix = matrix.assign(category=matrix["category"].astype(object), state=matrix["state"].astype(object))
+    categories = pd.Index(sorted(matrix["category"].unique()), dtype=object)
+    states = pd.Index(sorted(matrix["state"].unique()), dtype=object)
+    row = categories.get_indexer(matrix["category"])
+    col = states.get_indexer(matrix["state"])
+
+    def dense(values) -> np.ndarray:
+        out = np.zeros((len(categories), len(states)))
+        out[row, col] = np.asarray(values, dtype=np.float64)
+        out.flags.writeable = False
+        return out
+
+    supply = compute_regional_supply_demand().set_index("state").reindex(states)
+    arrays = {
+        "ratio": supply["ratio"].to_numpy(dtype=np.float64),
+        "customers": supply["customers"].fillna(0).to_numpy(dtype=np.int64),
+        "grade": supply["opportunity_grade"].fillna("").to_numpy(dtype=object),
+    }
+    for arr in arrays.values():
+        arr.flags.writeable = False
+    return MarketGrid(
+        categories=categories,
+        states=states,
+        revenue=dense(matrix["revenue"]),
+        orders=dense(matrix["orders"]),
+        sellers=dense(matrix["sellers"]),
+        avg_price=dense(matrix["avg_price"]),
+        present=dense(np.ones(len(matrix))),
+        **arrays,
+    )
+
+
+def _normalize_rows(values: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """행별로 mask 칸만의 최소-최대 정규화 (0~100). 최소 = 최대면 50."""
+    lo = np.where(mask, values, np.inf).min(axis=1, keepdims=True)
+    hi = np.where(mask, values, -np.inf).max(axis=1, keepdims=True)
+    span = hi - lo
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scaled = (values - lo) / span * 100
+    return np.where(span == 0, 50.0, scaled)
+
+
+def growth_reason(ratio: float, orders_per_seller: float, market_revenue: float) -> str:
+    """추천 이유 문구."""
+    reasons = []
+    if ratio >= 100:
+        reasons.append(f"고객/셀러 비율 {ratio:.0f}:1 (공급 부족)")
+    if orders_per_seller >= 30:
+        reasons.append(f"셀러당 주문 {orders_per_seller:.0f}건 (높은 수요)")
+    if market_revenue >= 50000:
+        reasons.append(f"시장 규모 R${market_revenue:,.0f}")
+    if not reasons:
+        reasons.append("성장 잠재력 있음")
+    return " / ".join(reasons)
+
+
+def score_growth_regions(
+    grid: MarketGrid,
+    selection: np.ndarray,
+    own_states,
+    top_n: int = TOP_REGIONS,
+) -> pd.DataFrame:
+    """선택 행렬의 행(셀러)별 상위 top_n 진출 지역 (긴 형식, row / rank + GROWTH_COLUMNS).
+
+    own_states: 행별 셀러 소재 주 (추천에서 제외).
+    """
+    present = selection @ grid.present
+    market = present > 0
+    revenue = selection @ grid.revenue
+    orders = selection @ grid.orders
+    competitors = selection @ grid.sellers
+    with np.errstate(invalid="ignore", divide="ignore"):
+        avg_price = (selection @ grid.avg_price) / present
+        orders_per_seller = np.where(competitors > 0, orders / competitors, orders)
+
+    ratio = np.broadcast_to(np.nan_to_num(grid.ratio, nan=0.0), market.shape)
+    score = (
+        _normalize_rows(ratio, market) * SCORE_WEIGHTS["ratio"]
+        + _normalize_rows(revenue, market) * SCORE_WEIGHTS["market_revenue"]
+        + _normalize_rows(orders_per_seller, market) * SCORE_WEIGHTS["orders_per_seller"]
+    ).round(1)
+
+    own = grid.states.get_indexer(pd.Index(list(own_states), dtype=object))
+    eligible = market.copy()
+    rows_with_own = np.flatnonzero(own >= 0)
+    eligible[rows_with_own, own[rows_with_own]] = False
+
+    ranked = np.argsort(np.where(eligible, -score, np.inf), axis=1, kind="stable")[:, :top_n]
+    taken = np.take_along_axis(eligible, ranked, axis=1)
+    row, rank = np.nonzero(taken)
+    col = ranked[row, rank]
+
+    out = pd.DataFrame({
+        "row": row,
+        "rank": rank,
+        "state": grid.states.to_numpy()[col],
+        "opportunity_score": score[row, col],
+        "opportunity_grade": grid.grade[col],
+        "market_revenue": revenue[row, col],
+        "market_orders": orders[row, col].astype(np.int64),
+        "competitors": competitors[row, col].astype(np.int64),
+        "orders_per_seller": orders_per_seller[row, col],
+        "avg_price": avg_price[row, col],
+        "customers": grid.customers[col],
+    })
+    out["reason"] = [
+        growth_reason(r, o, m)
+        for r, o, m in zip(grid.ratio[col], out["orders_per_seller"], out["market_revenue"])
+    ]
+    return out
+
+
+def _seller_top_categories() -> tuple[np.ndarray, list[list[str]]]:
+    """셀러 코드와 셀러별 매출 상위 카테고리 목록 (셀러 페이지 category_revenue와 같은 기준)."""
+    incidence = category_incidence()
+    revenue = incidence.revenue.toarray()
+    order = np.argsort(-revenue, axis=1, kind="stable")[:, :SELLER_TOP_CATEGORIES]
+    sold = np.take_along_axis(revenue, order, axis=1) > 0
+    names = incidence.categories.to_numpy()
+    return incidence.seller_codes, [list(names[o[s]]) for o, s in zip(order, sold)]
+
+
+@st.cache_resource
+def compute_all_growth_regions() -> pd.DataFrame:
+    """모든 셀러의 성장 가능 지역 Top 5 ((seller_id 코드, 순위) 인덱스, 읽기 전용 공유)."""
+    grid = market_grid()
+    seller_codes, categories = _seller_top_categories()
+    seller_state = (
+        load_sellers().drop_duplicates("seller_id").set_index("seller_id")["seller_state"]
+        .reindex(seller_codes).astype(object).to_numpy()
+    )
+    table = score_growth_regions(grid, grid.selection(categories), seller_state)
+    table.insert(0, "seller_id", seller_codes[table.pop("row").to_numpy()])
+    return freeze_frame(table.set_index(["seller_id", "rank"]))
@@ -0,0 +1,208 @@
+"""전체 셀러 물류 분석 일괄 계산 엔진.
+
+``compute_seller_logistics``의 셀러별 결과(현재 평균 거리·운임·배송일, 창고별 고객 평균
+거리와 셀러 기준 순위, 운영 창고 수별 시나리오, 권역별 효과)를 배송 완료 주문 품목 전체에
+대한 연산 한 번으로 계산해 컬럼형 테이블로 보관한다. 셀러 페이지는 이 테이블의 행을 읽고,
+지도용 고객 분포만 셀러 슬라이스에서 따로 집계한다.
+
+- 셀러 기준 창고 순위(고객→창고 평균 거리)에는 모든 (주문 품목, 창고) 쌍이 필요하므로
+  거리 행렬을 한 번 계산한다.
+- 병합 테이블이 seller_id 코드 순으로 정렬돼 있으므로 셀러별 합계는 ``np.add.reduceat``
+  한 번이다.
+- 시나리오 k는 같은 행렬에서 셀러별 창고 순위 상위 k개 열만 ``take_along_axis``로 모아
+  최소값을 취한다 (전체 창고는 행 최소값). 셀러마다 상위 k개 집합이 달라 집합별
+  ``SiteIndex``를 만드는 것보다 이미 있는 행렬을 읽는 편이 훨씬 싸다.
+
+``warehouse_benefit_ranking``은 이 테이블로 "창고 활용 효과가 가장 큰 셀러" 순위를 만든다
+(``export_warehouse_benefit.py``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.config import REGION_MAP, WAREHOUSE_SCENARIO_SIZES
+from claude_eda.dashboard.data.distance_model import (
+    MODEL_INPUT_COLUMNS,
+    distance_model,
+    group_codes,
+)
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.geo import distance_matrix, lookup_zip_coords
+from claude_eda.dashboard.data.loader import (
+    build_merged_table,
+    load_sellers,
+    load_warehouse_recommendations,
+    zip_coordinate_table,
+)
+
+ROW_COLUMNS = [
+    "seller_id", "order_id", "customer_lat", "customer_lng", "distance_km",
+    "freight_value", "delivery_days", "is_late", *MODEL_INPUT_COLUMNS,
+]
+
+
+def warehouse_scenario_sizes(n_sites: int) -> list[int]:
+    """시나리오별 운영 창고 수 — ``WAREHOUSE_SCENARIO_SIZES`` 중 n_sites 미만 + 전체."""
+    return sorted({k for k in WAREHOUSE_SCENARIO_SIZES if 0 < k < n_sites} | {n_sites})
+
+
+@dataclass(frozen=True)
+class SellerLogisticsTables:
+    """전체 셀러 물류 분석 결과 (읽기 전용 공유).
+
+    sellers: seller_id 코드 인덱스. 현재 평균, 거리 모델 기울기·대체 계수 사용 비율(%), 시나리오별
+        ``wh{k}_km`` / ``wh{k}_freight`` / ``wh{k}_days``, 최적 창고, 전체 창고 운영 시 절감.
+    seller_warehouse: (seller_id 코드, 순위) 인덱스. warehouse_id, 셀러→창고·고객→창고 거리.
+    region_effect: seller_id 코드 인덱스, 셀러별 권역 행 (주문 수 내림차순).
+    """
+
+    sellers: pd.DataFrame
+    seller_warehouse: pd.DataFrame
+    region_effect: pd.DataFrame
+    scenario_sizes: tuple[int, ...]
+
+
+def _delivered_rows() -> pd.DataFrame:
+    """거리를 아는 배송 완료 주문 품목 (셀러 코드 순 정렬 유지)."""
+    merged = build_merged_table()
+    mask = (
+        merged["order_status"].eq("delivered")
+        & merged["distance_km"].notna()
+        & merged["seller_id"].ge(0)
+    )
+    return merged.loc[mask, ROW_COLUMNS]
+
+
+def _seller_sums(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """셀러 코드 순으로 정렬된 행 값 → 셀러별 합계 (행 축, 2차원이면 열별)."""
+    return np.add.reduceat(values, starts, axis=0)
+
+
+def _seller_mean(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """NaN을 제외한 셀러별 평균 (값이 없으면 0)."""
+    valid = ~np.isnan(values)
+    total = _seller_sums(np.where(valid, values, 0.0), starts)
+    count = _seller_sums(valid.astype(np.float64), starts)
+    return np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+
+
+def _seller_coords(seller_codes: np.ndarray) -> np.ndarray:
+    sellers = load_sellers().drop_duplicates("seller_id").set_index("seller_id")
+    zips = sellers["seller_zip_code_prefix"].reindex(seller_codes).to_numpy(dtype=np.float64)
+    return lookup_zip_coords(zip_coordinate_table(), zips)
+
+
+def _region_effect(rows: pd.DataFrame, all_wh_km: np.ndarray) -> pd.DataFrame:
+    frame = pd.DataFrame({
+        "seller_id": rows["seller_id"].to_numpy(),
+        "region": rows["customer_state"].astype(object).map(REGION_MAP).fillna("Unknown"),
+        "distance_km": rows["distance_km"].to_numpy(dtype=np.float64),
+        "dist_wh_all": all_wh_km.astype(np.float64),
+        "order_id": rows["order_id"].to_numpy(),
+    })
+    frame["dist_reduction"] = frame["distance_km"] - frame["dist_wh_all"]
+    effect = frame.groupby(["seller_id", "region"]).agg(
+        current_avg=("distance_km", "mean"),
+        wh_all_avg=("dist_wh_all", "mean"),
+        reduction=("dist_reduction", "mean"),
+        orders=("order_id", "nunique"),
+    ).reset_index()
+    effect["reduction_pct"] = (effect["reduction"] / effect["current_avg"] * 100).round(1)
+    effect = effect.sort_values(["seller_id", "orders"], ascending=[True, False], kind="stable")
+    return effect.set_index("seller_id")
+
+
+@st.cache_resource
+def compute_all_seller_logistics() -> SellerLogisticsTables:
+    """배송 완료 주문이 있는 모든 셀러의 물류 분석 테이블."""
+    rows = _delivered_rows()
+    wh = load_warehouse_recommendations()
+    model = distance_model()
+
+    codes = rows["seller_id"].to_numpy()
+    seller_codes, starts, inverse = np.unique(codes, return_index=True, return_inverse=True)
+    n_rows = np.diff(np.append(starts, len(codes)))
+
+    km = rows["distance_km"].to_numpy(dtype=np.float64)
+    model_codes = group_codes(rows, model.group_by)
+    table = pd.DataFrame(index=pd.Index(seller_codes, name="seller_id"))
+    table["n_rows"] = n_rows
+    table["avg_distance"] = _seller_sums(km, starts) / n_rows
+    table["avg_freight"] = _seller_mean(rows["freight_value"].to_numpy(dtype=np.float64), starts)
+    table["avg_delivery_days"] = _seller_mean(rows["delivery_days"].to_numpy(dtype=np.float64), starts)
+    table["late_pct"] = _seller_sums(rows["is_late"].to_numpy(dtype=np.float64), starts) / n_rows
+    table["freight_per_km"] = _seller_sums(model.freight_coef[model_codes, 0], starts) / n_rows
+    table["days_per_km"] = _seller_sums(model.days_coef[model_codes, 0], starts) / n_rows
+    table["model_fallback_pct"] = (
+        _seller_sums(model.fallback(model_codes).astype(np.float64), starts) / n_rows * 100
+    )
+
+    # (품목 × 창고) 거리 1회 → 셀러별 창고 평균 거리와 셀러 기준 창고 순위
+    cust_lat = rows["customer_lat"].to_numpy()
+    cust_lng = rows["customer_lng"].to_numpy()
+    wh_lat = wh["lat"].to_numpy()
+    wh_lng = wh["lng"].to_numpy()
+    dist = distance_matrix(cust_lat, cust_lng, wh_lat, wh_lng)
+    wh_mean = _seller_sums(dist.astype(np.float64), starts) / n_rows[:, None]
+    rank = np.argsort(wh_mean, axis=1, kind="stable")  # 셀러 × 순위 → 창고 열 번호
+
+    sizes = warehouse_scenario_sizes(len(wh))
+    scenario_km = {}
+    for k in sizes:
+        if k == len(wh):
+            scenario_km[k] = dist.min(axis=1)
+        else:
+            scenario_km[k] = np.take_along_axis(dist, rank[inverse, :k], axis=1).min(axis=1)
+        km_k = scenario_km[k].astype(np.float64)
+        table[f"wh{k}_km"] = _seller_sums(km_k, starts) / n_rows
+        table[f"wh{k}_freight"] = _seller_sums(model.freight(km_k, model_codes), starts) / n_rows
+        table[f"wh{k}_days"] = _seller_sums(model.days(km_k, model_codes), starts) / n_rows
+
+    best = rank[:, 0]
+    seller_xy = _seller_coords(seller_codes)
+    seller_wh = distance_matrix(seller_xy[:, 0], seller_xy[:, 1], wh_lat, wh_lng)
+    rows_idx = np.arange(len(seller_codes))
+    table["seller_lat"] = seller_xy[:, 0]
+    table["seller_lng"] = seller_xy[:, 1]
+    table["best_warehouse_id"] = wh["warehouse_id"].to_numpy()[best]
+    table["best_customer_to_wh_km"] = wh_mean[rows_idx, best]
+    table["best_reduction_km"] = table["avg_distance"] - table["best_customer_to_wh_km"]
+    table["best_reduction_pct"] = (table["best_reduction_km"] / table["avg_distance"] * 100).round(1)
+    table["all_wh_reduction_km"] = table["avg_distance"] - table[f"wh{len(wh)}_km"]
+    table["all_wh_reduction_pct"] = (
+        table["all_wh_reduction_km"] / table["avg_distance"] * 100
+    ).round(1)
+    table["total_km_saved"] = table["all_wh_reduction_km"] * table["n_rows"]
+    float_cols = table.select_dtypes("float64").columns
+    table[float_cols] = table[float_cols].astype("float32")
+
+    seller_warehouse = pd.DataFrame({
+        "seller_id": np.repeat(seller_codes, len(wh)),
+        "rank": np.tile(np.arange(len(wh)), len(seller_codes)),
+        "warehouse_id": wh["warehouse_id"].to_numpy()[rank].ravel(),
+        "seller_to_wh_km": np.take_along_axis(seller_wh, rank, axis=1).ravel(),
+        "customer_to_wh_km": np.take_along_axis(wh_mean, rank, axis=1).ravel().astype(np.float32),
+    }).set_index(["seller_id", "rank"])
+
+    return SellerLogisticsTables(
+        sellers=freeze_frame(table),
+        seller_warehouse=freeze_frame(seller_warehouse),
+        region_effect=freeze_frame(_region_effect(rows, scenario_km[len(wh)])),
+        scenario_sizes=tuple(sizes),
+    )
+
+
+def warehouse_benefit_ranking(top_n: int | None = None) -> pd.DataFrame:
+    """창고 활용 시 거리 절감 총량(평균 절감 km × 주문 품목 수) 내림차순 셀러 순위."""
+    sellers = compute_all_seller_logistics().sellers
+    cols = [
+        "n_rows", "avg_distance", "best_warehouse_id", "best_reduction_pct",
+        "all_wh_reduction_km", "all_wh_reduction_pct", "total_km_saved",
+    ]
+    ranking = sellers[cols].sort_values("total_km_saved", ascending=False)
+    return ranking if top_n is None else ranking.head(top_n)
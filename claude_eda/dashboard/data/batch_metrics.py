@@ -0,0 +1,152 @@
+"""전체 셀러 메트릭 일괄 계산 엔진.
+
+``SellerMetrics``의 스칼라 지표(프로필, KPI, 취소율, 재구매율, 결제 패턴)를 셀러 한 명씩이
+아니라 병합 테이블 전체에 대한 그룹 연산 한 번으로 계산해 컬럼형 테이블로 반환한다.
+단일 셀러 경로(``compute_seller_metrics``)는 이 테이블의 한 행을 읽고, 월별 추이·분포 같은
+비스칼라 항목만 셀러 슬라이스에서 따로 계산한다.
+
+카테고리 내 순위도 카테고리×셀러 집계 큐브에 순위를 미리 계산해 두고 조회한다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.loader import (
+    build_merged_table,
+    load_payments,
+    load_seller_clusters,
+    load_seller_names,
+    load_sellers,
+)
+
+CANCEL_STATUSES = ["canceled", "unavailable"]
+
+
+def _ratio(num: pd.Series, den: pd.Series) -> pd.Series:
+    """num / den, 분모가 0이거나 없으면 0."""
+    return (num / den.where(den > 0)).fillna(0.0)
+
+
+def _kpi_table(merged: pd.DataFrame) -> pd.DataFrame:
+    """매출·주문·고객·리뷰·배송 등 기본 KPI."""
+    frame = merged.assign(
+        is_low_review=merged["review_score"].le(2),
+        is_delivered=merged["order_status"].eq("delivered"),
+    )
+    table = frame.groupby("seller_id").agg(
+        first_order=("order_purchase_timestamp", "min"),
+        last_order=("order_purchase_timestamp", "max"),
+        total_revenue=("price", "sum"),
+        total_orders=("order_id", "nunique"),
+        unique_customers=("customer_unique_id", "nunique"),
+        total_items=("price", "size"),
+        product_variety=("product_id", "nunique"),
+        avg_price=("price", "mean"),
+        avg_review=("review_score", "mean"),
+        review_count=("review_score", "count"),
+        low_review_count=("is_low_review", "sum"),
+        avg_photos=("product_photos_qty", "mean"),
+    )
+
+    delivered = frame[frame["is_delivered"]].groupby("seller_id").agg(
+        avg_delivery_days=("delivery_days", "mean"),
+        late_delivery_pct=("is_late", "mean"),
+    )
+    table = table.join(delivered)
+
+    span_days = (table["last_order"] - table["first_order"]).dt.days
+    table["active_months"] = np.maximum(1, span_days // 30).fillna(0).astype(int)
+    table["avg_order_value"] = _ratio(table["total_revenue"], table["total_orders"])
+    table["items_per_order"] = _ratio(table["total_items"], table["total_orders"])
+    table["low_review_pct"] = _ratio(table["low_review_count"], table["review_count"])
+    for col in ["avg_review", "avg_photos", "avg_delivery_days", "late_delivery_pct"]:
+        table[col] = table[col].astype("float64").fillna(0.0)
+    return table.drop(columns=["review_count", "low_review_count"])
+
+
+def _order_table(merged: pd.DataFrame) -> pd.DataFrame:
+    """주문 단위 지표 — 취소율, 재구매 고객 비율."""
+    seller_orders = merged[["seller_id", "order_id", "order_status"]].drop_duplicates(
+        ["seller_id", "order_id"]
+    )
+    is_cancel = seller_orders["order_status"].isin(CANCEL_STATUSES)
+    order_counts = seller_orders.groupby("seller_id").size()
+    table = pd.DataFrame({"cancel_count": is_cancel.groupby(seller_orders["seller_id"]).sum()})
+    table["cancel_rate"] = _ratio(table["cancel_count"], order_counts)
+
+    cust_orders = merged.groupby(["seller_id", "customer_unique_id"])["order_id"].nunique()
+    repeats = (cust_orders > 1).groupby(level="seller_id").sum()
+    table["repeat_customer_count"] = repeats
+    table["repeat_customer_rate"] = _ratio(repeats, cust_orders.groupby(level="seller_id").size())
+    return table
+
+
+def _payment_table(merged: pd.DataFrame) -> pd.DataFrame:
+    """결제 패턴 — 신용카드 비율, 평균 할부 (셀러 주문에 속한 결제 건 기준)."""
+    seller_orders = merged[["seller_id", "order_id"]].drop_duplicates()
+    pays = seller_orders.merge(
+        load_payments()[["order_id", "payment_type", "payment_installments"]],
+        on="order_id",
+    )
+    is_credit = pays["payment_type"] == "credit_card"
+    total = pays.groupby("seller_id").size()
+    credit = is_credit.groupby(pays["seller_id"]).sum()
+    return pd.DataFrame({
+        "avg_installments": pays[is_credit].groupby("seller_id")["payment_installments"].mean(),
+        "credit_card_pct": _ratio(credit, total),
+    })
+
+
+def _profile_table() -> pd.DataFrame:
+    """회사명·주·도시·클러스터."""
+    sellers = load_sellers().drop_duplicates("seller_id").set_index("seller_id")
+    names = load_seller_names().drop_duplicates("seller_id").set_index("seller_id")
+    clusters = load_seller_clusters().drop_duplicates("seller_id").set_index("seller_id")
+    profile = sellers[["seller_state", "seller_city"]].join(names["company_name_en"])
+    profile = profile.join(clusters["cluster"])
+    return profile.rename(columns={"company_name_en": "company_name"})
+
+
+@st.cache_resource
+def compute_all_seller_metrics() -> pd.DataFrame:
+    """전체 셀러의 스칼라 메트릭 테이블 (seller_id 코드 인덱스, 읽기 전용 공유).
+
+    주문이 있는 셀러만 행을 가진다. 결측 지표는 ``SellerMetrics`` 기본값과 같은 0으로 채운다.
+    """
+    merged = build_merged_table()
+    table = _kpi_table(merged).join(_order_table(merged)).join(_payment_table(merged))
+    table[["avg_installments", "credit_card_pct"]] = (
+        table[["avg_installments", "credit_card_pct"]].fillna(0.0)
+    )
+    table = table.join(_profile_table())
+    table["cluster"] = table["cluster"].fillna(-1).astype(int)
+    return freeze_frame(table)
+
+
+@st.cache_resource
+def compute_category_seller_cube() -> pd.DataFrame:
+    """카테고리×셀러 집계 + 카테고리 내 순위 (인덱스: seller_id 코드, 카테고리).
+
+    순위는 "나보다 크거나 같은 셀러 수" (``rank(method="max")``) — 동점이면 같은 순위 중
+    가장 낮은 순위를 받는다. 평균 리뷰가 없는 셀러의 리뷰 순위는 0이다.
+    """
+    merged = build_merged_table()
+    cube = merged.groupby(
+        ["product_category_name_english", "seller_id"], observed=True
+    ).agg(
+        revenue=("price", "sum"),
+        orders=("order_id", "nunique"),
+        avg_review=("review_score", "mean"),
+    )
+    by_cat = cube.groupby(level="product_category_name_english", observed=True)
+    cube["total_sellers"] = by_cat["revenue"].transform("size")
+    cube["revenue_rank"] = by_cat["revenue"].rank(method="max", ascending=False).astype(int)
+    cube["review_rank"] = (
+        by_cat["avg_review"].rank(method="max", ascending=False).fillna(0).astype(int)
+    )
+    cube = cube.swaplevel().sort_index()
+    return freeze_frame(cube)
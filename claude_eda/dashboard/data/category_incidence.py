@@ -0,0 +1,139 @@
+"""셀러 × 카테고리 희소 행렬 — 크로스셀 추천과 카테고리 간 리프트.
+
+병합 테이블 전체(주문 상태 무관)에서 셀러가 판매한 카테고리를 ``scipy.sparse`` CSR
+행렬로 한 번 만든다. 같은 모양의 행렬에 매출·품목 수·고유 주문 수도 함께 둔다.
+
+- 카테고리 집합 K를 파는 셀러 = K 열 합이 0보다 큰 행 → 셀러 선택 벡터 s.
+- 그 셀러들의 카테고리별 채택 셀러 수·매출·주문 = ``s @ 행렬`` 한 번.
+- 카테고리 간 동시 채택 수 = ``AᵀA`` (A: 0/1 채택 행렬), 리프트 =
+  P(i ∧ j) / (P(i)·P(j)).
+
+고유 주문 수는 셀러별 값을 더하면 한 주문에 같은 카테고리를 판 셀러가 여럿일 때 중복된다.
+그런 (주문, 카테고리)만 따로 셀러 목록을 두고, 선택된 셀러가 k명이면 k - 1을 뺀다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy import sparse
+
+from claude_eda.dashboard.data.loader import build_merged_table
+
+
+@dataclass(frozen=True)
+class CategoryIncidence:
+    """셀러 × 카테고리 희소 행렬 묶음 (읽기 전용 공유).
+
+    adoption / revenue / items / orders: (셀러 수, 카테고리 수) CSR. adoption은 0/1.
+    shared_sellers: (공유 주문 수, 셀러 수) CSR — 2명 이상이 판 (주문, 카테고리)별 셀러.
+    shared_category: 공유 주문 행별 카테고리 번호.
+    co_adoption: (카테고리 수, 카테고리 수) CSR — 두 카테고리를 모두 파는 셀러 수.
+    """
+
+    categories: pd.Index
+    seller_codes: np.ndarray
+    adoption: sparse.csr_matrix
+    revenue: sparse.csr_matrix
+    items: sparse.csr_matrix
+    orders: sparse.csr_matrix
+    shared_sellers: sparse.csr_matrix
+    shared_category: np.ndarray
+    co_adoption: sparse.csr_matrix
+
+    def category_positions(self, categories) -> np.ndarray:
+        """카테고리 이름 → 열 번호 (없는 이름은 제외)."""
+        pos = self.categories.get_indexer(pd.Index(list(categories), dtype=object))
+        return np.unique(pos[pos >= 0])
+
+    def sellers_in(self, positions: np.ndarray) -> np.ndarray:
+        """열 번호 집합 중 하나라도 판매한 셀러 선택 벡터 (0/1 float)."""
+        indicator = np.zeros(len(self.categories))
+        indicator[positions] = 1.0
+        return (self.adoption @ indicator > 0).astype(np.float64)
+
+    def totals(self, selected: np.ndarray) -> dict[str, np.ndarray]:
+        """선택된 셀러들의 카테고리별 채택 셀러 수·매출·품목 수·고유 주문 수 (카테고리 순 배열)."""
+        shared = self.shared_sellers @ selected
+        overlap = np.bincount(
+            self.shared_category,
+            weights=np.maximum(shared - 1, 0),
+            minlength=len(self.categories),
+        )
+        return {
+            "sellers": (self.adoption.T @ selected).astype(np.int64),
+            "revenue": self.revenue.T @ selected,
+            "items": (self.items.T @ selected).astype(np.int64),
+            "orders": (self.orders.T @ selected - overlap).astype(np.int64),
+        }
+
+    def sellers_per_category(self) -> np.ndarray:
+        return self.co_adoption.diagonal()
+
+    def lift(self, min_sellers: int = 1) -> pd.DataFrame:
+        """카테고리 쌍별 동시 채택 셀러 수, 신뢰도 P(j | i), 리프트 (i ≠ j, 양방향)."""
+        co = self.co_adoption.tocoo()
+        keep = (co.row != co.col) & (co.data >= min_sellers)
+        i, j, both = co.row[keep], co.col[keep], co.data[keep]
+        n = self.sellers_per_category()
+        return pd.DataFrame({
+            "category": self.categories[i],
+            "other": self.categories[j],
+            "sellers_both": both.astype(np.int64),
+            "confidence": both / n[i],
+            "lift": both * len(self.seller_codes) / (n[i] * n[j]),
+        })
+
+
+def _csr(rows, cols, values, shape) -> sparse.csr_matrix:
+    """(행, 열, 값) → 중복 합산 CSR."""
+    return sparse.csr_matrix((np.asarray(values, dtype=np.float64), (rows, cols)), shape=shape)
+
+
+@st.cache_resource
+def category_incidence() -> CategoryIncidence:
+    """병합 테이블 전체의 셀러 × 카테고리 희소 행렬."""
+    merged = build_merged_table()
+    rows = merged.loc[
+        merged["seller_id"].ge(0) & merged["product_category_name_english"].notna(),
+        ["seller_id", "product_category_name_english", "order_id", "price"],
+    ]
+    category = rows["product_category_name_english"].cat.remove_unused_categories()
+    categories = pd.Index(category.cat.categories.astype(object))
+    col = category.cat.codes.to_numpy(dtype=np.int64)
+    seller_codes, row = np.unique(rows["seller_id"].to_numpy(), return_inverse=True)
+    shape = (len(seller_codes), len(categories))
+
+    revenue = _csr(row, col, rows["price"].to_numpy(), shape)
+    items = _csr(row, col, np.ones(len(rows)), shape)
+    adoption = items.copy()
+    adoption.data[:] = 1.0
+
+    # (셀러, 카테고리, 주문) 고유 조합 → 셀러별 주문 수, 2명 이상이 나눈 (주문, 카테고리)
+    triples = np.unique(np.column_stack([row, col, rows["order_id"].to_numpy()]), axis=0)
+    orders = _csr(triples[:, 0], triples[:, 1], np.ones(len(triples)), shape)
+    order_category = triples[:, 2] * len(categories) + triples[:, 1]
+    shared = pd.Series(order_category).duplicated(keep=False).to_numpy()
+    pair_keys, pair_id = np.unique(order_category[shared], return_inverse=True)
+    shared_sellers = _csr(pair_id, triples[shared, 0], np.ones(shared.sum()), (len(pair_keys), shape[0]))
+    shared_category = pair_keys % len(categories)
+
+    co_adoption = (adoption.T @ adoption).tocsr()
+    for matrix in (adoption, revenue, items, orders, shared_sellers, co_adoption):
+        for arr in (matrix.data, matrix.indices, matrix.indptr):
+            arr.flags.writeable = False
+    seller_codes.flags.writeable = False
+    return CategoryIncidence(
+        categories=categories,
+        seller_codes=seller_codes,
+        adoption=adoption,
+        revenue=revenue,
+        items=items,
+        orders=orders,
+        shared_sellers=shared_sellers,
+        shared_category=shared_category,
+        co_adoption=co_adoption,
+    )
@@ -0,0 +1,120 @@
+"""원본 CSV의 컬럼형(Parquet) 디스크 캐시.
+
+CSV를 처음 읽을 때 파싱 결과를 Parquet으로 저장해 두고, 이후 콜드 스타트에서는
+Parquet을 읽는다. 캐시 키는 원본 경로 + 파일 크기 + 수정 시각(mtime) + 읽기 옵션이므로
+CSV가 바뀌면 자동으로 다시 생성된다. pyarrow가 없거나 캐시 디렉터리에 쓸 수 없으면
+조용히 CSV 경로로 동작한다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from claude_eda.dashboard.config import COLUMNAR_CACHE_DIR
+
+try:
+    import pyarrow  # noqa: F401
+
+    PARQUET_AVAILABLE = True
+except ImportError:  # pragma: no cover - streamlit이 pyarrow를 함께 설치한다
+    PARQUET_AVAILABLE = False
+
+# 캐시 파일 포맷이 바뀌면 올려서 기존 캐시를 무효화한다
+CACHE_FORMAT_VERSION = 2
+
+
+def source_fingerprint(path: Path) -> str:
+    """원본 파일 식별자 (경로 + 크기 + mtime)."""
+    stat = path.stat()
+    return f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _digest(payload) -> str:
+    key = json.dumps(payload, sort_keys=True, default=repr)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+
+
+def _cache_file(path: Path, options: dict) -> Path:
+    """``{stem}.{옵션 해시}.{원본 해시}.parquet`` — 같은 CSV를 다른 옵션으로 읽어도
+    (예: ID 컬럼만 읽는 usecols) 서로의 캐시를 지우지 않는다."""
+    option_digest = _digest({"options": options, "version": CACHE_FORMAT_VERSION})
+    source_digest = _digest(source_fingerprint(path))
+    return COLUMNAR_CACHE_DIR / f"{path.stem}.{option_digest}.{source_digest}.parquet"
+
+
+def _parse_csv(
+    path: Path,
+    parse_dates: list[str] | None,
+    date_format: str | None,
+    read_kwargs: dict,
+) -> pd.DataFrame:
+    df = pd.read_csv(path, **read_kwargs)
+    for col in parse_dates or []:
+        df[col] = pd.to_datetime(df[col], format=date_format, errors="coerce")
+    return df
+
+
+def _write_cache(df: pd.DataFrame, cache_file: Path) -> None:
+    """임시 파일에 쓴 뒤 교체하고, 같은 원본·옵션의 이전 버전 캐시는 삭제한다."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp)
+        os.replace(tmp, cache_file)
+        stem, option_digest, _, _ = cache_file.name.rsplit(".", 3)
+        for stale in cache_file.parent.glob(f"{stem}.{option_digest}.*.parquet"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # 읽기 전용 배포 환경 등 — 캐시 없이 계속 진행
+        pass
+
+
+def read_csv_cached(
+    path: Path,
+    *,
+    parse_dates: list[str] | None = None,
+    date_format: str | None = None,
+    use_cache: bool = True,
+    **read_kwargs,
+) -> pd.DataFrame:
+    """CSV를 읽되, 유효한 Parquet 캐시가 있으면 그것을 반환한다.
+
+    Args:
+        path: 원본 CSV 경로
+        parse_dates: ``pd.to_datetime(errors="coerce")``로 변환할 컬럼
+        date_format: parse_dates 컬럼의 고정 포맷 (None이면 pandas가 추론)
+        use_cache: False면 항상 CSV를 파싱 (벤치마크 비교용)
+        **read_kwargs: ``pd.read_csv``에 그대로 전달되는 옵션
+    """
+    if not (use_cache and PARQUET_AVAILABLE):
+        return _parse_csv(path, parse_dates, date_format, read_kwargs)
+
+    options = {"parse_dates": parse_dates, "date_format": date_format, **read_kwargs}
+    cache_file = _cache_file(path, options)
+    if cache_file.exists():
+        try:
+            return pd.read_parquet(cache_file)
+        except Exception:
+            # 손상된 캐시 — 아래에서 다시 생성
+            cache_file.unlink(missing_ok=True)
+
+    df = _parse_csv(path, parse_dates, date_format, read_kwargs)
+    _write_cache(df, cache_file)
+    return df
+
+
+def clear_columnar_cache() -> int:
+    """캐시 디렉터리의 Parquet 파일을 모두 삭제하고 삭제 건수를 반환한다."""
+    if not COLUMNAR_CACHE_DIR.exists():
+        return 0
+    removed = 0
+    for f in COLUMNAR_CACHE_DIR.glob("*.parquet"):
+        f.unlink(missing_ok=True)
+        removed += 1
+    return removed
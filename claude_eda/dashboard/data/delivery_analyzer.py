@@ -2,22 +2,57 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+
 import numpy as np
 import pandas as pd
 import streamlit as st
 
 from claude_eda.dashboard.config import RAINY_MONTHS, REGION_MAP
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.grouped_stats import array_stats
 from claude_eda.dashboard.data.loader import (
     load_customers,
     load_order_items,
     load_orders,
     load_reviews,
+    seller_codec,
 )
+from claude_eda.dashboard.data.memo import bounded_memo
+from claude_eda.dashboard.data.seller_partition import SellerPartition, sort_by_seller
+
+# RAINY_MONTHS에 없는 권역("Other")의 우기
+DEFAULT_RAINY_MONTHS = {10, 11, 12, 1, 2, 3}
+SEASON_LABELS = np.array(["건기", "우기"], dtype=object)
+
+
+def _rainy_table() -> tuple[pd.Index, np.ndarray]:
+    """권역×월(1~12) 우기 여부 테이블.
+
+    행 순서는 RAINY_MONTHS 권역 순이고, 마지막 행은 기본 우기 — 권역 코드 -1(미등록)이
+    그대로 마지막 행을 가리킨다.
+    """
+    regions = pd.Index(list(RAINY_MONTHS))
+    table = np.zeros((len(regions) + 1, 13), dtype=bool)
+    for i, months in enumerate([*RAINY_MONTHS.values(), DEFAULT_RAINY_MONTHS]):
+        table[i, sorted(months)] = True
+    return regions, table
 
 
-@st.cache_data
+def assign_season(region: pd.Series, month: pd.Series) -> np.ndarray:
+    """고객 권역 + 주문 월(1~12) → "우기"/"건기" (권역×월 테이블 인덱싱).
+
+    월이 결측이면 0열(항상 건기)을 가리킨다.
+    """
+    regions, table = _rainy_table()
+    region_codes = regions.get_indexer(region)
+    months = month.fillna(0).to_numpy(dtype=np.intp)
+    return SEASON_LABELS[table[region_codes, months].astype(np.intp)]
+
+
+@st.cache_resource
 def _build_delivery_base() -> pd.DataFrame:
-    """전체 배송 분석용 기본 테이블을 구축한다 (캐싱)."""
+    """전체 배송 분석용 기본 테이블을 구축한다 (읽기 전용 공유 캐싱)."""
     orders = load_orders()
     items = load_order_items()
     reviews = load_reviews()
@@ -79,26 +114,63 @@ def _build_delivery_base() -> pd.DataFrame:
     df["customer_region"] = df["customer_state"].map(REGION_MAP).fillna("Other")
 
     # 계절 할당 (고객 소재 기준)
-    def _season(row):
-        region = row["customer_region"]
-        month = row["order_month"]
-        rainy = RAINY_MONTHS.get(region, {10, 11, 12, 1, 2, 3})
-        return "우기" if month in rainy else "건기"
-
-    df["season"] = df.apply(_season, axis=1)
+    df["season"] = assign_season(df["customer_region"], df["order_month"])
 
     # 리뷰 병합
     review_scores = reviews.groupby("order_id")["review_score"].mean().reset_index()
     df = df.merge(review_scores, on="order_id", how="left")
 
-    return df
+    return freeze_frame(sort_by_seller(df))
+
+
+@st.cache_resource
+def _delivery_by_seller() -> SellerPartition:
+    """배송 기본 테이블의 셀러별 분할 인덱스."""
+    return SellerPartition.build(_build_delivery_base(), seller_codec())
+
+
+@dataclass(frozen=True)
+class PlatformDeliverySummary:
+    """전체 셀러 공통의 플랫폼 배송 비교 지표 (셀러와 무관하므로 한 번만 계산)."""
+
+    dispatch_delay_rate: float
+    delivery_delay_rate: float
+    avg_total_delivery: float
+    avg_dispatch_days: float
+    avg_transit_days: float
+    monthly: pd.DataFrame  # order_ym, delivery_delay_rate (읽기 전용)
+    season: dict  # 계절 → {delivery_delay_rate, avg_transit_days}
+    monthly_transit: dict  # 주문 월 → 평균 운송 소요일
+    total_delivery_dist: dict  # 총 배송 소요일 분포 (count/mean/std/min/max/p5~p95)
+
+
+@st.cache_resource
+def platform_delivery_summary() -> PlatformDeliverySummary:
+    """배송 기본 테이블 전체에 대한 플랫폼 평균 (프로세스 공유)."""
+    all_df = _build_delivery_base()
+    return PlatformDeliverySummary(
+        dispatch_delay_rate=all_df["is_dispatch_delayed"].mean(),
+        delivery_delay_rate=all_df["is_delivery_delayed"].mean(),
+        avg_total_delivery=all_df["total_delivery_days"].mean(),
+        avg_dispatch_days=all_df["dispatch_days"].mean(),
+        avg_transit_days=all_df["transit_days"].mean(),
+        monthly=freeze_frame(all_df.groupby("order_ym").agg(
+            delivery_delay_rate=("is_delivery_delayed", "mean"),
+        ).reset_index()),
+        season=all_df.groupby("season").agg(
+            delivery_delay_rate=("is_delivery_delayed", "mean"),
+            avg_transit_days=("transit_days", "mean"),
+        ).to_dict(orient="index"),
+        monthly_transit=all_df.groupby("order_month")["transit_days"].mean().to_dict(),
+        total_delivery_dist=array_stats(all_df["total_delivery_days"]),
+    )
 
 
+@bounded_memo
 def compute_seller_delivery(seller_id: str) -> dict:
-    """셀러의 배송 성과를 분석한다."""
-    base = _build_delivery_base()
-    seller_df = base[base["seller_id"] == seller_id].copy()
-    all_df = base.copy()
+    """셀러의 배송 성과를 분석한다. 플랫폼 비교 지표는 platform_delivery_summary()에서 읽는다."""
+    seller_df = _delivery_by_seller().rows(seller_id).copy()
+    platform = platform_delivery_summary()
 
     result: dict = {
         "has_data": len(seller_df) > 0,
@@ -118,11 +190,15 @@ def compute_seller_delivery(seller_id: str) -> dict:
     result["avg_transit_days"] = seller_df["transit_days"].mean()
 
     # 전체 평균 (비교용)
-    result["platform_dispatch_delay_rate"] = all_df["is_dispatch_delayed"].mean()
-    result["platform_delivery_delay_rate"] = all_df["is_delivery_delayed"].mean()
-    result["platform_avg_total_delivery"] = all_df["total_delivery_days"].mean()
-    result["platform_avg_dispatch_days"] = all_df["dispatch_days"].mean()
-    result["platform_avg_transit_days"] = all_df["transit_days"].mean()
+    result["platform_dispatch_delay_rate"] = platform.dispatch_delay_rate
+    result["platform_delivery_delay_rate"] = platform.delivery_delay_rate
+    result["platform_avg_total_delivery"] = platform.avg_total_delivery
+    result["platform_avg_dispatch_days"] = platform.avg_dispatch_days
+    result["platform_avg_transit_days"] = platform.avg_transit_days
+
+    # 총 배송 소요일 분포 (중앙값·P90 등)
+    result["total_delivery_dist"] = array_stats(seller_df["total_delivery_days"])
+    result["platform_total_delivery_dist"] = dict(platform.total_delivery_dist)
 
     # ── 2. 발송 지연 구간별 분포 ───────────────────────────
     bins = [-np.inf, 0, 3, 7, np.inf]
@@ -142,12 +218,8 @@ def compute_seller_delivery(seller_id: str) -> dict:
     ).reset_index()
     seller_monthly = seller_monthly[seller_monthly["order_count"] >= 1]
 
-    platform_monthly = all_df.groupby("order_ym").agg(
-        delivery_delay_rate=("is_delivery_delayed", "mean"),
-    ).reset_index()
-
     result["seller_monthly"] = seller_monthly
-    result["platform_monthly"] = platform_monthly
+    result["platform_monthly"] = platform.monthly
 
     # ── 4. 계절별 분석 ─────────────────────────────────────
     # 셀러 소재 권역 (고객 기반 최빈 권역)
@@ -167,20 +239,15 @@ def compute_seller_delivery(seller_id: str) -> dict:
     ).to_dict(orient="index")
     result["season_stats"] = season_stats
 
-    # 플랫폼 계절 평균
-    platform_season = all_df.groupby("season").agg(
-        delivery_delay_rate=("is_delivery_delayed", "mean"),
-        avg_transit_days=("transit_days", "mean"),
-    ).to_dict(orient="index")
-    result["platform_season"] = platform_season
+    # 플랫폼 계절 평균 (공유 객체이므로 복사본을 넘긴다)
+    result["platform_season"] = {k: dict(v) for k, v in platform.season.items()}
 
     # 셀러의 월별 운송 소요일
     seller_monthly_transit = seller_df.groupby("order_month")["transit_days"].mean()
     result["monthly_transit"] = seller_monthly_transit.to_dict()
 
     # 플랫폼 월별 운송 소요일
-    platform_monthly_transit = all_df.groupby("order_month")["transit_days"].mean()
-    result["platform_monthly_transit"] = platform_monthly_transit.to_dict()
+    result["platform_monthly_transit"] = dict(platform.monthly_transit)
 
     # ── 5. 발송 지연 → 리뷰 영향 ──────────────────────────
     if seller_df["review_score"].notna().sum() > 0:
@@ -195,10 +262,10 @@ def compute_seller_delivery(seller_id: str) -> dict:
     return result
 
 
+@bounded_memo
 def compute_regional_delivery_days(seller_id: str) -> dict[str, float]:
     """셀러의 배송 완료 주문에서 고객 state별 평균 배송 소요일을 집계한다."""
-    base = _build_delivery_base()
-    seller_df = base[base["seller_id"] == seller_id].copy()
+    seller_df = _delivery_by_seller().rows(seller_id).copy()
 
     if seller_df.empty:
         return {}
@@ -207,5 +274,5 @@ def compute_regional_delivery_days(seller_id: str) -> dict[str, float]:
     if valid.empty:
         return {}
 
-    by_state = valid.groupby("customer_state")["total_delivery_days"].mean()
+    by_state = valid.groupby("customer_state", observed=True)["total_delivery_days"].mean()
     return by_state.to_dict()
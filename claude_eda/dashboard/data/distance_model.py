@@ -0,0 +1,210 @@
+"""거리(km) → 운임·배송일 선형 모델 적합.
+
+배송 완료 주문 품목에서 ``freight_value ~ a·distance_km + b``,
+``delivery_days ~ c·distance_km + d``를 닫힌 형태의 최소자승으로 그룹별로 한 번에 적합한다
+(그룹별 합계 n, Σx, Σy, Σx², Σxy를 ``np.bincount``로 모은 뒤 계수를 벡터 연산으로 계산).
+
+그룹은 없음(전체), 고객 권역(``"region"``), 과금 중량 구간(``"weight_band"``) 중 하나다.
+계수 테이블의 마지막 행은 전체 적합값이며, 그룹 코드 -1(알 수 없음)과 행 수가
+``DISTANCE_MODEL_MIN_ROWS`` 미만인 그룹은 이 행을 쓴다. 거리가 늘수록 운임·배송일이 줄어드는
+기울기(0 이하)는 창고 시나리오 비교를 뒤집으므로, 그런 그룹은 전체 기울기를, 전체 적합도
+0 이하면 기본 기울기(``DISTANCE_MODEL_DEFAULT_FREIGHT`` / ``_DAYS``)를 쓰고 절편은 그룹 평균점을
+지나도록 맞춘다. 행별 출처(적합 / 전체 / 기본)는 ``freight_source`` / ``days_source``에 남는다. 적합 결과는 ``st.cache_resource``에
+두고, ``distance_model``은 먼저 ``memo.dataset_version``으로 원본 파일 변경을 확인한다.
+바뀌었으면 병합 테이블·일괄 물류 테이블과 함께 적합 결과 캐시도 비워지므로(
+``memo.invalidate_dataset_caches``) 새 데이터로 다시 적합한다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.config import (
+    DISTANCE_MODEL_DEFAULT_DAYS,
+    DISTANCE_MODEL_DEFAULT_FREIGHT,
+    DISTANCE_MODEL_GROUP_BY,
+    DISTANCE_MODEL_MIN_ROWS,
+    REGION_MAP,
+    VOLUMETRIC_DIVISOR,
+    WEIGHT_BAND_EDGES_G,
+    WEIGHT_BAND_LABELS,
+)
+from claude_eda.dashboard.data.loader import build_merged_table
+from claude_eda.dashboard.data.memo import dataset_version
+
+GROUPINGS = (None, "region", "weight_band")
+
+# 계수 행 출처 (freight_source / days_source 값 → 라벨)
+FITTED, POOLED, DEFAULT = 0, 1, 2
+SOURCE_LABELS = ("적합", "전체 계수", "기본 계수")
+REGIONS = sorted(set(REGION_MAP.values()))
+
+# group_codes()가 읽는 컬럼
+MODEL_INPUT_COLUMNS = [
+    "customer_state",
+    "product_weight_g",
+    "product_length_cm",
+    "product_height_cm",
+    "product_width_cm",
+]
+
+
+def _group_labels(group_by: str | None) -> list[str]:
+    if group_by is None:
+        return []
+    if group_by == "region":
+        return list(REGIONS)
+    if group_by == "weight_band":
+        return list(WEIGHT_BAND_LABELS)
+    raise ValueError(f"group_by는 {GROUPINGS} 중 하나여야 합니다: {group_by!r}")
+
+
+def region_codes(states) -> np.ndarray:
+    """주 코드 배열 → 권역 번호 (REGIONS 순, 미등록 주는 -1)."""
+    regions = pd.Series(np.asarray(states, dtype=object)).map(REGION_MAP)
+    return pd.Index(REGIONS).get_indexer(regions)
+
+
+def billable_weight_g(frame: pd.DataFrame) -> np.ndarray:
+    """과금 중량 (g) = max(실중량, 부피중량 = 가로×세로×높이 cm³ / VOLUMETRIC_DIVISOR)."""
+    volume = (
+        frame["product_length_cm"].to_numpy(dtype=np.float64)
+        * frame["product_height_cm"].to_numpy(dtype=np.float64)
+        * frame["product_width_cm"].to_numpy(dtype=np.float64)
+    )
+    return np.fmax(frame["product_weight_g"].to_numpy(dtype=np.float64), volume / VOLUMETRIC_DIVISOR)
+
+
+def group_codes(frame: pd.DataFrame, group_by: str | None) -> np.ndarray:
+    """행별 그룹 번호 (계수 테이블 행). 그룹을 알 수 없으면 -1 → 전체 계수."""
+    _group_labels(group_by)  # 검증
+    if group_by is None:
+        return np.full(len(frame), -1, dtype=np.intp)
+    if group_by == "region":
+        return region_codes(frame["customer_state"])
+    weight = billable_weight_g(frame)
+    codes = np.searchsorted(WEIGHT_BAND_EDGES_G, weight, side="right") - 1
+    codes[np.isnan(weight) | (codes >= len(WEIGHT_BAND_LABELS))] = -1
+    return codes.astype(np.intp)
+
+
+def _fit_grouped_ols(codes: np.ndarray, x: np.ndarray, y: np.ndarray, n_groups: int, default):
+    """그룹별 단순 선형회귀 → ((n_groups + 1, 2) [기울기, 절편], (n_groups + 1,) 행 수, 행별 출처).
+
+    마지막 행은 전체 적합. 행이 적거나 x 분산이 0인 그룹은 전체 행을 그대로 쓴다. 기울기가
+    0 이하인 행은 기울기만 바꾸고(그룹 → 전체 기울기, 전체 → default 기울기) 절편은 그 그룹의
+    평균점을 지나도록 다시 구한다. 데이터가 없으면 전체 행 = default (기울기, 절편).
+    """
+    valid = np.isfinite(x) & np.isfinite(y)
+    codes = np.where(codes[valid] < 0, n_groups, codes[valid])
+    x, y = x[valid], y[valid]
+
+    def sums(values):
+        per_group = np.bincount(codes, weights=values, minlength=n_groups + 1)[:n_groups]
+        return np.append(per_group, values.sum())
+
+    n = sums(np.ones_like(x))
+    sx, sy, sxx, sxy = sums(x), sums(y), sums(x * x), sums(x * y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = n * sxx - sx * sx
+        slope = (n * sxy - sx * sy) / denom
+        intercept = (sy - slope * sx) / n
+    source = np.full(n_groups + 1, FITTED, dtype=np.int8)
+
+    # 전체 행: 기울기가 0 이하(NaN 포함)면 default 기울기로 평균점을 지나게
+    if not slope[-1] > 0:
+        slope[-1] = default[0]
+        intercept[-1] = (sy[-1] - slope[-1] * sx[-1]) / n[-1] if n[-1] > 0 else default[1]
+        source[-1] = DEFAULT
+    pooled_source = POOLED if source[-1] == FITTED else DEFAULT
+
+    # 그룹 행: 적합이 불안정하면 전체 행 그대로, 기울기만 0 이하면 전체 기울기 + 그룹 평균점
+    unstable = (n < DISTANCE_MODEL_MIN_ROWS) | (denom <= 0) | ~np.isfinite(slope)
+    unstable[-1] = False
+    nonpositive = ~unstable & ~(slope > 0)
+    nonpositive[-1] = False
+    slope[nonpositive] = slope[-1]
+    intercept[nonpositive] = (sy[nonpositive] - slope[-1] * sx[nonpositive]) / n[nonpositive]
+    slope[unstable], intercept[unstable] = slope[-1], intercept[-1]
+    source[unstable | nonpositive] = pooled_source
+    return np.column_stack([slope, intercept]), n.astype(np.int64), source
+
+
+@dataclass(frozen=True)
+class DistanceModel:
+    """그룹별 거리 → 운임·배송일 선형 계수 (마지막 행 = 전체)."""
+
+    group_by: str | None
+    groups: tuple[str, ...]
+    freight_coef: np.ndarray  # (G + 1, 2) [km당 운임, 절편]
+    days_coef: np.ndarray  # (G + 1, 2) [km당 배송일, 절편]
+    n_rows: np.ndarray  # (G + 1,) 운임 적합에 쓴 행 수
+    freight_source: np.ndarray  # (G + 1,) 운임 계수 출처 (FITTED / POOLED / DEFAULT)
+    days_source: np.ndarray  # (G + 1,) 배송일 계수 출처
+
+    def freight(self, km, codes=-1) -> np.ndarray:
+        """거리 배열(+ 행별 그룹 번호) → 추정 운임 (R$)."""
+        coef = self.freight_coef[codes]
+        return coef[..., 0] * np.asarray(km, dtype=np.float64) + coef[..., 1]
+
+    def days(self, km, codes=-1) -> np.ndarray:
+        """거리 배열(+ 행별 그룹 번호) → 추정 배송일."""
+        coef = self.days_coef[codes]
+        return coef[..., 0] * np.asarray(km, dtype=np.float64) + coef[..., 1]
+
+    def fallback(self, codes=-1) -> np.ndarray:
+        """행별 그룹 번호 → 운임 또는 배송일 계수가 적합값이 아닌지 여부."""
+        return (self.freight_source[codes] != FITTED) | (self.days_source[codes] != FITTED)
+
+    def coefficients(self) -> pd.DataFrame:
+        """계수 테이블 (그룹, 행 수, 운임·배송일 기울기/절편)."""
+        return pd.DataFrame({
+            "group": [*self.groups, "전체"],
+            "n_rows": self.n_rows,
+            "freight_per_km": self.freight_coef[:, 0],
+            "freight_intercept": self.freight_coef[:, 1],
+            "freight_source": np.array(SOURCE_LABELS)[self.freight_source],
+            "days_per_km": self.days_coef[:, 0],
+            "days_intercept": self.days_coef[:, 1],
+            "days_source": np.array(SOURCE_LABELS)[self.days_source],
+        })
+
+
+def fit_distance_model(frame: pd.DataFrame, group_by: str | None = None) -> DistanceModel:
+    """distance_km / freight_value / delivery_days (+ 그룹 컬럼)가 있는 프레임에서 적합."""
+    labels = _group_labels(group_by)
+    codes = group_codes(frame, group_by)
+    x = frame["distance_km"].to_numpy(dtype=np.float64)
+    freight_coef, n_rows, freight_source = _fit_grouped_ols(
+        codes, x, frame["freight_value"].to_numpy(dtype=np.float64), len(labels),
+        DISTANCE_MODEL_DEFAULT_FREIGHT,
+    )
+    days_coef, _, days_source = _fit_grouped_ols(
+        codes, x, frame["delivery_days"].to_numpy(dtype=np.float64), len(labels),
+        DISTANCE_MODEL_DEFAULT_DAYS,
+    )
+    for arr in (freight_coef, days_coef, n_rows, freight_source, days_source):
+        arr.flags.writeable = False
+    return DistanceModel(
+        group_by, tuple(labels), freight_coef, days_coef, n_rows, freight_source, days_source,
+    )
+
+
+@st.cache_resource(max_entries=8)
+def _fit_current(group_by: str | None) -> DistanceModel:
+    merged = build_merged_table()
+    delivered = merged.loc[
+        merged["order_status"].eq("delivered"),
+        ["distance_km", "freight_value", "delivery_days", *MODEL_INPUT_COLUMNS],
+    ]
+    return fit_distance_model(delivered, group_by)
+
+
+def distance_model(group_by: str | None = DISTANCE_MODEL_GROUP_BY) -> DistanceModel:
+    """현재 데이터로 적합한 거리 모델 (원본 파일이 바뀌면 다시 적합)."""
+    dataset_version()  # 변경됐으면 여기서 스트림릿 캐시 전체가 비워진다
+    return _fit_current(group_by)
@@ -0,0 +1,103 @@
+"""대형 기본 테이블용 읽기 전용 공유 프레임 저장소.
+
+``@st.cache_data``는 캐시 히트마다 DataFrame을 역직렬화해 세션별 복사본을 만든다.
+병합 테이블처럼 큰 기본 테이블은 ``@st.cache_resource``로 프로세스 전체가 같은 객체를
+공유하고, 반환 전에 ``freeze_frame``으로 잠근다.
+
+- 프레임 수준: 객체를 ``FrozenFrame``으로 바꿔 컬럼 추가·교체·삭제(``df["x"] = ...``,
+  ``insert``, ``del``, ``pop``), ``loc`` / ``iloc`` / ``at`` / ``iat`` 대입, ``inplace=True``
+  연산, ``index`` / ``columns`` 교체를 ``TypeError``로 막는다. 필터링·``.copy()``·``assign``
+  등 파생 결과는 일반 ``DataFrame``이므로 호출부는 그 결과에만 값을 쓰면 된다.
+- 버퍼 수준: 숫자·범주·날짜 컬럼의 내부 numpy 버퍼를 쓰기 금지로 표시해, 컬럼 Series를
+  거친 제자리 수정(``df["x"].to_numpy()[0] = ...`` 등)도 ``ValueError``가 난다.
+
+object 컬럼(문자열 등)의 버퍼는 pandas의 일부 Cython 경로(``memory_usage(deep=True)`` 등)가
+쓰기 가능한 버퍼를 요구하므로 잠그지 않는다. 따라서 object 컬럼은 프레임 수준 대입만
+막히고, 컬럼 Series나 그 numpy 배열을 통한 원소 수정은 막지 못한다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+# 확장 배열(Categorical, DatetimeArray, IntegerArray 등)이 값을 보관하는 내부 버퍼
+_EXTENSION_BUFFERS = ("_ndarray", "_codes", "_data", "_mask")
+
+
+def _iter_buffers(values):
+    if isinstance(values, np.ndarray):
+        candidates = [values]
+    else:
+        candidates = [getattr(values, attr, None) for attr in _EXTENSION_BUFFERS]
+    for buf in candidates:
+        if isinstance(buf, np.ndarray) and buf.dtype != object:
+            yield buf
+
+
+def _refuse(*args, **kwargs):
+    raise TypeError("공유 프레임(freeze_frame)은 수정할 수 없습니다. .copy() 결과에 쓰세요.")
+
+
+class _ReadOnlyIndexer:
+    """loc / iloc / at / iat 조회(pandas 내부 호출 포함)는 원래 인덱서로 넘기고, 대입은 거부."""
+
+    def __init__(self, indexer):
+        self._indexer = indexer
+
+    def __getattr__(self, name):
+        return getattr(self._indexer, name)
+
+    def __getitem__(self, key):
+        return self._indexer[key]
+
+    __setitem__ = _refuse
+
+
+class FrozenFrame(pd.DataFrame):
+    """``freeze_frame``이 잠근 공유 DataFrame. 파생 결과는 일반 DataFrame이다."""
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    __setitem__ = _refuse
+    __delitem__ = _refuse
+    insert = _refuse
+    pop = _refuse
+    _update_inplace = _refuse
+    _set_axis = _refuse
+
+    @property
+    def loc(self):
+        return _ReadOnlyIndexer(super().loc)
+
+    @property
+    def iloc(self):
+        return _ReadOnlyIndexer(super().iloc)
+
+    @property
+    def at(self):
+        return _ReadOnlyIndexer(super().at)
+
+    @property
+    def iat(self):
+        return _ReadOnlyIndexer(super().iat)
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """DataFrame을 ``FrozenFrame``으로 잠그고 컬럼 버퍼를 읽기 전용으로 표시해 같은 객체를 반환."""
+    for values in df._mgr.arrays:
+        for buf in _iter_buffers(values):
+            buf.flags.writeable = False
+    df.__class__ = FrozenFrame
+    return df
+
+
+def is_frozen(df: pd.DataFrame) -> bool:
+    """프레임이 잠겼고 잠금 대상 컬럼 버퍼(object 제외)가 모두 읽기 전용인지 여부."""
+    return isinstance(df, FrozenFrame) and all(
+        not buf.flags.writeable
+        for values in df._mgr.arrays
+        for buf in _iter_buffers(values)
+    )
@@ -0,0 +1,121 @@
+"""우편번호(zip prefix) → 위경도 조회와 거리 계산.
+
+브라질 zip prefix는 5자리 정수(0~99999)이므로, prefix를 그대로 행 번호로 쓰는
+(100000, 2) float32 배열을 한 번 만들어 두고 fancy indexing으로 좌표를 찾는다.
+좌표가 없는 prefix는 NaN이다. 셀러·고객 좌표를 구할 때 geolocation 테이블과 merge할 필요가
+없다. 배열은 loader.zip_coordinate_table()이 캐싱한다.
+
+고객 n명 × 거점(창고) k개 거리는 거점별 평균처럼 모든 쌍이 필요할 때 ``distance_matrix``로
+한 번에 계산하고, 그 행렬이 이미 있으면 거점 부분집합의 최소 거리도 행렬에서 꺼낸다
+(셀러 일괄 물류 테이블). 행렬 없이 임의의 거점 목록에서 최근접 거점만 찾는 경우(창고 최적화
+후보·시나리오)는 ``SiteIndex``와 ``simulate_warehouse_scenarios``를 쓴다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import BallTree
+
+ZIP_PREFIX_COUNT = 100_000
+EARTH_RADIUS_KM = 6371
+
+
+def build_zip_coordinate_table(geo: pd.DataFrame) -> np.ndarray:
+    """zip prefix별 대표 위경도 테이블 → 행 = prefix, 열 = (lat, lng) 읽기 전용 배열."""
+    table = np.full((ZIP_PREFIX_COUNT, 2), np.nan, dtype=np.float32)
+    zips = geo["geolocation_zip_code_prefix"].to_numpy()
+    valid = (zips >= 0) & (zips < ZIP_PREFIX_COUNT)
+    table[zips[valid], 0] = geo["geolocation_lat"].to_numpy()[valid]
+    table[zips[valid], 1] = geo["geolocation_lng"].to_numpy()[valid]
+    table.flags.writeable = False
+    return table
+
+
+def lookup_zip_coords(table: np.ndarray, zips) -> np.ndarray:
+    """zip prefix 배열 → (n, 2) float32 위경도. 결측·범위 밖 prefix는 NaN."""
+    arr = np.asarray(zips, dtype=np.float64)
+    valid = (arr >= 0) & (arr < ZIP_PREFIX_COUNT)  # NaN은 False
+    coords = table[np.where(valid, arr, 0).astype(np.intp)]
+    coords[~valid] = np.nan
+    return coords
+
+
+def zip_coord(table: np.ndarray, zip_prefix) -> tuple[float, float] | None:
+    """zip prefix 하나의 (lat, lng). 좌표가 없으면 None."""
+    lat, lng = lookup_zip_coords(table, [zip_prefix])[0]
+    if np.isnan(lat):
+        return None
+    return float(lat), float(lng)
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """두 좌표 간 거리 (km) — 벡터 연산."""
+    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return EARTH_RADIUS_KM * 2 * np.arcsin(np.sqrt(a))
+
+
+def distance_matrix(lat, lng, site_lat, site_lng) -> np.ndarray:
+    """점 n개 × 거점 k개 거리 행렬 (km) → (n, k) float32.
+
+    한 번의 브로드캐스트 연산으로 계산한다. cos(위도)는 점·거점 벡터에서 각각 한 번만 구한다.
+    """
+    lat = np.radians(np.asarray(lat, dtype=np.float32))[:, None]
+    lng = np.radians(np.asarray(lng, dtype=np.float32))[:, None]
+    site_lat = np.radians(np.asarray(site_lat, dtype=np.float32))[None, :]
+    site_lng = np.radians(np.asarray(site_lng, dtype=np.float32))[None, :]
+    a = np.sin((site_lat - lat) / 2) ** 2
+    a += np.cos(lat) * np.cos(site_lat) * np.sin((site_lng - lng) / 2) ** 2
+    np.clip(a, 0.0, 1.0, out=a)
+    return (2 * EARTH_RADIUS_KM) * np.arcsin(np.sqrt(a, out=a), out=a)
+
+
+def unit_vectors(lat, lng) -> np.ndarray:
+    """위경도 → 단위 구 위의 (n, 3) 직교 좌표. 두 점의 직선(현) 거리는 대원 거리와 단조 관계."""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lng = np.radians(np.asarray(lng, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack([cos_lat * np.cos(lng), cos_lat * np.sin(lng), np.sin(lat)])
+
+
+def chord_to_km(chord: np.ndarray) -> np.ndarray:
+    """단위 구 위 현 길이 → 대원 거리 (km, float32)."""
+    return (2 * EARTH_RADIUS_KM * np.arcsin(np.clip(chord / 2, 0.0, 1.0))).astype(np.float32)
+
+
+class SiteIndex:
+    """거점 집합의 최근접 거점 조회 인덱스 (scikit-learn BallTree).
+
+    구축 O(k log k), 점 n개 조회 O(n log k)이므로 거점 수가 늘어도 (n, k) 거리 행렬을 만들지
+    않는다. 트리는 haversine metric 대신 단위 구 3차원 좌표의 유클리드(현) 거리로 만든다 —
+    현 길이는 대원 거리와 순서가 같고 트리 탐색이 더 빠르다. 조회 좌표에 NaN이 있으면 안 된다
+    (호출부에서 좌표 없는 점을 먼저 제외).
+    """
+
+    def __init__(self, site_lat, site_lng, leaf_size: int = 40):
+        self._tree = BallTree(unit_vectors(site_lat, site_lng), leaf_size=leaf_size)
+        self.size = self._tree.data.shape[0]
+
+    def nearest(self, lat, lng, k: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """점별 가까운 거점 k개 → (거점 번호, 거리 km float32).
+
+        k=1이면 (n,) 배열, 아니면 가까운 순으로 정렬된 (n, k) 배열.
+        """
+        chord, idx = self._tree.query(unit_vectors(lat, lng), k=k)
+        km = chord_to_km(chord)
+        if k == 1:
+            return idx[:, 0], km[:, 0]
+        return idx, km
+
+
+def simulate_warehouse_scenarios(lat, lng, site_lat, site_lng, sizes) -> dict[int, np.ndarray]:
+    """정렬된 창고 목록의 앞 k개만 운영할 때 점별 최근접 창고 거리 (km, k → 배열).
+
+    k마다 ``SiteIndex``를 한 번 만들어 조회하므로 점 n개에 대해 O(n log k)이다.
+    """
+    site_lat = np.asarray(site_lat)
+    site_lng = np.asarray(site_lng)
+    return {k: SiteIndex(site_lat[:k], site_lng[:k]).nearest(lat, lng)[1] for k in sizes}
@@ -0,0 +1,107 @@
+"""그룹별 분위수·적률 일괄 계산 엔진.
+
+``groupby().agg([...])``와 ``groupby().quantile(q)``를 분위수마다 따로 돌리면 그룹핑과
+정렬이 반복된다. 여기서는 (그룹, 값)을 한 번 정렬한 뒤
+
+- 개수·합·평균·표준편차는 그룹 시작 위치 기준 ``np.add.reduceat``,
+- 최소·최대는 그룹 첫·마지막 원소,
+- 분위수는 그룹 안 위치 (n - 1)·q의 선형 보간 (pandas/numpy 기본 ``linear``와 같음)
+
+으로 모든 통계를 한 번에 뽑는다. 결측 값과 음수 그룹 번호는 제외한다.
+그룹 없이 값 배열 하나의 같은 통계는 ``array_stats``로 구한다.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_QUANTILES = (0.05, 0.10, 0.25, 0.50, 0.75, 0.90, 0.95)
+
+
+def quantile_column(q: float) -> str:
+    """분위수 → 컬럼명 (0.05 → "p5", 0.5 → "p50")."""
+    return f"p{round(q * 100, 4):g}"
+
+
+def grouped_stats(
+    group: np.ndarray,
+    values: np.ndarray,
+    n_groups: int | None = None,
+    quantiles=DEFAULT_QUANTILES,
+) -> pd.DataFrame:
+    """그룹 번호(0..n_groups-1)별 count / mean / std / min / max + 분위수 컬럼.
+
+    행 번호 = 그룹 번호. 값이 없는 그룹은 count 0, 나머지 NaN. std는 표본 표준편차(ddof=1).
+    """
+    group = np.asarray(group, dtype=np.int64)
+    values = np.asarray(values, dtype=np.float64)
+    keep = (group >= 0) & ~np.isnan(values)
+    group, values = group[keep], values[keep]
+    if n_groups is None:
+        n_groups = int(group.max()) + 1 if len(group) else 0
+
+    order = np.lexsort((values, group))
+    group, values = group[order], values[order]
+    count = np.bincount(group, minlength=n_groups)
+    columns = ["mean", "std", "min", "max", *map(quantile_column, quantiles)]
+    stats = {"count": count, **{col: np.full(n_groups, np.nan) for col in columns}}
+    present = count > 0
+    if not present.any():
+        return pd.DataFrame(stats)
+
+    start = np.concatenate([[0], np.cumsum(count)[:-1]])
+    first, n = start[present], count[present]
+    mean = np.add.reduceat(values, first) / n
+    dev = values - np.repeat(mean, n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = np.add.reduceat(dev * dev, first) / (n - 1)
+
+    stats["mean"][present] = mean
+    stats["std"][present] = np.sqrt(np.where(n > 1, var, np.nan))
+    stats["min"][present] = values[first]
+    stats["max"][present] = values[first + n - 1]
+    for q in quantiles:
+        pos = (n - 1) * q
+        lo = np.floor(pos).astype(np.int64)
+        hi = np.minimum(lo + 1, n - 1)
+        lower, upper = values[first + lo], values[first + hi]
+        stats[quantile_column(q)][present] = lower + (upper - lower) * (pos - lo)
+    return pd.DataFrame(stats)
+
+
+def array_stats(values, quantiles=DEFAULT_QUANTILES) -> dict[str, float]:
+    """값 배열 하나의 count / mean / std / min / max + 분위수 (grouped_stats 한 행과 같은 키).
+
+    값이 없으면 count 0, 나머지 NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    values = np.sort(values[~np.isnan(values)])
+    n = len(values)
+    columns = ["mean", "std", "min", "max", *map(quantile_column, quantiles)]
+    stats = {"count": n, **dict.fromkeys(columns, np.nan)}
+    if n == 0:
+        return stats
+
+    stats["mean"] = float(values.mean())
+    stats["std"] = float(values.std(ddof=1)) if n > 1 else np.nan
+    stats["min"], stats["max"] = float(values[0]), float(values[-1])
+    for q, value in zip(quantiles, np.quantile(values, list(quantiles))):
+        stats[quantile_column(q)] = float(value)
+    return stats
+
+
+def frame_stats(
+    df: pd.DataFrame,
+    by: str | list[str],
+    column: str,
+    quantiles=DEFAULT_QUANTILES,
+) -> pd.DataFrame:
+    """DataFrame 버전 — by 키 컬럼 + grouped_stats 컬럼 (키 정렬 순, 결측 키 그룹 제외)."""
+    by = [by] if isinstance(by, str) else list(by)
+    grouped = df.groupby(by, observed=True, sort=True)
+    group = grouped.ngroup().to_numpy(dtype=np.float64)
+    group = np.where(np.isnan(group), -1, group).astype(np.int64)
+    keys = grouped.size().index.to_frame(index=False)
+    stats = grouped_stats(group, df[column].to_numpy(dtype=np.float64), len(keys), quantiles)
+    return pd.concat([keys, stats], axis=1)
@@ -0,0 +1,94 @@
+"""32자리 hex ID ↔ int32 대리키 사전 인코딩.
+
+seller_id / order_id / customer_id / customer_unique_id / product_id는 모두 32자리 hex
+문자열이라 object 컬럼으로 들고 있으면 메모리를 많이 차지하고, 조인·필터마다 문자열
+해시 비용이 든다. ID 공간마다 마스터 테이블의 고유 ID를 정렬해 어휘(vocabulary)로 삼고,
+어휘 내 위치를 int32 코드로 쓴다.
+
+- 로더는 읽은 직후 ID 컬럼을 코드로 바꾼다 (컬럼명은 그대로).
+- 분석 함수는 코드로 조인·필터하고, 공개 API는 문자열 ID를 받아 내부에서 인코딩한다.
+- 문자열이 필요한 화면(사이드바, 표, 이름 매핑 대체 라벨)에서만 디코딩한다.
+
+결측 ID는 ``MISSING_CODE``(-1)로 인코딩된다. 서로 다른 미등록 ID가 같은 -1이 되어
+조인되지 않도록, 테이블 컬럼을 인코딩하는 ``encode_columns``는 어휘에 없는 ID를 만나면
+``ValueError``를 낸다 (마스터 테이블이 어휘 원본이므로 참조 무결성 오류다). 사용자 입력
+하나를 확인하는 ``encode_one``만 -1을 돌려준다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+MISSING_CODE = -1
+CODE_DTYPE = np.int32
+
+
+@dataclass(frozen=True)
+class IdCodec:
+    """한 ID 공간의 문자열 ↔ 코드 변환기. 코드 = 정렬된 어휘에서의 위치."""
+
+    name: str
+    vocab: pd.Index
+
+    @classmethod
+    def from_values(cls, name: str, values) -> IdCodec:
+        uniques = pd.Series(values).dropna().unique()
+        return cls(name=name, vocab=pd.Index(np.sort(uniques.astype(object))))
+
+    def __len__(self) -> int:
+        return len(self.vocab)
+
+    def encode(self, values) -> np.ndarray:
+        """문자열 ID 배열 → int32 코드 배열 (미등록/결측은 -1)."""
+        return self.vocab.get_indexer(values).astype(CODE_DTYPE, copy=False)
+
+    def encode_one(self, value: str) -> int:
+        """문자열 ID 하나 → 코드 (미등록이면 -1)."""
+        try:
+            return int(self.vocab.get_loc(value))
+        except KeyError:
+            return MISSING_CODE
+
+    def decode(self, codes):
+        """코드 배열 → 문자열 ID. Series를 넘기면 같은 인덱스의 Series를 반환한다."""
+        arr = np.asarray(codes)
+        valid = arr >= 0
+        out = np.full(arr.shape, None, dtype=object)
+        out[valid] = self.vocab.values[arr[valid]]
+        if isinstance(codes, pd.Series):
+            return pd.Series(out, index=codes.index, name=codes.name)
+        return out
+
+    def decode_one(self, code: int) -> str | None:
+        """코드 하나 → 문자열 ID (-1이면 None)."""
+        return self.vocab[code] if 0 <= code < len(self.vocab) else None
+
+
+def encode_columns(df: pd.DataFrame, codecs: dict[str, IdCodec]) -> pd.DataFrame:
+    """df의 ID 컬럼들을 코드로 바꾼 새 DataFrame을 반환한다 (없는 컬럼은 무시).
+
+    결측은 -1, 어휘에 없는 ID는 ``ValueError``.
+    """
+    encoded = {}
+    for col, codec in codecs.items():
+        if col not in df.columns:
+            continue
+        codes = codec.encode(df[col])
+        unknown = np.flatnonzero((codes == MISSING_CODE) & df[col].notna().to_numpy())
+        if len(unknown):
+            raise ValueError(
+                f"{col}: {codec.name} 마스터 테이블에 없는 ID {len(unknown)}건 "
+                f"(예: {df[col].iloc[unknown[0]]!r})"
+            )
+        encoded[col] = codes
+    return df.assign(**encoded)
+
+
+def decode_columns(df: pd.DataFrame, codecs: dict[str, IdCodec]) -> pd.DataFrame:
+    """encode_columns의 역 — ID 코드 컬럼들을 문자열로 바꾼 새 DataFrame (없는 컬럼은 무시)."""
+    return df.assign(**{
+        col: codec.decode(df[col]) for col, codec in codecs.items() if col in df.columns
+    })
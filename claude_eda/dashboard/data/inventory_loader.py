@@ -1,4 +1,8 @@
-"""재고 관리 데이터 로딩 모듈. @st.cache_data로 5개 CSV 캐싱."""
+"""재고 관리 데이터 로딩 모듈. @st.cache_data로 5개 CSV 캐싱.
+
+로더는 seller_id / product_id를 loader.py와 같은 int32 코드로 인코딩해 반환하고,
+``get_seller_inventory_summary``의 결과 프레임은 문자열 ID로 디코딩해 반환한다.
+"""
 
 from __future__ import annotations
 
@@ -6,47 +10,66 @@ import pandas as pd
 import streamlit as st
 
 from claude_eda.dashboard.config import INVENTORY_DATA_DIR
+from claude_eda.dashboard.data.columnar_cache import read_csv_cached
+from claude_eda.dashboard.data.id_codec import MISSING_CODE
+from claude_eda.dashboard.data.loader import decode_ids, encode_ids, seller_codec
+from claude_eda.dashboard.data.memo import bounded_memo
+from claude_eda.dashboard.data.schema import (
+    INVENTORY_MOVEMENTS_DTYPES,
+    REORDER_RULES_DTYPES,
+    WAREHOUSE_INVENTORY_DTYPES,
+)
 
 
 @st.cache_data
 def load_warehouses() -> pd.DataFrame:
     """창고 마스터 (5행)."""
-    return pd.read_csv(INVENTORY_DATA_DIR / "olist_warehouses.csv")
+    return read_csv_cached(INVENTORY_DATA_DIR / "olist_warehouses.csv")
 
 
 @st.cache_data
 def load_warehouse_inventory() -> pd.DataFrame:
     """창고×상품 현재고."""
-    return pd.read_csv(INVENTORY_DATA_DIR / "olist_warehouse_inventory.csv")
+    return encode_ids(read_csv_cached(
+        INVENTORY_DATA_DIR / "olist_warehouse_inventory.csv",
+        dtype=WAREHOUSE_INVENTORY_DTYPES,
+    ))
 
 
 @st.cache_data
 def load_inventory_movements() -> pd.DataFrame:
     """입출고 이력."""
-    df = pd.read_csv(INVENTORY_DATA_DIR / "olist_inventory_movements.csv")
-    df["movement_date"] = pd.to_datetime(df["movement_date"])
-    return df
+    return encode_ids(read_csv_cached(
+        INVENTORY_DATA_DIR / "olist_inventory_movements.csv",
+        dtype=INVENTORY_MOVEMENTS_DTYPES,
+        parse_dates=["movement_date"],
+    ))
 
 
 @st.cache_data
 def load_seller_warehouse() -> pd.DataFrame:
     """셀러-창고 배정."""
-    return pd.read_csv(INVENTORY_DATA_DIR / "olist_seller_warehouse.csv")
+    return encode_ids(read_csv_cached(INVENTORY_DATA_DIR / "olist_seller_warehouse.csv"))
 
 
 @st.cache_data
 def load_reorder_rules() -> pd.DataFrame:
     """자동 발주 규칙."""
-    return pd.read_csv(INVENTORY_DATA_DIR / "olist_reorder_rules.csv")
+    return encode_ids(read_csv_cached(
+        INVENTORY_DATA_DIR / "olist_reorder_rules.csv",
+        dtype=REORDER_RULES_DTYPES,
+    ))
 
 
+@bounded_memo
 def get_seller_inventory_summary(seller_id: str) -> dict:
-    """셀러의 재고 관련 정보를 종합하여 반환한다."""
+    """셀러의 재고 관련 정보를 종합하여 반환한다 (결과 프레임의 ID는 문자열)."""
     sw = load_seller_warehouse()
     warehouses = load_warehouses()
     inventory = load_warehouse_inventory()
     movements = load_inventory_movements()
     reorder = load_reorder_rules()
+    seller_code = seller_codec().encode_one(seller_id)
 
     result: dict = {
         "has_data": False,
@@ -61,8 +84,8 @@ def get_seller_inventory_summary(seller_id: str) -> dict:
     }
 
     # 셀러-창고 배정
-    seller_wh = sw[sw["seller_id"] == seller_id]
-    if seller_wh.empty:
+    seller_wh = sw[sw["seller_id"] == seller_code]
+    if seller_code == MISSING_CODE or seller_wh.empty:
         return result
 
     row = seller_wh.iloc[0]
@@ -81,7 +104,7 @@ def get_seller_inventory_summary(seller_id: str) -> dict:
     # 주 창고의 재고 현황
     primary_wid = result["primary_warehouse"]
     inv = inventory[inventory["warehouse_id"] == primary_wid].copy()
-    result["inventory_items"] = inv
+    result["inventory_items"] = decode_ids(inv)
 
     # 발주점 이하 경고 상품
     rules = reorder[reorder["warehouse_id"] == primary_wid].copy()
@@ -92,16 +115,16 @@ def get_seller_inventory_summary(seller_id: str) -> dict:
         ].copy()
         alerts["urgency"] = "warning"
         alerts.loc[alerts["quantity_available"] <= alerts["safety_stock"], "urgency"] = "critical"
-        result["reorder_alerts"] = alerts.sort_values("quantity_available")
+        result["reorder_alerts"] = decode_ids(alerts.sort_values("quantity_available"))
 
     # 셀러의 최근 입출고 이력 (최근 50건)
-    seller_moves = movements[movements["seller_id"] == seller_id].copy()
+    seller_moves = movements[movements["seller_id"] == seller_code].copy()
     seller_moves = seller_moves.sort_values("movement_date", ascending=False).head(50)
-    result["recent_movements"] = seller_moves
+    result["recent_movements"] = decode_ids(seller_moves)
 
     # 입출고 요약
     if not seller_moves.empty:
-        summary = seller_moves.groupby("movement_type")["quantity"].agg(["sum", "count"])
+        summary = seller_moves.groupby("movement_type", observed=True)["quantity"].agg(["sum", "count"])
         result["movement_summary"] = {
             mtype: {"total_qty": int(row["sum"]), "count": int(row["count"])}
             for mtype, row in summary.iterrows()
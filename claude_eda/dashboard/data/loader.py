@@ -1,4 +1,11 @@
-"""데이터 로딩 모듈. @st.cache_data로 전체 CSV 캐싱."""
+"""데이터 로딩 모듈. @st.cache_data로 전체 CSV 캐싱 (디스크에는 Parquet 캐시).
+
+주문/상품/리뷰/고객/결제/위치와 병합 테이블 같은 대형 기본 테이블은 캐시 히트마다
+복사되지 않도록 @st.cache_resource로 공유하고, freeze_frame으로 읽기 전용 처리한다.
+
+모든 로더는 ID 컬럼(seller_id, order_id, customer_id, customer_unique_id, product_id)을
+int32 코드로 바꿔 반환한다. 문자열 ID가 필요하면 ``*_codec()``으로 디코딩한다.
+"""
 
 import pandas as pd
 import streamlit as st
@@ -7,6 +14,8 @@ from claude_eda.dashboard.config import (
     CATEGORY_TRANSLATION_PATH,
     CUSTOMER_CLUSTER_DATA_PATH,
     CUSTOMERS_PATH,
+    DISTANCE_BIN_LABELS,
+    DISTANCE_BINS_KM,
     GEOLOCATION_PATH,
     ORDER_ITEMS_PATH,
     ORDERS_PATH,
@@ -24,109 +33,217 @@ from claude_eda.dashboard.config import (
     WAREHOUSE_SCENARIO_PATH,
     WAREHOUSE_STATE_GAP_PATH,
 )
+from claude_eda.dashboard.data.columnar_cache import read_csv_cached
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.geo import (
+    build_zip_coordinate_table,
+    haversine_km,
+    lookup_zip_coords,
+)
+from claude_eda.dashboard.data.id_codec import IdCodec, decode_columns, encode_columns
+from claude_eda.dashboard.data.review_annotations import read_review_annotations
+from claude_eda.dashboard.data.schema import (
+    CATEGORY_TRANSLATION_DTYPES,
+    CUSTOMERS_DTYPES,
+    GEOLOCATION_COLUMNS,
+    GEOLOCATION_DTYPES,
+    MERGED_DTYPES,
+    ORDER_ITEMS_DTYPES,
+    ORDERS_DTYPES,
+    PAYMENTS_DTYPES,
+    PRODUCTS_DTYPES,
+    REVIEWS_DTYPES,
+    SELLERS_DTYPES,
+    TIMESTAMP_FORMAT,
+)
+from claude_eda.dashboard.data.seller_partition import SellerPartition, sort_by_seller
+from claude_eda.dashboard.engine.review_analyzer import ISSUE_MASK_COL, POSITIVE_COL
 
+ORDER_DATE_COLS = [
+    "order_purchase_timestamp",
+    "order_approved_at",
+    "order_delivered_carrier_date",
+    "order_delivered_customer_date",
+    "order_estimated_delivery_date",
+]
 
-@st.cache_data
+
+# ── ID 코덱 (마스터 테이블의 고유 ID를 어휘로 사용) ──
+
+
+def _read_codec(name: str, path, column: str) -> IdCodec:
+    ids = read_csv_cached(path, usecols=[column])[column]
+    return IdCodec.from_values(name, ids)
+
+
+@st.cache_resource
+def seller_codec() -> IdCodec:
+    return _read_codec("seller", SELLERS_PATH, "seller_id")
+
+
+@st.cache_resource
+def order_codec() -> IdCodec:
+    return _read_codec("order", ORDERS_PATH, "order_id")
+
+
+@st.cache_resource
+def customer_codec() -> IdCodec:
+    return _read_codec("customer", CUSTOMERS_PATH, "customer_id")
+
+
+@st.cache_resource
+def customer_unique_codec() -> IdCodec:
+    return _read_codec("customer_unique", CUSTOMERS_PATH, "customer_unique_id")
+
+
+@st.cache_resource
+def product_codec() -> IdCodec:
+    return _read_codec("product", PRODUCTS_PATH, "product_id")
+
+
+def id_codecs() -> dict[str, IdCodec]:
+    """ID 컬럼명 → 코덱."""
+    return {
+        "seller_id": seller_codec(),
+        "order_id": order_codec(),
+        "customer_id": customer_codec(),
+        "customer_unique_id": customer_unique_codec(),
+        "product_id": product_codec(),
+    }
+
+
+def encode_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """df에 있는 ID 컬럼을 모두 int32 코드로 바꾼다."""
+    return encode_columns(df, id_codecs())
+
+
+def decode_ids(df: pd.DataFrame) -> pd.DataFrame:
+    """df에 있는 ID 코드 컬럼을 모두 문자열 ID로 되돌린다 (공개 결과 반환용)."""
+    return decode_columns(df, id_codecs())
+
+
+# ── 원본 테이블 ──
+
+
+@st.cache_resource
 def load_order_items() -> pd.DataFrame:
-    return pd.read_csv(ORDER_ITEMS_PATH)
+    return freeze_frame(encode_ids(read_csv_cached(
+        ORDER_ITEMS_PATH,
+        dtype=ORDER_ITEMS_DTYPES,
+        parse_dates=["shipping_limit_date"],
+        date_format=TIMESTAMP_FORMAT,
+    )))
 
 
-@st.cache_data
+@st.cache_resource
 def load_orders() -> pd.DataFrame:
-    df = pd.read_csv(ORDERS_PATH)
-    date_cols = [
-        "order_purchase_timestamp",
-        "order_approved_at",
-        "order_delivered_carrier_date",
-        "order_delivered_customer_date",
-        "order_estimated_delivery_date",
-    ]
-    for col in date_cols:
-        df[col] = pd.to_datetime(df[col], errors="coerce")
-    return df
+    return freeze_frame(encode_ids(read_csv_cached(
+        ORDERS_PATH,
+        dtype=ORDERS_DTYPES,
+        parse_dates=ORDER_DATE_COLS,
+        date_format=TIMESTAMP_FORMAT,
+    )))
 
 
-@st.cache_data
+@st.cache_resource
 def load_reviews() -> pd.DataFrame:
-    return pd.read_csv(REVIEWS_PATH)
+    """리뷰 테이블 + 저장된 키워드 분류 주석 (이슈 비트마스크, 긍정 여부)."""
+    reviews = encode_ids(read_csv_cached(REVIEWS_PATH, dtype=REVIEWS_DTYPES))
+    reviews = reviews.merge(read_review_annotations(), on="review_id", how="left")
+    reviews[ISSUE_MASK_COL] = reviews[ISSUE_MASK_COL].fillna(0).astype("uint8")
+    reviews[POSITIVE_COL] = reviews[POSITIVE_COL].eq(True)
+    return freeze_frame(reviews)
 
 
 @st.cache_data
 def load_sellers() -> pd.DataFrame:
-    return pd.read_csv(SELLERS_PATH)
+    return encode_ids(read_csv_cached(SELLERS_PATH, dtype=SELLERS_DTYPES))
 
 
-@st.cache_data
+@st.cache_resource
 def load_products() -> pd.DataFrame:
-    return pd.read_csv(PRODUCTS_PATH)
+    return freeze_frame(encode_ids(read_csv_cached(PRODUCTS_PATH, dtype=PRODUCTS_DTYPES)))
 
 
-@st.cache_data
+@st.cache_resource
 def load_customers() -> pd.DataFrame:
-    return pd.read_csv(CUSTOMERS_PATH)
+    return freeze_frame(encode_ids(read_csv_cached(CUSTOMERS_PATH, dtype=CUSTOMERS_DTYPES)))
 
 
-@st.cache_data
+@st.cache_resource
 def load_payments() -> pd.DataFrame:
-    return pd.read_csv(PAYMENTS_PATH)
+    return freeze_frame(encode_ids(read_csv_cached(PAYMENTS_PATH, dtype=PAYMENTS_DTYPES)))
 
 
 @st.cache_data
 def load_category_translation() -> pd.DataFrame:
-    return pd.read_csv(CATEGORY_TRANSLATION_PATH)
+    return read_csv_cached(CATEGORY_TRANSLATION_PATH, dtype=CATEGORY_TRANSLATION_DTYPES)
 
 
-@st.cache_data
+@st.cache_resource
 def load_geolocation() -> pd.DataFrame:
     """zip_code_prefix별 대표 위경도 (중복 제거, 첫 번째 값 사용)."""
-    df = pd.read_csv(GEOLOCATION_PATH)
-    return (
+    df = read_csv_cached(
+        GEOLOCATION_PATH, usecols=GEOLOCATION_COLUMNS, dtype=GEOLOCATION_DTYPES
+    )
+    geo = (
         df.groupby("geolocation_zip_code_prefix")
         .agg({"geolocation_lat": "first", "geolocation_lng": "first"})
         .reset_index()
     )
+    return freeze_frame(geo)
+
+
+@st.cache_resource
+def zip_coordinate_table():
+    """zip prefix → (lat, lng) 조회 배열 (geo.lookup_zip_coords / geo.zip_coord와 함께 사용)."""
+    return build_zip_coordinate_table(load_geolocation())
 
 
 @st.cache_data
 def load_seller_names() -> pd.DataFrame:
     """셀러 ID → 회사명 매핑 테이블 로딩."""
-    return pd.read_csv(SELLER_NAME_MAPPING_PATH)
+    return encode_ids(read_csv_cached(SELLER_NAME_MAPPING_PATH))
 
 
 @st.cache_data
 def load_product_names() -> pd.DataFrame:
     """상품 ID → 상품명 매핑 테이블 로딩."""
-    return pd.read_csv(PRODUCT_NAME_MAPPING_PATH)
+    return encode_ids(read_csv_cached(PRODUCT_NAME_MAPPING_PATH))
 
 
 @st.cache_data
 def load_seller_clusters() -> pd.DataFrame:
-    return pd.read_csv(SELLER_CLUSTER_DATA_PATH)
+    return encode_ids(read_csv_cached(SELLER_CLUSTER_DATA_PATH))
 
 
 @st.cache_data
 def load_seller_cluster_stats() -> pd.DataFrame:
-    return pd.read_csv(SELLER_CLUSTER_STATS_PATH)
+    return read_csv_cached(SELLER_CLUSTER_STATS_PATH)
 
 
 @st.cache_data
 def load_product_clusters() -> pd.DataFrame:
-    return pd.read_csv(PRODUCT_CLUSTER_DATA_PATH)
+    return encode_ids(read_csv_cached(PRODUCT_CLUSTER_DATA_PATH))
 
 
 @st.cache_data
 def load_product_cluster_stats() -> pd.DataFrame:
-    return pd.read_csv(PRODUCT_CLUSTER_STATS_PATH)
+    return read_csv_cached(PRODUCT_CLUSTER_STATS_PATH)
 
 
 @st.cache_data
 def load_customer_clusters() -> pd.DataFrame:
-    return pd.read_csv(CUSTOMER_CLUSTER_DATA_PATH)
+    return encode_ids(read_csv_cached(CUSTOMER_CLUSTER_DATA_PATH))
 
 
-@st.cache_data
+@st.cache_resource
 def build_merged_table() -> pd.DataFrame:
-    """order_items + orders + reviews + customers + products + sellers 조인."""
+    """order_items + orders + reviews + customers + products + sellers 조인.
+
+    모든 세션이 공유하는 읽기 전용 프레임 — 수정이 필요하면 필터링 결과나 복사본에 쓴다.
+    행은 seller_id 코드 순으로 정렬되어 있다 (셀러 슬라이스는 merged_by_seller 사용).
+    """
     items = load_order_items()
     orders = load_orders()
     reviews = load_reviews()
@@ -135,12 +252,20 @@ def build_merged_table() -> pd.DataFrame:
     sellers = load_sellers()
     cat_trans = load_category_translation()
 
-    # products에 영문 카테고리 추가
-    products = products.merge(cat_trans, on="product_category_name", how="left")
+    # products에 영문 카테고리 추가 (category dtype 유지를 위해 merge 대신 map)
+    translation = dict(zip(
+        cat_trans["product_category_name"].astype(str),
+        cat_trans["product_category_name_english"].astype(str),
+    ))
+    products = products.assign(
+        product_category_name_english=products["product_category_name"].map(translation)
+    )
 
     # 조인
     merged = items.merge(orders, on="order_id", how="left")
-    review_cols = ["order_id", "review_score", "review_comment_message"]
+    review_cols = [
+        "order_id", "review_score", "review_comment_message", ISSUE_MASK_COL, POSITIVE_COL,
+    ]
     merged = merged.merge(
         reviews[review_cols].drop_duplicates("order_id"),
         on="order_id",
@@ -163,27 +288,52 @@ def build_merged_table() -> pd.DataFrame:
     # 월 컬럼
     merged["order_month"] = merged["order_purchase_timestamp"].dt.to_period("M")
 
-    return merged
+    # 고객 좌표 + 셀러→고객 거리 (zip prefix 기준, 좌표가 없으면 NaN)
+    coords = zip_coordinate_table()
+    customer_xy = lookup_zip_coords(coords, merged["customer_zip_code_prefix"])
+    seller_xy = lookup_zip_coords(coords, merged["seller_zip_code_prefix"])
+    merged["customer_lat"] = customer_xy[:, 0]
+    merged["customer_lng"] = customer_xy[:, 1]
+    merged["distance_km"] = haversine_km(
+        seller_xy[:, 0].astype("float64"), seller_xy[:, 1].astype("float64"),
+        customer_xy[:, 0].astype("float64"), customer_xy[:, 1].astype("float64"),
+    ).astype("float32")
+    merged["distance_bin"] = pd.cut(
+        merged["distance_km"], bins=DISTANCE_BINS_KM, labels=DISTANCE_BIN_LABELS
+    )
+
+    # left join 결측으로 승격된 컬럼을 스키마 dtype으로 복원
+    merged[ISSUE_MASK_COL] = merged[ISSUE_MASK_COL].fillna(0)
+    merged[POSITIVE_COL] = merged[POSITIVE_COL].eq(True)
+    merged = merged.astype(MERGED_DTYPES)
+
+    return freeze_frame(sort_by_seller(merged))
+
+
+@st.cache_resource
+def merged_by_seller() -> SellerPartition:
+    """병합 테이블의 셀러별 분할 인덱스. ``merged_by_seller().rows(seller_id)``."""
+    return SellerPartition.build(build_merged_table(), seller_codec())
 
 
 @st.cache_data
 def load_warehouse_recommendations() -> pd.DataFrame:
-    return pd.read_csv(WAREHOUSE_RECOMMENDATIONS_PATH)
+    return read_csv_cached(WAREHOUSE_RECOMMENDATIONS_PATH)
 
 
 @st.cache_data
 def load_warehouse_scenarios() -> pd.DataFrame:
-    return pd.read_csv(WAREHOUSE_SCENARIO_PATH)
+    return read_csv_cached(WAREHOUSE_SCENARIO_PATH)
 
 
 @st.cache_data
 def load_warehouse_state_gap() -> pd.DataFrame:
-    return pd.read_csv(WAREHOUSE_STATE_GAP_PATH)
+    return read_csv_cached(WAREHOUSE_STATE_GAP_PATH)
 
 
 @st.cache_data
 def get_seller_list() -> pd.DataFrame:
-    """셀러 ID + 매출 순위 + 회사명 리스트 반환 (검색/선택용)."""
+    """셀러 ID(코드) + 매출 순위 + 회사명 리스트 반환 (검색/선택용)."""
     seller_clusters = load_seller_clusters()
     seller_list = (
         seller_clusters[["seller_id", "total_revenue", "total_orders", "cluster"]]
@@ -1,41 +1,29 @@
-"""물류 창고 최적화 — 셀러별 분석 함수."""
+"""물류 창고 최적화 — 셀러별 분석 함수.
+
+창고 수는 고정돼 있지 않다. 시나리오는 셀러에게 유리한 순으로 정렬한 창고 목록의 앞 k개
+(``WAREHOUSE_SCENARIO_SIZES``)와 전체 창고를 운영하는 경우다. 셀러별 수치는 전체 셀러
+일괄 테이블(``batch_logistics.compute_all_seller_logistics``)의 행을 읽고, 지도용 고객
+분포만 셀러 슬라이스에서 집계한다. 임의의 거점 목록에 대한 시나리오 거리는
+``geo.simulate_warehouse_scenarios``(``SiteIndex``, BallTree)로 구한다.
+"""
 
 from __future__ import annotations
 
-import numpy as np
 import pandas as pd
 import streamlit as st
 
+from claude_eda.dashboard.data.batch_logistics import compute_all_seller_logistics
+from claude_eda.dashboard.data.geo import zip_coord
 from claude_eda.dashboard.data.loader import (
-    build_merged_table,
-    load_geolocation,
     load_sellers,
     load_warehouse_recommendations,
     load_warehouse_scenarios,
+    merged_by_seller,
+    seller_codec,
+    zip_coordinate_table,
 )
 
 
-def _haversine(lat1, lon1, lat2, lon2):
-    """두 좌표 간 거리 (km) — 벡터 연산."""
-    R = 6371
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    return R * 2 * np.arcsin(np.sqrt(a))
-
-
-BRAZIL_REGIONS = {
-    "SP": "Southeast", "RJ": "Southeast", "MG": "Southeast", "ES": "Southeast",
-    "RS": "South", "PR": "South", "SC": "South",
-    "BA": "Northeast", "PE": "Northeast", "CE": "Northeast", "MA": "Northeast",
-    "PB": "Northeast", "RN": "Northeast", "AL": "Northeast", "PI": "Northeast", "SE": "Northeast",
-    "DF": "Central-West", "GO": "Central-West", "MT": "Central-West", "MS": "Central-West",
-    "PA": "North", "AM": "North", "TO": "North", "RO": "North",
-    "AC": "North", "AP": "North", "RR": "North",
-}
-
-
 @st.cache_data
 def compute_seller_logistics(seller_id: str) -> dict:
     """셀러별 물류 현황 및 창고 활용 효과 분석.
@@ -47,14 +35,15 @@ def compute_seller_logistics(seller_id: str) -> dict:
         platform_avg_distance, platform_avg_freight, platform_avg_delivery_days
         warehouse_recs: DataFrame (warehouse_recommendations + seller-specific distances)
         best_warehouse: dict (가장 유리한 창고)
-        simulation: list[dict] (현재, 최근접1창고, 3창고, 5창고 시나리오)
-        region_effect: DataFrame (권역별 거리 감소 효과)
+        simulation: list[dict] (현재 + 운영 창고 수별 시나리오, n_warehouses 오름차순)
+        freight_per_km, days_per_km: 시나리오 추정에 쓴 거리 모델 기울기 (셀러 주문 행 평균)
+        model_fallback_pct: 적합 기울기가 0 이하 등이라 대체 계수를 쓴 주문 행 비율 (%)
+        region_effect: DataFrame (권역별 거리 감소 효과, 전체 창고 운영 기준)
     """
-    merged = build_merged_table()
-    geo = load_geolocation()
     sellers_df = load_sellers()
     wh_recs = load_warehouse_recommendations()
     wh_scenarios = load_warehouse_scenarios()
+    seller_code = seller_codec().encode_one(seller_id)
 
     result = {
         "seller_lat": None, "seller_lng": None, "seller_state": "",
@@ -64,59 +53,50 @@ def compute_seller_logistics(seller_id: str) -> dict:
         "warehouse_recs": pd.DataFrame(),
         "best_warehouse": {},
         "simulation": [],
+        "freight_per_km": 0.0, "days_per_km": 0.0, "model_fallback_pct": 0.0,
         "region_effect": pd.DataFrame(),
     }
 
     # 셀러 좌표
-    seller_info = sellers_df[sellers_df["seller_id"] == seller_id]
+    seller_info = sellers_df[sellers_df["seller_id"] == seller_code]
     if seller_info.empty:
         return result
-    seller_zip = seller_info.iloc[0]["seller_zip_code_prefix"]
     result["seller_state"] = seller_info.iloc[0]["seller_state"]
 
-    seller_geo = geo[geo["geolocation_zip_code_prefix"] == seller_zip]
-    if seller_geo.empty:
+    seller_coord = zip_coord(zip_coordinate_table(), seller_info.iloc[0]["seller_zip_code_prefix"])
+    if seller_coord is None:
         return result
-    slat = float(seller_geo.iloc[0]["geolocation_lat"])
-    slng = float(seller_geo.iloc[0]["geolocation_lng"])
+    slat, slng = seller_coord
     result["seller_lat"] = slat
     result["seller_lng"] = slng
 
-    # 셀러의 배송 데이터
-    seller_data = merged[
-        (merged["seller_id"] == seller_id) & (merged["order_status"] == "delivered")
-    ].copy()
-    if seller_data.empty:
-        return result
-
-    # 고객 좌표 매핑
-    cust = seller_data[["customer_zip_code_prefix", "customer_state",
-                         "order_id", "freight_value", "delivery_days", "is_late"]].copy()
-    cust["customer_zip_code_prefix"] = cust["customer_zip_code_prefix"].astype(int, errors="ignore")
-    cust = cust.merge(
-        geo, left_on="customer_zip_code_prefix",
-        right_on="geolocation_zip_code_prefix", how="inner",
-    )
-    if cust.empty:
+    # 일괄 테이블에 행이 없으면 거리를 아는 배송 완료 주문이 없는 셀러
+    tables = compute_all_seller_logistics()
+    if seller_code not in tables.sellers.index:
         return result
-
-    cust["distance_km"] = _haversine(slat, slng, cust["geolocation_lat"].values, cust["geolocation_lng"].values)
-
-    # 고객별 집계
-    customer_points = cust.groupby(["geolocation_lat", "geolocation_lng", "customer_state"]).agg(
+    row = tables.sellers.loc[seller_code]
+
+    # 고객별 집계 (지도용)
+    seller_rows = merged_by_seller().rows_for_code(seller_code)
+    cust = seller_rows.loc[
+        seller_rows["order_status"].eq("delivered") & seller_rows["distance_km"].notna(),
+        ["customer_lat", "customer_lng", "customer_state", "order_id",
+         "distance_km", "freight_value", "delivery_days"],
+    ]
+    customer_points = cust.groupby(
+        ["customer_lat", "customer_lng", "customer_state"], observed=True
+    ).agg(
         order_count=("order_id", "nunique"),
         distance_km=("distance_km", "mean"),
         freight=("freight_value", "mean"),
         delivery_days=("delivery_days", "mean"),
-    ).reset_index().rename(columns={"geolocation_lat": "lat", "geolocation_lng": "lng", "customer_state": "state"})
+    ).reset_index().rename(columns={"customer_lat": "lat", "customer_lng": "lng", "customer_state": "state"})
     result["customer_points"] = customer_points
 
     # 셀러 현재 평균
-    result["avg_distance"] = float(cust["distance_km"].mean())
-    result["avg_freight"] = float(cust["freight_value"].mean())
-    dd = cust["delivery_days"].dropna()
-    result["avg_delivery_days"] = float(dd.mean()) if len(dd) > 0 else 0.0
-    result["late_pct"] = float(cust["is_late"].mean()) if len(cust) > 0 else 0.0
+    for key in ["avg_distance", "avg_freight", "avg_delivery_days", "late_pct",
+                "freight_per_km", "days_per_km", "model_fallback_pct"]:
+        result[key] = float(row[key])
 
     # 플랫폼 평균 (시나리오 CSV에서)
     current_row = wh_scenarios[wh_scenarios["scenario"] == "현재(셀러직배)"]
@@ -125,22 +105,14 @@ def compute_seller_logistics(seller_id: str) -> dict:
         result["platform_avg_freight"] = float(current_row.iloc[0]["est_avg_freight"])
         result["platform_avg_delivery_days"] = float(current_row.iloc[0]["est_avg_days"])
 
-    # 각 창고까지의 셀러 거리 + 고객-창고 평균 거리
-    wh = wh_recs.copy()
-    wh["seller_to_wh_km"] = _haversine(slat, slng, wh["lat"].values, wh["lng"].values)
-
-    # 고객→각 창고 거리 계산
-    wh_avg_dists = []
-    for _, wrow in wh.iterrows():
-        dists = _haversine(
-            cust["geolocation_lat"].values, cust["geolocation_lng"].values,
-            wrow["lat"], wrow["lng"],
-        )
-        wh_avg_dists.append(float(np.mean(dists)))
-    wh["customer_to_wh_km"] = wh_avg_dists
+    # 창고별 셀러→창고·고객→창고 평균 거리 (셀러 기준 순위 순)
+    ranked = tables.seller_warehouse.loc[seller_code]
+    wh = ranked.merge(wh_recs, on="warehouse_id", how="left")
+    wh = wh[[*wh_recs.columns, "seller_to_wh_km", "customer_to_wh_km"]].astype(
+        {"seller_to_wh_km": "float64", "customer_to_wh_km": "float64"}
+    )
     wh["distance_reduction_km"] = result["avg_distance"] - wh["customer_to_wh_km"]
     wh["reduction_pct"] = (wh["distance_reduction_km"] / result["avg_distance"] * 100).round(1)
-    wh = wh.sort_values("customer_to_wh_km")
     result["warehouse_recs"] = wh
 
     # 최적 창고
@@ -156,81 +128,30 @@ def compute_seller_logistics(seller_id: str) -> dict:
         "reduction_pct": float(best["reduction_pct"]),
     }
 
-    # 시나리오 시뮬레이션 (현재 / 최근접1 / 3 / 5개)
-    # 선형 모델 계수 (warehouse EDA에서 도출)
-    freight_per_km = 0.0104
-    freight_intercept = 13.70
-    days_per_km = 0.00606
-    days_intercept = 8.64
-
-    sim = []
-    # 현재
-    sim.append({
+    # 시나리오 시뮬레이션 (현재 / 셀러 순위 상위 k개 창고 / 전체 창고)
+    # 운임·배송일은 데이터에서 적합한 거리 모델로 주문 행마다 추정해 평균한 값
+    sim = [{
         "scenario": "현재 (직배)",
+        "n_warehouses": 0,
         "avg_distance": result["avg_distance"],
         "est_freight": result["avg_freight"],
         "est_days": result["avg_delivery_days"],
-    })
-
-    # 최근접 1개 창고
-    best_wh_lat, best_wh_lng = best["lat"], best["lng"]
-    dists_1 = _haversine(
-        cust["geolocation_lat"].values, cust["geolocation_lng"].values,
-        best_wh_lat, best_wh_lng,
-    )
-    avg_1 = float(np.mean(dists_1))
-    sim.append({
-        "scenario": f"최근접 창고\n({best['nearest_city']}, {best['state']})",
-        "avg_distance": avg_1,
-        "est_freight": freight_per_km * avg_1 + freight_intercept,
-        "est_days": days_per_km * avg_1 + days_intercept,
-    })
-
-    # 3개 창고 (상위 3개 중 최근접)
-    top3_wh = wh.head(3)
-    dists_3 = np.column_stack([
-        _haversine(cust["geolocation_lat"].values, cust["geolocation_lng"].values,
-                   row["lat"], row["lng"])
-        for _, row in top3_wh.iterrows()
-    ])
-    avg_3 = float(np.mean(dists_3.min(axis=1)))
-    sim.append({
-        "scenario": "3개 창고 활용",
-        "avg_distance": avg_3,
-        "est_freight": freight_per_km * avg_3 + freight_intercept,
-        "est_days": days_per_km * avg_3 + days_intercept,
-    })
-
-    # 5개 창고 전체
-    dists_5 = np.column_stack([
-        _haversine(cust["geolocation_lat"].values, cust["geolocation_lng"].values,
-                   row["lat"], row["lng"])
-        for _, row in wh.iterrows()
-    ])
-    avg_5 = float(np.mean(dists_5.min(axis=1)))
-    sim.append({
-        "scenario": "5개 창고 활용",
-        "avg_distance": avg_5,
-        "est_freight": freight_per_km * avg_5 + freight_intercept,
-        "est_days": days_per_km * avg_5 + days_intercept,
-    })
+    }]
+    for k in tables.scenario_sizes:
+        if k == 1:
+            label = f"최근접 창고\n({best['nearest_city']}, {best['state']})"
+        else:
+            label = f"{k}개 창고 활용"
+        sim.append({
+            "scenario": label,
+            "n_warehouses": k,
+            "avg_distance": float(row[f"wh{k}_km"]),
+            "est_freight": float(row[f"wh{k}_freight"]),
+            "est_days": float(row[f"wh{k}_days"]),
+        })
     result["simulation"] = sim
 
-    # 권역별 효과 (5개 창고)
-    cust_with_region = cust.copy()
-    cust_with_region["region"] = cust_with_region["customer_state"].map(BRAZIL_REGIONS).fillna("Unknown")
-    dists_5_min = dists_5.min(axis=1)
-    cust_with_region["dist_wh5"] = dists_5_min
-    cust_with_region["dist_reduction"] = cust_with_region["distance_km"] - cust_with_region["dist_wh5"]
-
-    region_effect = cust_with_region.groupby("region").agg(
-        current_avg=("distance_km", "mean"),
-        wh5_avg=("dist_wh5", "mean"),
-        reduction=("dist_reduction", "mean"),
-        orders=("order_id", "nunique"),
-    ).reset_index()
-    region_effect["reduction_pct"] = (region_effect["reduction"] / region_effect["current_avg"] * 100).round(1)
-    region_effect = region_effect.sort_values("orders", ascending=False)
-    result["region_effect"] = region_effect
+    # 권역별 효과 (전체 창고)
+    result["region_effect"] = tables.region_effect.loc[[seller_code]].reset_index(drop=True)
 
     return result
@@ -6,12 +6,14 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
-from claude_eda.dashboard.data.loader import (
-    build_merged_table,
-    load_customers,
-    load_seller_clusters,
-    load_sellers,
-)
+from claude_eda.dashboard.config import PRICE_BANDS
+from claude_eda.dashboard.data.batch_growth import GROWTH_COLUMNS, market_grid, score_growth_regions
+from claude_eda.dashboard.data.category_incidence import category_incidence
+from claude_eda.dashboard.data.grouped_stats import DEFAULT_QUANTILES, grouped_stats, quantile_column
+from claude_eda.dashboard.data.loader import load_customers, load_sellers
+from claude_eda.dashboard.data.market_cube import market_cube
+from claude_eda.dashboard.data.memo import bounded_memo
+from claude_eda.dashboard.data.price_histogram import price_histograms, snap_price_edges
 
 
 @st.cache_data
@@ -21,20 +23,22 @@ def compute_regional_supply_demand() -> pd.DataFrame:
     sellers = load_sellers()
 
     cust_by_state = (
-        customers.groupby("customer_state")["customer_unique_id"]
+        customers.groupby("customer_state", observed=True)["customer_unique_id"]
         .nunique()
         .reset_index()
     )
     cust_by_state.columns = ["state", "customers"]
 
     seller_by_state = (
-        sellers.groupby("seller_state")["seller_id"]
+        sellers.groupby("seller_state", observed=True)["seller_id"]
         .nunique()
         .reset_index()
     )
     seller_by_state.columns = ["state", "sellers"]
 
-    df = cust_by_state.merge(seller_by_state, on="state", how="outer").fillna(0)
+    df = cust_by_state.merge(seller_by_state, on="state", how="outer").fillna(
+        {"customers": 0, "sellers": 0}
+    )
     df["sellers"] = df["sellers"].astype(int)
     df["customers"] = df["customers"].astype(int)
     df["ratio"] = df.apply(
@@ -58,73 +62,64 @@ def compute_regional_supply_demand() -> pd.DataFrame:
     return df.sort_values("ratio", ascending=False).reset_index(drop=True)
 
 
+def _price_stats(
+    by: list[str], mask: np.ndarray | None = None, quantiles=DEFAULT_QUANTILES
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """큐브 품목 가격의 그룹별 분위수·적률과 그룹 키 (행 순서 = 큐브 롤업)."""
+    items, keys = market_cube().item_frame(by, mask)
+    return grouped_stats(items["group"], items["price"], len(keys), quantiles), keys
+
+
 @st.cache_data
 def compute_category_state_matrix() -> pd.DataFrame:
     """카테고리 × 주(State) 매출/주문/셀러수/평균가격 매트릭스."""
-    merged = build_merged_table()
-    delivered = merged[merged["order_status"] == "delivered"]
-
-    matrix = (
-        delivered.groupby(["product_category_name_english", "seller_state"])
-        .agg(
-            revenue=("price", "sum"),
-            orders=("order_id", "nunique"),
-            sellers=("seller_id", "nunique"),
-            avg_price=("price", "mean"),
-            median_price=("price", "median"),
-        )
-        .reset_index()
-    )
-    matrix.columns = ["category", "state", "revenue", "orders", "sellers", "avg_price", "median_price"]
-    matrix["orders_per_seller"] = matrix.apply(
-        lambda r: r["orders"] / r["sellers"] if r["sellers"] > 0 else 0, axis=1
-    )
+    matrix = market_cube().rollup(["category", "seller_state"])
+    matrix["avg_price"] = matrix["revenue"] / matrix["items"]
+    matrix["median_price"] = _price_stats(["category", "seller_state"], quantiles=[0.5])[0]["p50"]
+    matrix = matrix.rename(columns={"seller_state": "state"})[
+        ["category", "state", "revenue", "orders", "sellers", "avg_price", "median_price"]
+    ]
+    sellers = matrix["sellers"].where(matrix["sellers"] > 0)
+    matrix["orders_per_seller"] = (matrix["orders"] / sellers).fillna(0.0)
     return matrix
 
 
 @st.cache_data
 def compute_category_price_stats() -> pd.DataFrame:
     """카테고리별 가격 통계 (전체 시장 기준)."""
-    merged = build_merged_table()
-    delivered = merged[merged["order_status"] == "delivered"]
-
-    stats = (
-        delivered.groupby("product_category_name_english")["price"]
-        .agg(["mean", "median", "std", "min", "max", "count"])
-        .reset_index()
-    )
-    stats.columns = ["category", "mean_price", "median_price", "std_price", "min_price", "max_price", "order_count"]
-
-    # 사분위수 추가
-    q25 = delivered.groupby("product_category_name_english")["price"].quantile(0.25).reset_index()
-    q25.columns = ["category", "p25"]
-    q75 = delivered.groupby("product_category_name_english")["price"].quantile(0.75).reset_index()
-    q75.columns = ["category", "p75"]
-
-    stats = stats.merge(q25, on="category").merge(q75, on="category")
+    stats, keys = _price_stats(["category"])
+    stats = pd.DataFrame({
+        "category": keys["category"],
+        "mean_price": stats["mean"],
+        "median_price": stats["p50"],
+        "std_price": stats["std"],
+        "min_price": stats["min"],
+        "max_price": stats["max"],
+        "order_count": stats["count"],
+        **{col: stats[col] for col in map(quantile_column, DEFAULT_QUANTILES) if col != "p50"},
+    })
     return stats.sort_values("order_count", ascending=False).reset_index(drop=True)
 
 
 @st.cache_data
 def compute_category_price_by_state(category: str) -> pd.DataFrame:
     """특정 카테고리의 주(State)별 가격 통계."""
-    merged = build_merged_table()
-    cat_data = merged[
-        (merged["product_category_name_english"] == category)
-        & (merged["order_status"] == "delivered")
-    ]
-    if cat_data.empty:
+    cube = market_cube()
+    mask = cube.where(category=category)
+    if not mask.any():
         return pd.DataFrame()
 
-    stats = (
-        cat_data.groupby("customer_state")["price"]
-        .agg(["mean", "median", "count"])
-        .reset_index()
-    )
-    stats.columns = ["state", "avg_price", "median_price", "orders"]
+    stats = cube.rollup(["customer_state"], mask)
+    stats = pd.DataFrame({
+        "state": stats["customer_state"],
+        "avg_price": stats["revenue"] / stats["items"],
+        "median_price": _price_stats(["customer_state"], mask, [0.5])[0]["p50"],
+        "orders": stats["items"],
+    })
     return stats.sort_values("orders", ascending=False).reset_index(drop=True)
 
 
+@bounded_memo
 def compute_seller_growth_regions(
     seller_id: str,
     seller_categories: list[str],
@@ -138,142 +133,86 @@ def compute_seller_growth_regions(
             competitors, orders_per_seller, avg_price, avg_delivery_risk,
             reason
     """
-    regional_sd = compute_regional_supply_demand()
-    cat_state = compute_category_state_matrix()
-
-    # 셀러의 카테고리에 해당하는 지역별 데이터
     if not seller_categories:
         return []
 
-    cat_filtered = cat_state[cat_state["category"].isin(seller_categories)]
-    if cat_filtered.empty:
-        return []
-
-    # 지역별 집계 (셀러의 카테고리 기준)
-    region_agg = (
-        cat_filtered.groupby("state")
-        .agg(
-            market_revenue=("revenue", "sum"),
-            market_orders=("orders", "sum"),
-            competitors=("sellers", "sum"),
-            avg_price=("avg_price", "mean"),
-        )
-        .reset_index()
-    )
-
-    # 수급 비율 조인
-    region_agg = region_agg.merge(
-        regional_sd[["state", "customers", "ratio", "opportunity_grade"]],
-        on="state",
-        how="left",
-    )
-
-    # 기회 점수 계산
-    # = (수급비율 정규화 × 0.4) + (시장매출 정규화 × 0.3) + (셀러당 주문 정규화 × 0.3)
-    region_agg["orders_per_seller"] = region_agg.apply(
-        lambda r: r["market_orders"] / r["competitors"] if r["competitors"] > 0 else r["market_orders"],
-        axis=1,
-    )
-
-    def _normalize(series):
-        mn, mx = series.min(), series.max()
-        if mx == mn:
-            return pd.Series([50.0] * len(series), index=series.index)
-        return (series - mn) / (mx - mn) * 100
+    # 전체 셀러 일괄 추천(batch_growth)과 같은 행렬 점수 — 선택 행렬 한 행
+    grid = market_grid()
+    table = score_growth_regions(grid, grid.selection([seller_categories]), [seller_state])
+    return table[GROWTH_COLUMNS].to_dict("records")
 
-    region_agg["score_ratio"] = _normalize(region_agg["ratio"].fillna(0))
-    region_agg["score_revenue"] = _normalize(region_agg["market_revenue"])
-    region_agg["score_ops"] = _normalize(region_agg["orders_per_seller"])
 
-    region_agg["opportunity_score"] = (
-        region_agg["score_ratio"] * 0.4
-        + region_agg["score_revenue"] * 0.3
-        + region_agg["score_ops"] * 0.3
-    ).round(1)
+def _price_label(value: float) -> str:
+    return f"{value:,.0f}" if value >= 10 else f"{value:g}"
 
-    # 셀러 자기 주(State) 제외 + 상위 5개
-    region_agg = region_agg[region_agg["state"] != seller_state]
-    top5 = region_agg.sort_values("opportunity_score", ascending=False).head(5)
 
-    results = []
-    for _, r in top5.iterrows():
-        # 추천 이유 생성
-        reasons = []
-        if r["ratio"] >= 100:
-            reasons.append(f"고객/셀러 비율 {r['ratio']:.0f}:1 (공급 부족)")
-        if r["orders_per_seller"] >= 30:
-            reasons.append(f"셀러당 주문 {r['orders_per_seller']:.0f}건 (높은 수요)")
-        if r["market_revenue"] >= 50000:
-            reasons.append(f"시장 규모 R${r['market_revenue']:,.0f}")
-        if not reasons:
-            reasons.append("성장 잠재력 있음")
-
-        results.append({
-            "state": r["state"],
-            "opportunity_score": r["opportunity_score"],
-            "opportunity_grade": r.get("opportunity_grade", ""),
-            "market_revenue": r["market_revenue"],
-            "market_orders": int(r["market_orders"]),
-            "competitors": int(r["competitors"]),
-            "orders_per_seller": r["orders_per_seller"],
-            "avg_price": r["avg_price"],
-            "customers": int(r.get("customers", 0)),
-            "reason": " / ".join(reasons),
-        })
+def custom_price_bands(edges: list[float]) -> list[tuple[float, float, str]]:
+    """가격 경계 목록 → 연속 가격대 (0부터 상한 없음까지).
 
-    return results
+    경계는 가격 히스토그램 눈금(유효숫자 2자리)으로 맞춘 뒤 라벨을 만들므로, 라벨과 집계
+    구간이 같다 (예: 125 → R$130).
+    """
+    top = float(PRICE_BANDS[-1][1])
+    inside = [float(e) for e in edges if 0 < e < top]
+    cuts = sorted({float(e) for e in snap_price_edges(inside) if 0 < e < top})
+    bounds = [0.0, *cuts, top]
+    return [
+        (
+            low, high,
+            f"R${_price_label(low)}-{_price_label(high)}" if i < len(bounds) - 2
+            else f"R${_price_label(low)}+",
+        )
+        for i, (low, high) in enumerate(zip(bounds[:-1], bounds[1:]))
+    ]
 
 
-def compute_price_simulation(category: str, state: str) -> list[dict]:
+@bounded_memo
+def compute_price_simulation(
+    category: str,
+    state: str,
+    bands: list[tuple[float, float, str]] | None = None,
+) -> list[dict]:
     """특정 카테고리+지역에서 가격대별 매출 시뮬레이션.
 
+    bands: (하한, 상한, 라벨) 목록. 없으면 ``PRICE_BANDS``. 경계는 가격 히스토그램 눈금
+    (유효숫자 2자리 값) 위에 있어야 정확하다 — ``custom_price_bands``가 미리 맞춘다.
+
     Returns:
         list of dicts with keys:
             price_range, label, order_share, avg_price,
             estimated_monthly_orders, estimated_monthly_revenue
     """
-    merged = build_merged_table()
-    cat_data = merged[
-        (merged["product_category_name_english"] == category)
-        & (merged["order_status"] == "delivered")
-    ]
-
-    if cat_data.empty:
+    bands = PRICE_BANDS if bands is None else bands
+    hist = price_histograms()
+    cat_hists = hist.select(category)
+    if cat_hists.start == cat_hists.stop:
         return []
 
-    # 전체 카테고리 데이터에서 가격대별 분포
-    total_orders = cat_data["order_id"].nunique()
-
     # 데이터 기간 (월 수)
-    dates = cat_data["order_purchase_timestamp"].dropna()
-    if dates.empty:
+    first, last = hist.span(cat_hists)
+    if pd.isna(first):
         return []
-    months = max(1, (dates.max() - dates.min()).days / 30)
+    months = max(1, (last - first).days / 30)
 
     # 해당 지역 데이터
-    state_data = cat_data[cat_data["customer_state"] == state] if state else cat_data
-    state_orders = state_data["order_id"].nunique()
+    state_hists = hist.select(category, state)
+    state_orders = int(hist.band_totals(state_hists, [(0, np.inf)])["orders"][0])
     monthly_orders = state_orders / months if months > 0 else 0
-
-    bins = [
-        (0, 30, "저가 (R$0-30)"),
-        (30, 100, "볼륨존 (R$30-100)"),
-        (100, 200, "프리미엄 (R$100-200)"),
-        (200, 50000, "고가 (R$200+)"),
-    ]
+    totals = hist.band_totals(state_hists, bands)
 
     results = []
-    for low, high, label in bins:
-        segment = state_data[(state_data["price"] >= low) & (state_data["price"] < high)]
-        seg_orders = segment["order_id"].nunique()
-        share = seg_orders / state_orders if state_orders > 0 else 0
-        avg_p = float(segment["price"].mean()) if not segment.empty else (low + high) / 2
+    for (low, high, label), items, revenue, orders in zip(
+        bands, totals["items"], totals["revenue"], totals["orders"]
+    ):
+        share = orders / state_orders if state_orders > 0 else 0
+        fallback = (low + high) / 2 if np.isfinite(high) else low
+        avg_p = float(revenue / items) if items > 0 else fallback
 
         est_monthly = monthly_orders * share
         est_revenue = est_monthly * avg_p
 
         results.append({
-            "price_range": f"R${low}-{high}" if high < 50000 else f"R${low}+",
+            "price_range": f"R${low:g}-{high:g}" if high < 50000 else f"R${low:g}+",
             "label": label,
             "order_share": share,
             "avg_price": avg_p,
@@ -284,40 +223,46 @@ def compute_price_simulation(category: str, state: str) -> list[dict]:
     return results
 
 
+@bounded_memo
 def compute_cross_sell_categories(seller_categories: list[str]) -> pd.DataFrame:
-    """셀러의 카테고리와 함께 판매되는 다른 카테고리 추천."""
-    merged = build_merged_table()
-    cluster_df = load_seller_clusters()
-
-    # 같은 카테고리를 판매하는 다른 셀러들
-    sellers_in_cat = merged[
-        merged["product_category_name_english"].isin(seller_categories)
-    ]["seller_id"].unique()
-
-    # 그 셀러들이 판매하는 다른 카테고리
-    other_cats = merged[
-        (merged["seller_id"].isin(sellers_in_cat))
-        & (~merged["product_category_name_english"].isin(seller_categories))
-    ]
+    """셀러의 카테고리와 함께 판매되는 다른 카테고리 추천.
 
-    if other_cats.empty:
+    같은 카테고리를 판매하는 다른 셀러들이 함께 파는 카테고리를 채택률 순으로 반환한다.
+    lift = 채택률 / 전체 셀러 중 해당 카테고리 판매 셀러 비율.
+    """
+    incidence = category_incidence()
+    own = incidence.category_positions(seller_categories)
+    selected = incidence.sellers_in(own)
+    n_selected = int(selected.sum())
+    if n_selected == 0:
         return pd.DataFrame()
 
-    cross = (
-        other_cats.groupby("product_category_name_english")
-        .agg(
-            sellers=("seller_id", "nunique"),
-            revenue=("price", "sum"),
-            avg_price=("price", "mean"),
-            orders=("order_id", "nunique"),
-        )
-        .reset_index()
-    )
-    cross.columns = ["category", "sellers", "revenue", "avg_price", "orders"]
-    cross["adoption_rate"] = cross["sellers"] / len(sellers_in_cat)
-    cross = cross[cross["adoption_rate"] >= 0.05]  # 5% 이상 채택된 카테고리만
+    totals = incidence.totals(selected)
+    adoption_rate = totals["sellers"] / n_selected
+    candidate = (totals["sellers"] > 0) & (adoption_rate >= 0.05)  # 5% 이상 채택된 카테고리만
+    candidate[own] = False
+    top = np.flatnonzero(candidate)
+    top = top[np.argsort(-adoption_rate[top], kind="stable")[:10]]
+    if not len(top):
+        return pd.DataFrame()
 
-    return cross.sort_values("adoption_rate", ascending=False).head(10).reset_index(drop=True)
+    base_rate = incidence.sellers_per_category()[top] / len(incidence.seller_codes)
+    return pd.DataFrame({
+        "category": incidence.categories[top],
+        "sellers": totals["sellers"][top],
+        "revenue": totals["revenue"][top],
+        "avg_price": totals["revenue"][top] / totals["items"][top],
+        "orders": totals["orders"][top],
+        "adoption_rate": adoption_rate[top],
+        "lift": adoption_rate[top] / base_rate,
+    })
+
+
+@st.cache_data
+def compute_category_lift(min_sellers: int = 5) -> pd.DataFrame:
+    """플랫폼 전체 카테고리 쌍별 리프트 (동시 판매 셀러 min_sellers명 이상, 리프트 내림차순)."""
+    lift = category_incidence().lift(min_sellers)
+    return lift.sort_values(["lift", "sellers_both"], ascending=False).reset_index(drop=True)
 
 
 @st.cache_data
@@ -337,7 +282,7 @@ def compute_category_opportunity_for_seller(
 
     # 지역별 집계
     opp = (
-        untapped.groupby("category")
+        untapped.groupby("category", observed=True)
         .agg(
             total_revenue=("revenue", "sum"),
             total_orders=("orders", "sum"),
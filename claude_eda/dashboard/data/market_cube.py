@@ -0,0 +1,201 @@
+"""시장 분석용 카테고리 × 고객 주 × 셀러 주 × 월 집계 큐브.
+
+배송 완료 주문 품목을 (카테고리, 고객 주, 셀러 주, 주문 월) 셀로 한 번 묶어 두고,
+시장 분석 함수는 병합 테이블을 다시 필터링·그룹핑하지 않고 셀을 롤업한다.
+
+- 셀 측정값: 매출(가격 합), 품목 수, 가격 제곱합, 최소·최대 가격, 첫·마지막 주문 시각.
+  모두 셀끼리 합/최소/최대로 병합할 수 있어 평균·표준편차·기간도 롤업으로 구한다.
+- 고유 주문·셀러 수는 그대로 합산할 수 없으므로 셀별 고유 수와, 여러 셀에 걸친 코드만 담은
+  셀별 집합(``DistinctSets``)을 둔다. 롤업은 고유 수를 더하고 선택된 셀의 공유 코드만 정렬해
+  중복을 빼므로 근사 없이 정확하고, 품목 목록은 훑지 않는다 (비용: 셀 수 + 공유 코드 M개에
+  대해 O(M log M)).
+- 중앙값·분위수 같은 비가산 통계는 셀별 품목 목록(가격 오름차순, 주문·셀러 코드)의 가격으로
+  계산한다.
+
+카테고리·주가 결측인 품목도 셀에 남는다. 롤업 기준 차원이 결측인 셀은 pandas
+``groupby``와 같이 결과에서 빠진다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.loader import build_merged_table
+
+# 큐브 차원 → 병합 테이블 컬럼
+CUBE_DIMENSIONS = {
+    "category": "product_category_name_english",
+    "customer_state": "customer_state",
+    "seller_state": "seller_state",
+    "month": "order_month",
+}
+
+
+def _segments(offsets: np.ndarray, cells: np.ndarray) -> np.ndarray:
+    """구간 경계 offsets에서 cells(셀 번호 배열) 구간의 원소 위치를 차례로 이어 붙인 배열."""
+    lengths = offsets[cells + 1] - offsets[cells]
+    shift = offsets[cells] - (np.cumsum(lengths) - lengths)
+    return np.repeat(shift, lengths) + np.arange(lengths.sum())
+
+
+@dataclass(frozen=True)
+class DistinctSets:
+    """셀별 고유 코드 수 + 여러 셀에 걸친 코드만 담은 셀별 집합 (병합 가능한 고유 수 요약).
+
+    sizes: 셀별 고유 코드 수.
+    shared / offsets: 셀 i에 있으면서 다른 셀에도 있는 코드 = ``shared[offsets[i]:offsets[i + 1]]``.
+    셀 묶음의 고유 수 = 셀별 고유 수 합 − 묶음 안에서 중복된 공유 코드 수이므로, 병합은 공유 코드만
+    정렬한다 (주문은 대부분 한 셀에만 있어 공유 목록이 작다).
+    """
+
+    sizes: np.ndarray
+    shared: np.ndarray
+    offsets: np.ndarray
+
+    @classmethod
+    def build(cls, cell: np.ndarray, codes: np.ndarray, n_cells: int) -> DistinctSets:
+        order = np.lexsort((codes, cell))
+        cell, codes = cell[order], codes[order]
+        first = np.ones(len(codes), dtype=bool)
+        first[1:] = (cell[1:] != cell[:-1]) | (codes[1:] != codes[:-1])
+        cell, codes = cell[first], codes[first].astype(np.int64)
+        _, code_id, n_cells_per_code = np.unique(codes, return_inverse=True, return_counts=True)
+        keep = n_cells_per_code[code_id] > 1
+        sizes = np.bincount(cell, minlength=n_cells)
+        offsets = np.searchsorted(cell[keep], np.arange(n_cells + 1))
+        shared = codes[keep]
+        for arr in (sizes, shared, offsets):
+            arr.flags.writeable = False
+        return cls(sizes, shared, offsets)
+
+    def count(self, cells: np.ndarray, cell_group: np.ndarray, n_groups: int) -> np.ndarray:
+        """선택된 셀(cells)을 셀 그룹(cell_group)별로 합친 고유 코드 수."""
+        group = cell_group[cells]
+        counts = np.bincount(group, weights=self.sizes[cells], minlength=n_groups).astype(np.int64)
+        pos = _segments(self.offsets, cells)
+        if len(pos):
+            code_group = np.repeat(group.astype(np.int64), np.diff(self.offsets)[cells])
+            base = np.int64(self.shared.max()) + 2
+            pairs = np.sort(code_group * base + self.shared[pos] + 1)
+            dup = np.zeros(len(pairs), dtype=bool)
+            dup[1:] = pairs[1:] == pairs[:-1]
+            counts -= np.bincount((pairs[dup] // base).astype(np.intp), minlength=n_groups)
+        return counts
+
+
+@dataclass(frozen=True)
+class MarketCube:
+    """배송 완료 품목 집계 큐브 (읽기 전용 공유).
+
+    cells: 행 번호 = 셀 번호. 차원 컬럼 + revenue / items / price_sq / price_min /
+        price_max / first_purchase / last_purchase.
+    items: 셀 순서로 이어 붙인 품목 목록 (price / order_id / seller_id, 셀 안에서는 가격 순).
+    offsets: 셀 i의 품목 = ``items[offsets[i]:offsets[i + 1]]``.
+    order_sets / seller_sets: 셀별 고유 주문·셀러 수 요약.
+    """
+
+    cells: pd.DataFrame
+    items: pd.DataFrame
+    offsets: np.ndarray
+    order_sets: DistinctSets
+    seller_sets: DistinctSets
+
+    def where(self, **filters) -> np.ndarray:
+        """차원 = 값 조건을 모두 만족하는 셀 마스크 (예: ``where(category="toys")``)."""
+        mask = np.ones(len(self.cells), dtype=bool)
+        for dim, value in filters.items():
+            mask &= self.cells[dim].eq(value).to_numpy()
+        return mask
+
+    def _cell_groups(self, by: list[str], mask: np.ndarray | None) -> tuple[np.ndarray, pd.DataFrame]:
+        """셀별 그룹 번호 (제외 셀은 -1)와 그룹 키 테이블."""
+        rows = np.arange(len(self.cells)) if mask is None else np.flatnonzero(mask)
+        group = np.full(len(self.cells), -1, dtype=np.intp)
+        if not by:
+            group[rows] = 0
+            return group, pd.DataFrame(index=range(1 if len(rows) else 0))
+        keys = self.cells[by].iloc[rows]
+        group[rows] = keys.groupby(by, observed=True).ngroup().fillna(-1).to_numpy(dtype=np.intp)
+        first = np.unique(group[rows], return_index=True)[1]
+        first = first[group[rows][first] >= 0]
+        return group, keys.iloc[first].reset_index(drop=True)
+
+    def rollup(self, by: list[str], mask: np.ndarray | None = None) -> pd.DataFrame:
+        """by 차원별 롤업 — 셀 측정값 병합 + 고유 주문(orders)·셀러(sellers) 수.
+
+        mask로 셀을 먼저 거를 수 있다. by가 비면 선택된 셀 전체가 한 행이 된다.
+        """
+        cell_group, keys = self._cell_groups(by, mask)
+        n = len(keys)
+        # 선택된 셀을 그룹 순으로 한 번 정렬 → 그룹별 병합은 reduceat
+        order = np.flatnonzero(cell_group >= 0)
+        order = order[np.argsort(cell_group[order], kind="stable")]
+        starts = np.searchsorted(cell_group[order], np.arange(n))
+
+        def merge(col, ufunc, dtype=np.float64):
+            values = self.cells[col].to_numpy()[order].astype(dtype, copy=False)
+            return ufunc.reduceat(values, starts) if n else np.empty(0, dtype=dtype)
+
+        measures = {
+            "revenue": merge("revenue", np.add),
+            "items": merge("items", np.add, np.int64),
+            "price_sq": merge("price_sq", np.add),
+            "price_min": merge("price_min", np.minimum),
+            "price_max": merge("price_max", np.maximum),
+            "first_purchase": merge("first_purchase", np.fmin, "datetime64[ns]"),
+            "last_purchase": merge("last_purchase", np.fmax, "datetime64[ns]"),
+            "orders": self.order_sets.count(order, cell_group, n),
+            "sellers": self.seller_sets.count(order, cell_group, n),
+        }
+        return pd.concat([keys, pd.DataFrame(measures)], axis=1)
+
+    def item_frame(self, by: list[str], mask: np.ndarray | None = None) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """선택된 셀의 품목 목록 (+ ``group`` 컬럼 = 롤업 행 번호)과 그룹 키 테이블."""
+        cell_group, keys = self._cell_groups(by, mask)
+        cells = np.flatnonzero(cell_group >= 0)
+        keep = _segments(self.offsets, cells)
+        items = {col: self.items[col].to_numpy()[keep] for col in self.items.columns}
+        group = np.repeat(cell_group[cells], np.diff(self.offsets)[cells])
+        return pd.DataFrame({**items, "group": group}), keys
+
+
+@st.cache_resource
+def market_cube() -> MarketCube:
+    """배송 완료 주문 품목 전체의 시장 큐브."""
+    merged = build_merged_table()
+    delivered = merged.loc[
+        merged["order_status"].eq("delivered"),
+        [*CUBE_DIMENSIONS.values(), "price", "order_id", "seller_id", "order_purchase_timestamp"],
+    ].rename(columns={src: dim for dim, src in CUBE_DIMENSIONS.items()})
+    dims = list(CUBE_DIMENSIONS)
+
+    grouped = delivered.assign(price_sq=delivered["price"] ** 2).groupby(
+        dims, observed=True, dropna=False, sort=True
+    )
+    cells = grouped.agg(
+        revenue=("price", "sum"),
+        items=("price", "size"),
+        price_sq=("price_sq", "sum"),
+        price_min=("price", "min"),
+        price_max=("price", "max"),
+        first_purchase=("order_purchase_timestamp", "min"),
+        last_purchase=("order_purchase_timestamp", "max"),
+    ).reset_index()
+
+    cell = grouped.ngroup().to_numpy(dtype=np.intp)
+    order = np.lexsort((delivered["price"].to_numpy(), cell))
+    items = delivered[["price", "order_id", "seller_id"]].iloc[order].reset_index(drop=True)
+    offsets = np.searchsorted(cell[order], np.arange(len(cells) + 1))
+    offsets.flags.writeable = False
+    return MarketCube(
+        cells=freeze_frame(cells),
+        items=freeze_frame(items),
+        offsets=offsets,
+        order_sets=DistinctSets.build(cell, delivered["order_id"].to_numpy(), len(cells)),
+        seller_sets=DistinctSets.build(cell, delivered["seller_id"].to_numpy(), len(cells)),
+    )
@@ -0,0 +1,278 @@
+"""셀러별 분석 함수용 메모리 상한 LRU 메모이제이션.
+
+``compute_seller_delivery``처럼 셀러·(카테고리, 주) 단위로 호출되는 분석 함수는 위젯
+상호작용마다 다시 실행된다. ``@bounded_memo``는 함수별로 항목 수·TTL·추정 메모리 상한을
+두는 LRU 캐시를 붙이고, 적중/실패/축출 횟수를 센다. ``@st.cache_data`` 기본값처럼 무제한
+으로 쌓이지 않으므로 동시 사용자가 많아도 메모리가 한도 안에 머문다.
+
+- 키: 인자(리스트는 튜플로 변환). 원본 데이터 파일의 식별자(dataset_version)가 바뀌면
+  해당 함수의 캐시 전체를 비운다. 분석 함수가 읽는 기본 테이블도 ``st.cache_resource`` /
+  ``st.cache_data``에 있으므로, 식별자 변경을 처음 확인한 호출이 스트림릿 캐시도 모두
+  비운다 (app.py는 매 실행 시작에 확인한다).
+- 값: 세션 간 공유되므로 ``st.cache_data``처럼 호출마다 깊은 복사본을 반환한다.
+- 크기: DataFrame/Series는 ``memory_usage(deep=True)``, 컨테이너는 재귀 합산 추정치.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.config import (
+    CATEGORY_TRANSLATION_PATH,
+    CUSTOMER_CLUSTER_DATA_PATH,
+    CUSTOMERS_PATH,
+    GEOLOCATION_PATH,
+    INVENTORY_DATA_DIR,
+    MEMO_MAX_BYTES,
+    MEMO_MAX_ENTRIES,
+    MEMO_TTL_SECONDS,
+    MEMO_VERSION_CHECK_SECONDS,
+    ORDER_ITEMS_PATH,
+    ORDERS_PATH,
+    PAYMENTS_PATH,
+    PRODUCT_CLUSTER_DATA_PATH,
+    PRODUCT_CLUSTER_STATS_PATH,
+    PRODUCT_NAME_MAPPING_PATH,
+    PRODUCTS_PATH,
+    REVIEW_ANNOTATIONS_DIR,
+    REVIEWS_PATH,
+    SELLER_CLUSTER_DATA_PATH,
+    SELLER_CLUSTER_STATS_PATH,
+    SELLER_NAME_MAPPING_PATH,
+    SELLERS_PATH,
+    WAREHOUSE_RECOMMENDATIONS_PATH,
+    WAREHOUSE_SCENARIO_PATH,
+    WAREHOUSE_STATE_GAP_PATH,
+)
+from claude_eda.dashboard.data.columnar_cache import source_fingerprint
+
+# 대시보드가 읽는 입력 파일 전체 (loader.py / inventory_loader.py)
+DATASET_PATHS = [
+    ORDER_ITEMS_PATH,
+    ORDERS_PATH,
+    REVIEWS_PATH,
+    SELLERS_PATH,
+    PRODUCTS_PATH,
+    CUSTOMERS_PATH,
+    PAYMENTS_PATH,
+    GEOLOCATION_PATH,
+    CATEGORY_TRANSLATION_PATH,
+    SELLER_CLUSTER_DATA_PATH,
+    SELLER_CLUSTER_STATS_PATH,
+    PRODUCT_CLUSTER_DATA_PATH,
+    PRODUCT_CLUSTER_STATS_PATH,
+    CUSTOMER_CLUSTER_DATA_PATH,
+    SELLER_NAME_MAPPING_PATH,
+    PRODUCT_NAME_MAPPING_PATH,
+    WAREHOUSE_RECOMMENDATIONS_PATH,
+    WAREHOUSE_SCENARIO_PATH,
+    WAREHOUSE_STATE_GAP_PATH,
+]
+# 파일 이름이 바뀌는 입력 (디렉터리, 패턴)
+DATASET_GLOBS = [
+    (INVENTORY_DATA_DIR, "*.csv"),
+    (REVIEW_ANNOTATIONS_DIR, "review_annotations.*.parquet"),
+]
+
+
+_version_lock = threading.Lock()
+_version_state: dict = {"checked_at": float("-inf"), "version": ""}
+
+
+def _compute_dataset_version() -> str:
+    globbed = [p for directory, pattern in DATASET_GLOBS for p in sorted(directory.glob(pattern))]
+    paths = [*DATASET_PATHS, *globbed]
+    key = "|".join(source_fingerprint(p) if p.exists() else f"{p}:missing" for p in paths)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+
+
+def invalidate_dataset_caches() -> None:
+    """원본 데이터 변경 — 스트림릿 캐시(기본 테이블·일괄 테이블)를 모두 비운다.
+
+    메모이제이션은 다음 호출에서 식별자를 비교해 스스로 비운다 (invalidations 통계).
+    """
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+
+def dataset_version(max_age: float = MEMO_VERSION_CHECK_SECONDS) -> str:
+    """원본 데이터 파일(경로 + 크기 + mtime) 전체의 식별자.
+
+    파일 stat은 호출마다 하지 않고 max_age초마다 다시 확인한다. 이전에 확인한 식별자와
+    달라졌으면 ``invalidate_dataset_caches``를 호출한다.
+    """
+    now = time.monotonic()
+    changed = False
+    with _version_lock:
+        if now - _version_state["checked_at"] >= max_age:
+            previous = _version_state["version"]
+            _version_state["version"] = _compute_dataset_version()
+            _version_state["checked_at"] = now
+            changed = bool(previous) and previous != _version_state["version"]
+        version = _version_state["version"]
+    if changed:
+        invalidate_dataset_caches()
+    return version
+
+
+def estimate_bytes(obj) -> int:
+    """캐시 값의 메모리 추정치 (바이트)."""
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, pd.Series):
+        return int(obj.memory_usage(deep=True))
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_bytes(k) + estimate_bytes(v) for k, v in obj.items()
+        )
+    if isinstance(obj, (list, tuple, set)):
+        return sys.getsizeof(obj) + sum(estimate_bytes(v) for v in obj)
+    return sys.getsizeof(obj)
+
+
+def _freeze_arg(value):
+    """리스트/딕셔너리 인자를 해시 가능한 키로."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_arg(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_arg(v)) for k, v in value.items()))
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+@dataclass
+class _Entry:
+    value: object
+    nbytes: int
+    created: float
+
+
+@dataclass
+class MemoStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    nbytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class BoundedMemo:
+    """함수 하나의 LRU 캐시 (스레드 안전)."""
+
+    def __init__(self, fn, max_entries: int, ttl: float | None, max_bytes: int):
+        functools.update_wrapper(self, fn)
+        self._fn = fn
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict = OrderedDict()
+        self._version: str | None = None
+        self._stats = MemoStats()
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        key = (_freeze_arg(args), _freeze_arg(kwargs))
+        version = dataset_version()
+        now = time.monotonic()
+
+        with self._lock:
+            if version != self._version:
+                if self._entries:
+                    self._stats.invalidations += 1
+                self._clear_locked()
+                self._version = version
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and now - entry.created > self.ttl:
+                self._drop_locked(key)
+                self._stats.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                return copy.deepcopy(entry.value)
+            self._stats.misses += 1
+
+        value = self._fn(*args, **kwargs)
+        nbytes = estimate_bytes(value)
+        if nbytes <= self.max_bytes:
+            with self._lock:
+                if version == self._version:
+                    self._store_locked(key, _Entry(value, nbytes, now))
+        return copy.deepcopy(value)
+
+    def _store_locked(self, key, entry: _Entry) -> None:
+        if key in self._entries:
+            self._drop_locked(key)
+        self._entries[key] = entry
+        self._stats.nbytes += entry.nbytes
+        while len(self._entries) > self.max_entries or self._stats.nbytes > self.max_bytes:
+            self._drop_locked(next(iter(self._entries)))
+            self._stats.evictions += 1
+
+    def _drop_locked(self, key) -> None:
+        self._stats.nbytes -= self._entries.pop(key).nbytes
+
+    def _clear_locked(self) -> None:
+        self._entries.clear()
+        self._stats.nbytes = 0
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._clear_locked()
+
+    def cache_info(self) -> MemoStats:
+        """현재 통계 스냅샷."""
+        with self._lock:
+            return MemoStats(**{**self._stats.__dict__, "entries": len(self._entries)})
+
+
+_REGISTRY: dict[str, BoundedMemo] = {}
+
+
+def bounded_memo(
+    fn=None,
+    *,
+    max_entries: int = MEMO_MAX_ENTRIES,
+    ttl: float | None = MEMO_TTL_SECONDS,
+    max_bytes: int = MEMO_MAX_BYTES,
+):
+    """``@bounded_memo`` 또는 ``@bounded_memo(max_entries=..., ttl=..., max_bytes=...)``."""
+
+    def decorate(f):
+        memo = BoundedMemo(f, max_entries, ttl, max_bytes)
+        _REGISTRY[f"{f.__module__}.{f.__qualname__}"] = memo
+        return memo
+
+    return decorate(fn) if fn is not None else decorate
+
+
+def memo_stats() -> dict[str, MemoStats]:
+    """메모이제이션된 함수별 통계."""
+    return {name: memo.cache_info() for name, memo in _REGISTRY.items()}
+
+
+def clear_memos() -> None:
+    """모든 메모이제이션 캐시 비우기."""
+    for memo in _REGISTRY.values():
+        memo.cache_clear()
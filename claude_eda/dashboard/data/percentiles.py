@@ -0,0 +1,118 @@
+"""셀러 지표 퍼센타일 서비스.
+
+지표별로 정렬된 값 배열을 한 번 만들어 두고 ``np.searchsorted``로 "상위 X%"를 구한다.
+셀러 수가 늘어도 조회 비용은 O(log n)이다. 같은 클러스터·같은 주 셀러끼리 비교하는
+동료 그룹(peer group) 퍼센타일은 그룹별로 미리 정렬한 배열을 사용한다.
+
+정의는 기존 계산과 같다.
+- 높을수록 좋은 지표: 값이 나보다 크거나 같은 셀러 비율
+- 낮을수록 좋은 지표: 값이 나보다 작거나 같은 셀러 비율
+- 분모는 결측 지표를 가진 셀러까지 포함한 그룹 전체 셀러 수
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.loader import load_seller_clusters
+
+HIGHER_BETTER_METRICS = [
+    "total_orders",
+    "total_revenue",
+    "avg_price",
+    "product_variety",
+    "avg_review",
+    "unique_customers",
+    "items_per_order",
+]
+LOWER_BETTER_METRICS = ["low_review_pct", "avg_delivery_days", "late_delivery_pct"]
+
+# 동료 그룹 이름 → 셀러 클러스터 데이터의 그룹 컬럼
+PEER_GROUP_COLUMNS = {"cluster": "cluster", "state": "seller_state"}
+
+
+@dataclass
+class _SortedMetric:
+    """한 그룹의 지표 값 (결측 제외, 오름차순) + 결측 포함 셀러 수."""
+
+    values: np.ndarray
+    total: int
+
+    @classmethod
+    def from_series(cls, s: pd.Series) -> _SortedMetric:
+        values = s.to_numpy(dtype="float64")
+        return cls(values=np.sort(values[~np.isnan(values)]), total=len(values))
+
+    def share_at_least(self, value: float) -> float:
+        return (len(self.values) - np.searchsorted(self.values, value, side="left")) / self.total
+
+    def share_at_most(self, value: float) -> float:
+        return np.searchsorted(self.values, value, side="right") / self.total
+
+
+@dataclass
+class PercentileIndex:
+    """지표별 정렬 배열 — 전체 및 동료 그룹별."""
+
+    metrics: dict[str, _SortedMetric] = field(default_factory=dict)
+    # 동료 그룹 이름 → 그룹 값 → 지표 → 정렬 배열
+    groups: dict[str, dict] = field(default_factory=dict)
+
+    @classmethod
+    def build(
+        cls, df: pd.DataFrame, metric_cols: list[str], group_cols: dict[str, str]
+    ) -> PercentileIndex:
+        cols = [c for c in metric_cols if c in df.columns]
+        index = cls(metrics={c: _SortedMetric.from_series(df[c]) for c in cols})
+        for peer, group_col in group_cols.items():
+            if group_col not in df.columns:
+                continue
+            index.groups[peer] = {
+                key: {c: _SortedMetric.from_series(g[c]) for c in cols}
+                for key, g in df.groupby(group_col, observed=True)
+            }
+        return index
+
+    def percentile(
+        self,
+        metric: str,
+        value: float,
+        higher_is_better: bool = True,
+        peer: str | None = None,
+        group: object = None,
+    ) -> float | None:
+        """상위 X% (0~100). 지표나 그룹이 없으면 None."""
+        sorted_metric = (
+            self.groups.get(peer, {}).get(group, {}) if peer else self.metrics
+        ).get(metric)
+        if sorted_metric is None or sorted_metric.total == 0:
+            return None
+        if pd.isna(value):
+            return 0.0
+        if higher_is_better:
+            share = sorted_metric.share_at_least(value)
+        else:
+            share = sorted_metric.share_at_most(value)
+        return round(float(share) * 100, 1)
+
+
+@st.cache_resource
+def seller_percentile_index() -> PercentileIndex:
+    """셀러 클러스터 분석 데이터 기반 퍼센타일 인덱스 (프로세스 공유)."""
+    return PercentileIndex.build(
+        load_seller_clusters(),
+        HIGHER_BETTER_METRICS + LOWER_BETTER_METRICS,
+        PEER_GROUP_COLUMNS,
+    )
+
+
+@st.cache_resource
+def seller_cluster_rows() -> pd.DataFrame:
+    """seller_id 코드 인덱스의 셀러 클러스터 분석 데이터 (셀러 행 조회용)."""
+    rows = load_seller_clusters().drop_duplicates("seller_id").set_index("seller_id")
+    return freeze_frame(rows)
@@ -8,21 +8,33 @@ import numpy as np
 import pandas as pd
 import streamlit as st
 
+from claude_eda.dashboard.data.batch_metrics import (
+    compute_all_seller_metrics,
+    compute_category_seller_cube,
+)
 from claude_eda.dashboard.data.loader import (
-    build_merged_table,
     load_customer_clusters,
-    load_geolocation,
     load_order_items,
     load_orders,
     load_payments,
     load_product_clusters,
     load_reviews,
     load_seller_cluster_stats,
-    load_seller_clusters,
-    load_seller_names,
-    load_sellers,
+    merged_by_seller,
+    seller_codec,
+)
+from claude_eda.dashboard.data.percentiles import (
+    HIGHER_BETTER_METRICS,
+    LOWER_BETTER_METRICS,
+    PEER_GROUP_COLUMNS,
+    seller_cluster_rows,
+    seller_percentile_index,
+)
+from claude_eda.dashboard.engine.review_analyzer import (
+    ISSUE_MASK_COL,
+    POSITIVE_COL,
+    analyze_seller_reviews,
 )
-from claude_eda.dashboard.engine.review_analyzer import analyze_seller_reviews
 
 
 @dataclass
@@ -108,76 +120,18 @@ class SellerMetrics:
 @st.cache_data
 def compute_seller_metrics(seller_id: str) -> SellerMetrics | None:
     """특정 셀러의 전체 메트릭 계산."""
-    merged = build_merged_table()
-    seller_data = merged[merged["seller_id"] == seller_id]
+    seller_code = seller_codec().encode_one(seller_id)
+    seller_data = merged_by_seller().rows_for_code(seller_code)
 
     if seller_data.empty:
         return None
 
     m = SellerMetrics(seller_id=seller_id)
+    _apply_scalar_metrics(m, compute_all_seller_metrics().loc[seller_code])
 
-    # 회사명 매핑
-    names_df = load_seller_names()
-    name_row = names_df[names_df["seller_id"] == seller_id]
-    if not name_row.empty:
-        m.company_name = str(name_row.iloc[0]["company_name_en"])
-
-    # --- 프로필 ---
-    sellers_df = load_sellers()
-    seller_info = sellers_df[sellers_df["seller_id"] == seller_id]
-    if not seller_info.empty:
-        m.seller_state = seller_info.iloc[0]["seller_state"]
-        m.seller_city = seller_info.iloc[0]["seller_city"]
-
-    cluster_df = load_seller_clusters()
-    cluster_row = cluster_df[cluster_df["seller_id"] == seller_id]
-    if not cluster_row.empty:
-        m.cluster = int(cluster_row.iloc[0]["cluster"])
-
-    # delivered 주문만 필터 (KPI 계산용)
+    # delivered 주문만 필터 (배송일 분포·거리 분석용)
     delivered = seller_data[seller_data["order_status"] == "delivered"]
-
-    timestamps = seller_data["order_purchase_timestamp"].dropna()
-    if not timestamps.empty:
-        m.first_order = timestamps.min().strftime("%Y-%m-%d")
-        m.last_order = timestamps.max().strftime("%Y-%m-%d")
-        span = (timestamps.max() - timestamps.min()).days
-        m.active_months = max(1, span // 30)
-
-    # --- KPI ---
-    m.total_revenue = float(seller_data["price"].sum())
-    m.total_orders = seller_data["order_id"].nunique()
-    m.unique_customers = seller_data["customer_unique_id"].nunique()
-    m.avg_order_value = (
-        m.total_revenue / m.total_orders if m.total_orders > 0 else 0.0
-    )
-    m.total_items = len(seller_data)
-    m.items_per_order = m.total_items / m.total_orders if m.total_orders > 0 else 0.0
-    m.product_variety = seller_data["product_id"].nunique()
-    m.avg_price = float(seller_data["price"].mean()) if not seller_data.empty else 0.0
-
-    reviews = seller_data["review_score"].dropna()
-    if not reviews.empty:
-        m.avg_review = float(reviews.mean())
-        m.low_review_pct = float((reviews <= 2).mean())
-    else:
-        m.avg_review = 0.0
-        m.low_review_pct = 0.0
-
-    delivery = delivered["delivery_days"].dropna()
-    if not delivery.empty:
-        m.avg_delivery_days = float(delivery.mean())
-        m.delivery_days_list = delivery.tolist()
-    else:
-        m.avg_delivery_days = 0.0
-        m.delivery_days_list = []
-
-    late = delivered["is_late"].dropna()
-    m.late_delivery_pct = float(late.mean()) if not late.empty else 0.0
-
-    # 사진 정보
-    photos = seller_data["product_photos_qty"].dropna()
-    m.avg_photos = float(photos.mean()) if not photos.empty else 0.0
+    m.delivery_days_list = delivered["delivery_days"].dropna().tolist()
 
     # --- 월별 추이 ---
     monthly = seller_data.dropna(subset=["order_month"]).copy()
@@ -199,7 +153,7 @@ def compute_seller_metrics(seller_id: str) -> SellerMetrics | None:
 
     # --- 상품 분석 ---
     cat_rev = (
-        seller_data.groupby("product_category_name_english")["price"]
+        seller_data.groupby("product_category_name_english", observed=True)["price"]
         .sum()
         .sort_values(ascending=False)
         .head(10)
@@ -219,7 +173,7 @@ def compute_seller_metrics(seller_id: str) -> SellerMetrics | None:
 
     # --- 고객 분석 ---
     cust_states = (
-        seller_data.groupby("customer_state")["customer_unique_id"]
+        seller_data.groupby("customer_state", observed=True)["customer_unique_id"]
         .nunique()
         .sort_values(ascending=False)
         .head(10)
@@ -240,6 +194,7 @@ def compute_seller_metrics(seller_id: str) -> SellerMetrics | None:
         m.customer_cluster_dist = cc_dist
 
     # --- 리뷰 분포 ---
+    reviews = seller_data["review_score"].dropna()
     if not reviews.empty:
         rev_dist = reviews.value_counts().sort_index().reset_index()
         rev_dist.columns = ["score", "count"]
@@ -251,149 +206,95 @@ def compute_seller_metrics(seller_id: str) -> SellerMetrics | None:
     # ===== 신규 6개 메트릭 =====
 
     # 1. 리뷰 텍스트 키워드 분석
-    review_text_df = seller_data[["review_score", "review_comment_message"]].dropna(
-        subset=["review_score"]
-    )
+    review_text_df = seller_data[[
+        "review_score", "review_comment_message", ISSUE_MASK_COL, POSITIVE_COL,
+    ]].dropna(subset=["review_score"])
     m.review_keyword_analysis = analyze_seller_reviews(review_text_df)
 
     # 2. 카테고리 내 순위
-    m.category_ranks = _compute_category_ranks(seller_id, seller_data, merged)
+    m.category_ranks = _compute_category_ranks(seller_code)
 
     # 3. 셀러-고객 거리 기반 배송 분석
-    m.avg_distance_km, m.distance_delivery = _compute_distance_analysis(
-        seller_id, seller_data, delivered
-    )
+    m.avg_distance_km, m.distance_delivery = _compute_distance_analysis(delivered)
 
-    # 4. 결제 패턴
+    # 4. 결제 패턴 (수단 분포 — 신용카드 비율·할부는 일괄 테이블에서)
     _compute_payment_patterns(m, seller_data)
 
-    # 5. 취소율
-    _compute_cancel_rate(m, seller_data)
-
-    # 6. 재구매 고객 비율
-    _compute_repeat_customers(m, seller_data)
+    # 5. 취소율, 6. 재구매 고객 비율 — 일괄 테이블에서 채움
 
     return m
 
 
-def _compute_category_ranks(
-    seller_id: str, seller_data: pd.DataFrame, merged: pd.DataFrame
-) -> pd.DataFrame:
-    """같은 카테고리 내 셀러 순위 (매출, 리뷰, 배송)."""
-    seller_cats = seller_data["product_category_name_english"].dropna().unique()
-    if len(seller_cats) == 0:
+def _apply_scalar_metrics(m: SellerMetrics, row: pd.Series) -> None:
+    """일괄 메트릭 테이블의 한 행을 SellerMetrics 스칼라 필드에 채운다."""
+    if pd.notna(row["company_name"]):
+        m.company_name = str(row["company_name"])
+    if pd.notna(row["seller_state"]):
+        m.seller_state = row["seller_state"]
+        m.seller_city = row["seller_city"]
+    m.cluster = int(row["cluster"])
+
+    if pd.notna(row["first_order"]):
+        m.first_order = row["first_order"].strftime("%Y-%m-%d")
+        m.last_order = row["last_order"].strftime("%Y-%m-%d")
+    m.active_months = int(row["active_months"])
+
+    for name in ["total_orders", "unique_customers", "total_items", "product_variety",
+                 "cancel_count", "repeat_customer_count"]:
+        setattr(m, name, int(row[name]))
+    for name in ["total_revenue", "avg_order_value", "items_per_order", "avg_price",
+                 "avg_review", "low_review_pct", "avg_delivery_days", "late_delivery_pct",
+                 "avg_photos", "cancel_rate", "repeat_customer_rate",
+                 "avg_installments", "credit_card_pct"]:
+        setattr(m, name, float(row[name]))
+
+
+def _compute_category_ranks(seller_code: int) -> pd.DataFrame:
+    """같은 카테고리 내 셀러 순위 (매출, 리뷰) — 주요 카테고리 (매출 기준 상위 3개)."""
+    cube = compute_category_seller_cube()
+    try:
+        mine = cube.loc[seller_code]
+    except KeyError:
         return pd.DataFrame()
 
-    # 주요 카테고리 (매출 기준 상위 3개)
-    cat_revenue = (
-        seller_data.groupby("product_category_name_english")["price"]
-        .sum()
-        .sort_values(ascending=False)
-    )
-    top_cats = cat_revenue.head(3).index.tolist()
-
-    rows = []
-    for cat in top_cats:
-        cat_data = merged[merged["product_category_name_english"] == cat]
-        # 카테고리 내 셀러별 집계
-        cat_sellers = cat_data.groupby("seller_id").agg(
-            revenue=("price", "sum"),
-            orders=("order_id", "nunique"),
-            avg_review=("review_score", "mean"),
-        )
-        total_sellers = len(cat_sellers)
-        if seller_id not in cat_sellers.index:
-            continue
-
-        rev_rank = int((cat_sellers["revenue"] >= cat_sellers.loc[seller_id, "revenue"]).sum())
-        review_rank = int((cat_sellers["avg_review"] >= cat_sellers.loc[seller_id, "avg_review"]).sum())
-
-        rows.append({
-            "category": cat,
-            "total_sellers": total_sellers,
-            "revenue_rank": rev_rank,
-            "review_rank": review_rank,
-            "my_revenue": cat_sellers.loc[seller_id, "revenue"],
-            "my_review": cat_sellers.loc[seller_id, "avg_review"],
-        })
-
-    return pd.DataFrame(rows) if rows else pd.DataFrame()
-
-
-def _haversine(lat1, lon1, lat2, lon2):
-    """두 좌표 간 거리 (km)."""
-    R = 6371
-    lat1, lon1, lat2, lon2 = map(np.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
-    return R * 2 * np.arcsin(np.sqrt(a))
-
-
-def _compute_distance_analysis(
-    seller_id: str, seller_data: pd.DataFrame, delivered: pd.DataFrame
-) -> tuple[float, pd.DataFrame]:
-    """셀러-고객 거리 기반 배송 분석."""
-    geo = load_geolocation()
-    sellers_df = load_sellers()
-
-    seller_info = sellers_df[sellers_df["seller_id"] == seller_id]
-    if seller_info.empty:
-        return 0.0, pd.DataFrame()
-
-    seller_zip = seller_info.iloc[0]["seller_zip_code_prefix"]
-    seller_geo = geo[geo["geolocation_zip_code_prefix"] == seller_zip]
-    if seller_geo.empty:
-        return 0.0, pd.DataFrame()
-
-    slat = float(seller_geo.iloc[0]["geolocation_lat"])
-    slng = float(seller_geo.iloc[0]["geolocation_lng"])
-
-    # 고객 zip → 위경도
-    cust_zips = delivered[["customer_zip_code_prefix", "delivery_days"]].dropna()
-    if cust_zips.empty:
-        return 0.0, pd.DataFrame()
-
-    cust_zips = cust_zips.copy()
-    cust_zips["customer_zip_code_prefix"] = cust_zips[
-        "customer_zip_code_prefix"
-    ].astype(int, errors="ignore")
-
-    merged_geo = cust_zips.merge(
-        geo,
-        left_on="customer_zip_code_prefix",
-        right_on="geolocation_zip_code_prefix",
-        how="inner",
+    mine = mine.sort_values("revenue", ascending=False).head(3)
+    ranks = pd.DataFrame({
+        "category": mine.index.astype(str),
+        "total_sellers": mine["total_sellers"].to_numpy(),
+        "revenue_rank": mine["revenue_rank"].to_numpy(),
+        "review_rank": mine["review_rank"].to_numpy(),
+        "my_revenue": mine["revenue"].to_numpy(),
+        "my_review": mine["avg_review"].to_numpy(),
+    })
+    return ranks
+
+
+def _compute_distance_analysis(delivered: pd.DataFrame) -> tuple[float, pd.DataFrame]:
+    """셀러-고객 거리 기반 배송 분석 (병합 테이블의 distance_km / distance_bin 사용)."""
+    dist = delivered[["distance_km", "distance_bin", "delivery_days"]].dropna(
+        subset=["distance_km", "delivery_days"]
     )
-    if merged_geo.empty:
+    if dist.empty:
         return 0.0, pd.DataFrame()
 
-    merged_geo["distance_km"] = _haversine(
-        slat, slng,
-        merged_geo["geolocation_lat"].values,
-        merged_geo["geolocation_lng"].values,
-    )
-
-    avg_dist = float(merged_geo["distance_km"].mean())
+    avg_dist = float(dist["distance_km"].mean())
 
     # 거리 구간별 배송일
-    bins = [0, 200, 500, 1000, 2000, 10000]
-    labels = ["0-200km", "200-500km", "500-1000km", "1000-2000km", "2000km+"]
-    merged_geo["dist_bin"] = pd.cut(merged_geo["distance_km"], bins=bins, labels=labels)
     dist_delivery = (
-        merged_geo.groupby("dist_bin", observed=True)
+        dist.groupby("distance_bin", observed=True)
         .agg(
             avg_days=("delivery_days", "mean"),
             count=("delivery_days", "count"),
         )
         .reset_index()
+        .rename(columns={"distance_bin": "dist_bin"})
     )
 
     return avg_dist, dist_delivery
 
 
 def _compute_payment_patterns(m: SellerMetrics, seller_data: pd.DataFrame) -> None:
-    """결제 수단 분포 및 할부 패턴."""
+    """결제 수단 분포."""
     payments = load_payments()
     seller_orders = seller_data["order_id"].unique()
     seller_payments = payments[payments["order_id"].isin(seller_orders)]
@@ -401,83 +302,43 @@ def _compute_payment_patterns(m: SellerMetrics, seller_data: pd.DataFrame) -> No
     if seller_payments.empty:
         return
 
-    # 결제 수단 분포
-    pay_dist = seller_payments["payment_type"].value_counts().reset_index()
-    pay_dist.columns = ["payment_type", "count"]
-    m.payment_type_dist = pay_dist
-
-    # 평균 할부 (신용카드만)
-    credit = seller_payments[seller_payments["payment_type"] == "credit_card"]
-    if not credit.empty:
-        m.avg_installments = float(credit["payment_installments"].mean())
-
-    # 신용카드 비율
-    total_pay = len(seller_payments)
-    m.credit_card_pct = len(credit) / total_pay if total_pay > 0 else 0.0
-
-
-def _compute_cancel_rate(m: SellerMetrics, seller_data: pd.DataFrame) -> None:
-    """주문 취소/미배송 비율."""
-    order_statuses = seller_data.drop_duplicates("order_id")["order_status"]
-    total = len(order_statuses)
-    if total == 0:
-        return
-
-    cancel_statuses = ["canceled", "unavailable"]
-    canceled = order_statuses.isin(cancel_statuses).sum()
-    m.cancel_count = int(canceled)
-    m.cancel_rate = canceled / total
-
-
-def _compute_repeat_customers(m: SellerMetrics, seller_data: pd.DataFrame) -> None:
-    """재구매 고객 비율."""
-    cust_orders = (
-        seller_data.groupby("customer_unique_id")["order_id"]
-        .nunique()
-        .reset_index()
-    )
-    cust_orders.columns = ["customer_unique_id", "order_count"]
-    total_custs = len(cust_orders)
-    if total_custs == 0:
-        return
-
-    repeats = (cust_orders["order_count"] > 1).sum()
-    m.repeat_customer_count = int(repeats)
-    m.repeat_customer_rate = repeats / total_custs
-
-
-@st.cache_data
-def compute_percentile_ranks(seller_id: str) -> dict:
-    """전체 셀러 대비 퍼센타일 (상위 X%) 계산."""
-    cluster_df = load_seller_clusters()
-    seller_row = cluster_df[cluster_df["seller_id"] == seller_id]
-    if seller_row.empty:
+    # 건수 내림차순, 동률은 첫 등장 순 (범주형 value_counts는 동률을 범주 순으로 둔다)
+    codes, types = pd.factorize(seller_payments["payment_type"])
+    pay_dist = pd.DataFrame({
+        "payment_type": types,
+        "count": np.bincount(codes[codes >= 0], minlength=len(types)),
+    })
+    pay_dist = pay_dist.sort_values("count", ascending=False, kind="stable")
+    m.payment_type_dist = pay_dist.reset_index(drop=True)
+
+
+def compute_percentile_ranks(seller_id: str, peer: str | None = None) -> dict:
+    """전체 셀러 대비 퍼센타일 (상위 X%) 계산.
+
+    Args:
+        seller_id: 셀러 ID
+        peer: None이면 전체 셀러 대비, "cluster"/"state"면 같은 클러스터·같은 주 셀러 대비
+    """
+    rows = seller_cluster_rows()
+    try:
+        seller_row = rows.loc[seller_codec().encode_one(seller_id)]
+    except KeyError:
         return {}
 
-    seller_row = seller_row.iloc[0]
-    metrics = [
-        "total_orders",
-        "total_revenue",
-        "avg_price",
-        "product_variety",
-        "avg_review",
-        "unique_customers",
-        "items_per_order",
-    ]
-    lower_better = ["low_review_pct", "avg_delivery_days", "late_delivery_pct"]
+    group = seller_row[PEER_GROUP_COLUMNS[peer]] if peer else None
+    index = seller_percentile_index()
 
     percentiles = {}
-    for col in metrics:
-        if col in cluster_df.columns:
-            val = seller_row[col]
-            rank = (cluster_df[col] >= val).mean() * 100
-            percentiles[col] = round(rank, 1)
-
-    for col in lower_better:
-        if col in cluster_df.columns:
-            val = seller_row[col]
-            rank = (cluster_df[col] <= val).mean() * 100
-            percentiles[col] = round(rank, 1)
+    for metrics, higher_is_better in [
+        (HIGHER_BETTER_METRICS, True),
+        (LOWER_BETTER_METRICS, False),
+    ]:
+        for col in metrics:
+            if col not in rows.columns:
+                continue
+            rank = index.percentile(col, seller_row[col], higher_is_better, peer, group)
+            if rank is not None:
+                percentiles[col] = rank
 
     return percentiles
 
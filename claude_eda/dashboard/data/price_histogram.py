@@ -0,0 +1,196 @@
+"""카테고리 × 고객 주별 가격 히스토그램.
+
+가격대별 매출 시뮬레이션은 (카테고리, 고객 주)의 배송 완료 품목을 가격대로 나눠 품목 수·
+매출·고유 주문 수를 센다. 시장 큐브의 품목 목록을 로그 눈금 버킷으로 한 번 집계해 두면
+어떤 가격대 구성이든 버킷 합으로 답할 수 있다.
+
+- 버킷 경계: ``PRICE_HIST_RANGE`` 안은 유효숫자 ``PRICE_HIST_DIGITS``자리 값 전부
+  (1, 1.1, …, 9.9, 10, 11, …) + 0, ∞, 기본 가격대 경계. 경계가 눈금 위에 있는 가격대는
+  행 단위 필터(``low <= price < high``)와 결과가 같다. 사용자가 입력한 경계는 라벨을 만들기
+  전에 ``snap_price_edges``로 가장 가까운 눈금에 맞춰, 표시되는 구간과 집계 구간이 같게 한다.
+- 고유 주문 수: 버킷별 (주문, 버킷) 고유 수를 더하면 한 주문이 같은 가격대의 여러 버킷에
+  품목을 가질 때 중복된다. 주문마다 점유 버킷을 정렬해 인접한 두 버킷 쌍(links)을 함께 세
+  두고, 가격대 안에 양쪽이 모두 들어가는 쌍 수를 빼면 정확한 고유 주문 수가 된다.
+- 주문은 고객 한 명(주 하나)에 속하므로 카테고리 전체 값은 주별 히스토그램의 합이다.
+
+버킷은 0이 아닌 것만 히스토그램별 연속 구간(CSR)으로 보관하므로 한 카테고리·주 조회는
+배열 슬라이스다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from claude_eda.dashboard.config import PRICE_BANDS, PRICE_HIST_DIGITS, PRICE_HIST_RANGE
+from claude_eda.dashboard.data.frame_store import freeze_frame
+from claude_eda.dashboard.data.market_cube import market_cube
+
+
+def price_edges() -> np.ndarray:
+    """버킷 경계 (오름차순, 0으로 시작해 ∞로 끝남)."""
+    lo, hi = PRICE_HIST_RANGE
+    step = 10 ** (PRICE_HIST_DIGITS - 1)
+    mantissa = np.arange(step, 10 * step)
+    grid = [
+        mantissa * 10.0 ** (exp - PRICE_HIST_DIGITS + 1)
+        for exp in range(int(np.floor(np.log10(lo))), int(np.ceil(np.log10(hi))))
+    ]
+    grid = np.round(np.concatenate(grid), 6)
+    grid = grid[(grid >= lo) & (grid <= hi)]
+    band_edges = [edge for low, high, _ in PRICE_BANDS for edge in (low, high)]
+    return np.unique(np.concatenate([[0.0, hi, np.inf], grid, band_edges]).astype(np.float64))
+
+
+def _nearest_edge(edges: np.ndarray, prices) -> np.ndarray:
+    """가격 → 가장 가까운 경계 번호 (가운데면 위쪽, ∞는 마지막 경계)."""
+    prices = np.asarray(prices, dtype=np.float64)
+    right = np.clip(np.searchsorted(edges, prices), 1, len(edges) - 1)
+    left = right - 1
+    with np.errstate(invalid="ignore"):
+        nearer_left = prices - edges[left] < edges[right] - prices
+    idx = np.where(nearer_left, left, right)
+    return np.where(np.isposinf(prices), len(edges) - 1, idx)
+
+
+def snap_price_edges(prices) -> np.ndarray:
+    """가격 경계 → 가장 가까운 히스토그램 버킷 경계 값 (예: 125 → 130)."""
+    edges = price_edges()
+    return edges[_nearest_edge(edges, prices)]
+
+
+@dataclass(frozen=True)
+class PriceHistograms:
+    """(카테고리, 고객 주)별 가격 히스토그램 (읽기 전용 공유).
+
+    keys: 히스토그램 번호별 category / customer_state / first_purchase / last_purchase.
+        (카테고리, 주) 순 정렬이라 한 카테고리의 히스토그램은 연속 구간이다.
+    buckets: 0이 아닌 버킷만, 히스토그램 순 — bucket / items / revenue / orders.
+        히스토그램 h의 행 = ``bucket_offsets[h]:bucket_offsets[h + 1]``.
+    links: 같은 주문이 점유한 인접 버킷 쌍 — lo / hi / count, ``link_offsets``로 같은 방식.
+    """
+
+    edges: np.ndarray
+    keys: pd.DataFrame
+    buckets: dict[str, np.ndarray]
+    bucket_offsets: np.ndarray
+    links: dict[str, np.ndarray]
+    link_offsets: np.ndarray
+    _index: dict[tuple, int] = field(repr=False)
+
+    def select(self, category: str, state: str | None = None) -> slice:
+        """카테고리(+ 고객 주)의 히스토그램 번호 구간. state가 비면 카테고리 전체."""
+        if state:
+            h = self._index.get((category, state))
+            return slice(0, 0) if h is None else slice(h, h + 1)
+        return self._index.get(category, slice(0, 0))
+
+    def edge_index(self, prices) -> np.ndarray:
+        """가격 → 가장 가까운 버킷 경계 번호."""
+        return _nearest_edge(self.edges, prices)
+
+    def band_totals(self, hists: slice, bands) -> dict[str, np.ndarray]:
+        """히스토그램 구간 합산 → 가격대 [low, high)별 items / revenue / orders 배열."""
+        bounds = np.asarray([(low, high) for low, high, *_ in bands], dtype=np.float64).reshape(-1, 2)
+        start, stop = self.edge_index(bounds[:, 0]), self.edge_index(bounds[:, 1])
+
+        rows = slice(self.bucket_offsets[hists.start], self.bucket_offsets[hists.stop])
+        bucket = self.buckets["bucket"][rows, None]
+        in_band = ((bucket >= start) & (bucket < stop)).astype(np.float64)
+
+        links = slice(self.link_offsets[hists.start], self.link_offsets[hists.stop])
+        linked = (
+            (self.links["lo"][links, None] >= start) & (self.links["hi"][links, None] < stop)
+        ).astype(np.float64)
+
+        return {
+            "items": (self.buckets["items"][rows] @ in_band).astype(np.int64),
+            "revenue": self.buckets["revenue"][rows] @ in_band,
+            "orders": (
+                self.buckets["orders"][rows] @ in_band - self.links["count"][links] @ linked
+            ).astype(np.int64),
+        }
+
+    def span(self, hists: slice) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """히스토그램 구간의 첫·마지막 주문 시각."""
+        keys = self.keys.iloc[hists]
+        return keys["first_purchase"].min(), keys["last_purchase"].max()
+
+
+def _csr(hist: np.ndarray, n_hists: int, columns: dict[str, np.ndarray]):
+    """히스토그램 순으로 정렬된 행 → (읽기 전용 컬럼 배열, 오프셋)."""
+    offsets = np.searchsorted(hist, np.arange(n_hists + 1))
+    for arr in [offsets, *columns.values()]:
+        arr.flags.writeable = False
+    return columns, offsets
+
+
+def _hist_index(keys: pd.DataFrame) -> dict:
+    """(카테고리, 주) → 히스토그램 번호, 카테고리 → 히스토그램 구간."""
+    index = {}
+    for h, (category, state) in enumerate(zip(keys["category"], keys["customer_state"])):
+        if pd.isna(category):
+            continue
+        index[(category, state)] = h
+        first = index.get(category, slice(h, h)).start
+        index[category] = slice(first, h + 1)
+    return index
+
+
+@st.cache_resource
+def price_histograms() -> PriceHistograms:
+    """시장 큐브 품목 목록으로 만든 (카테고리, 고객 주)별 가격 히스토그램."""
+    cube = market_cube()
+    edges = price_edges()
+
+    grouped = cube.cells.groupby(["category", "customer_state"], observed=True, dropna=False, sort=True)
+    keys = grouped.agg(
+        first_purchase=("first_purchase", "min"),
+        last_purchase=("last_purchase", "max"),
+    ).reset_index()
+    cell_hist = grouped.ngroup().to_numpy(dtype=np.int64)
+
+    hist = np.repeat(cell_hist, np.diff(cube.offsets))
+    price = cube.items["price"].to_numpy(dtype=np.float64)
+    bucket = np.searchsorted(edges, price, side="right") - 1
+    order_id = cube.items["order_id"].to_numpy().astype(np.int64)
+
+    n_buckets = len(edges) - 1
+    flat = hist * n_buckets + bucket
+    items = np.bincount(flat, minlength=len(keys) * n_buckets)
+    revenue = np.bincount(flat, weights=price, minlength=len(keys) * n_buckets)
+
+    # (히스토그램, 주문, 버킷) 고유 조합 → 버킷별 주문 수, 같은 주문의 인접 버킷 쌍
+    occupied = np.unique(np.column_stack([hist, order_id, bucket]), axis=0)
+    orders = np.bincount(occupied[:, 0] * n_buckets + occupied[:, 2], minlength=len(keys) * n_buckets)
+    same_order = (occupied[1:, 0] == occupied[:-1, 0]) & (occupied[1:, 1] == occupied[:-1, 1])
+    link_keys, link_counts = np.unique(
+        np.column_stack([occupied[1:, 0], occupied[:-1, 2], occupied[1:, 2]])[same_order],
+        axis=0, return_counts=True,
+    )
+
+    nonzero = np.flatnonzero(items)
+    buckets, bucket_offsets = _csr(nonzero // n_buckets, len(keys), {
+        "bucket": nonzero % n_buckets,
+        "items": items[nonzero].astype(np.float64),
+        "revenue": revenue[nonzero],
+        "orders": orders[nonzero].astype(np.float64),
+    })
+    links, link_offsets = _csr(link_keys[:, 0], len(keys), {
+        "lo": link_keys[:, 1],
+        "hi": link_keys[:, 2],
+        "count": link_counts.astype(np.float64),
+    })
+    edges.flags.writeable = False
+    return PriceHistograms(
+        edges=edges,
+        keys=freeze_frame(keys),
+        buckets=buckets,
+        bucket_offsets=bucket_offsets,
+        links=links,
+        link_offsets=link_offsets,
+        _index=_hist_index(keys),
+    )
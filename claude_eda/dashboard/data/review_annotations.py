@@ -0,0 +1,106 @@
+"""리뷰 텍스트 주석(이슈 비트마스크, 긍정 여부) 저장소와 병렬 주석 작업.
+
+키워드 분류는 순수 파이썬 CPU 작업이라 스트림릿 요청 스레드에서 돌리지 않도록, 별도 작업
+(``claude_eda/annotate_reviews.py``)이 리뷰 코퍼스를 청크로 나눠 ``ProcessPoolExecutor``로
+분류하고 결과를 review_id 기준 Parquet으로 저장한다. 대시보드는 저장된 결과를 읽기만 한다.
+
+파일 이름에 원본 CSV 식별자와 키워드 사전 식별자의 해시가 들어 있어, 리뷰 데이터나
+키워드가 바뀌면 기존 파일은 무시된다. 유효한 파일이 없으면 대시보드는 파일을 만들지 않고
+프로세스 안에서 직렬로 분류한 결과를 쓴다 (주석 작업을 돌리기 전까지 프로세스마다 반복).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from claude_eda.dashboard.config import REVIEW_ANNOTATIONS_DIR, REVIEWS_PATH
+from claude_eda.dashboard.data.columnar_cache import read_csv_cached, source_fingerprint
+from claude_eda.dashboard.engine.review_analyzer import (
+    ISSUE_MASK_COL,
+    POSITIVE_COL,
+    annotate_reviews,
+    keyword_fingerprint,
+)
+
+ANNOTATION_COLUMNS = ["review_id", ISSUE_MASK_COL, POSITIVE_COL]
+DEFAULT_CHUNK_SIZE = 5_000
+
+
+def annotations_path() -> Path:
+    """현재 리뷰 CSV + 키워드 사전에 해당하는 주석 파일 경로."""
+    key = f"{source_fingerprint(REVIEWS_PATH)}|{keyword_fingerprint()}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+    return REVIEW_ANNOTATIONS_DIR / f"review_annotations.{digest}.parquet"
+
+
+def load_review_texts() -> pd.DataFrame:
+    """주석 대상 — review_id별 리뷰 텍스트 (중복 review_id는 첫 행)."""
+    texts = read_csv_cached(REVIEWS_PATH, usecols=["review_id", "review_comment_message"])
+    return texts.drop_duplicates("review_id").reset_index(drop=True)
+
+
+def annotate_corpus(
+    texts: pd.Series,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """텍스트 Series 전체 주석. workers > 1이면 청크 단위로 프로세스 풀에서 분류한다."""
+    if workers <= 1 or len(texts) <= chunk_size:
+        return annotate_reviews(texts)
+    chunks = [texts.iloc[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return pd.concat(pool.map(annotate_reviews, chunks))
+
+
+def annotate_all_reviews(
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """리뷰 코퍼스 전체 주석 (review_id + 주석 컬럼, 저장하지 않음)."""
+    texts = load_review_texts()
+    return texts[["review_id"]].join(
+        annotate_corpus(texts["review_comment_message"], workers, chunk_size)
+    )
+
+
+def build_review_annotations(
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> pd.DataFrame:
+    """리뷰 코퍼스 전체를 주석하고 Parquet으로 저장한다 (이전 버전 파일은 삭제)."""
+    annotations = annotate_all_reviews(workers, chunk_size)
+
+    path = annotations_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        annotations.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+        for stale in path.parent.glob("review_annotations.*.parquet"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        # 읽기 전용 배포 환경 등 — 저장 없이 계속 진행
+        pass
+    return annotations
+
+
+def read_review_annotations() -> pd.DataFrame:
+    """저장된 리뷰 주석 (review_id, 이슈 비트마스크, 긍정 여부).
+
+    유효한 파일이 없거나 읽을 수 없으면 쓰지 않고 프로세스 안에서 분류한다 —
+    ``python claude_eda/annotate_reviews.py``로 파일을 만들어 두면 생략된다.
+    """
+    path = annotations_path()
+    if path.exists():
+        try:
+            return pd.read_parquet(path, columns=ANNOTATION_COLUMNS)
+        except Exception:
+            # 손상된 파일 — 주석 작업이 다시 쓸 때까지 아래 대체 경로 사용
+            pass
+    return annotate_all_reviews()
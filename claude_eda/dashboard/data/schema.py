@@ -0,0 +1,107 @@
+"""테이블별 dtype 스키마.
+
+pandas 추론 dtype 대신 로더가 사용할 명시적 dtype을 정의한다.
+- 저카디널리티 문자열(주문 상태, 주, 카테고리, 결제 수단 등) → category
+- 정수/실수 → 값 범위에 맞게 다운캐스트 (금액 컬럼은 합계 정밀도를 위해 float64 유지)
+- 타임스탬프 → 고정 포맷으로 파싱 (포맷 추론 비용 제거)
+
+주(State) 컬럼은 고객/셀러 양쪽이 같은 CategoricalDtype을 공유하므로 조인·비교 후에도
+category가 유지된다. category 컬럼으로 groupby할 때는 반드시 ``observed=True``를 써서
+등장하지 않은 카테고리가 0/NaN 행으로 끼어들지 않도록 한다.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+
+from claude_eda.dashboard.config import REGION_MAP
+
+# Olist 원본 타임스탬프 포맷 ("2017-10-02 10:56:33")
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 브라질 27개 주 — 고객/셀러 주 컬럼 공용
+STATE_DTYPE = pd.CategoricalDtype(sorted(REGION_MAP))
+
+ORDERS_DTYPES = {
+    "order_status": "category",
+}
+
+ORDER_ITEMS_DTYPES = {
+    "order_item_id": "int8",
+    "price": "float64",
+    "freight_value": "float64",
+}
+
+REVIEWS_DTYPES = {
+    "review_score": "int8",
+}
+
+CUSTOMERS_DTYPES = {
+    "customer_zip_code_prefix": "int32",
+    "customer_city": "category",
+    "customer_state": STATE_DTYPE,
+}
+
+SELLERS_DTYPES = {
+    "seller_zip_code_prefix": "int32",
+    "seller_city": "category",
+    "seller_state": STATE_DTYPE,
+}
+
+PRODUCTS_DTYPES = {
+    "product_category_name": "category",
+    "product_name_lenght": "float32",
+    "product_description_lenght": "float32",
+    "product_photos_qty": "float32",
+    "product_weight_g": "float32",
+    "product_length_cm": "float32",
+    "product_height_cm": "float32",
+    "product_width_cm": "float32",
+}
+
+PAYMENTS_DTYPES = {
+    "payment_sequential": "int8",
+    "payment_type": "category",
+    "payment_installments": "int8",
+    "payment_value": "float64",
+}
+
+CATEGORY_TRANSLATION_DTYPES = {
+    "product_category_name": "category",
+    "product_category_name_english": "category",
+}
+
+GEOLOCATION_DTYPES = {
+    "geolocation_zip_code_prefix": "int32",
+    "geolocation_lat": "float32",
+    "geolocation_lng": "float32",
+}
+GEOLOCATION_COLUMNS = list(GEOLOCATION_DTYPES)
+
+# 재고 데이터
+WAREHOUSE_INVENTORY_DTYPES = {
+    "quantity_on_hand": "int32",
+    "quantity_reserved": "int32",
+    "quantity_available": "int32",
+    "unit_cost": "float64",
+}
+
+INVENTORY_MOVEMENTS_DTYPES = {
+    "movement_type": "category",
+    "quantity": "int32",
+}
+
+REORDER_RULES_DTYPES = {
+    "reorder_point": "int32",
+    "reorder_quantity": "int32",
+    "lead_time_days": "int16",
+    "safety_stock": "int32",
+}
+
+# 병합 테이블에서 조인 후 다시 맞춰야 하는 컬럼 (left join 결측으로 float64 승격되는 정수 등)
+MERGED_DTYPES = {
+    "review_score": "float32",
+    "review_issue_mask": "uint8",
+    "review_is_positive": "bool",
+    "product_category_name_english": "category",
+}
@@ -0,0 +1,57 @@
+"""셀러 단위로 분할된 팩트 테이블 인덱스.
+
+병합 테이블·배송 기본 테이블을 seller_id 코드 순으로 한 번 정렬해 두고, 코드별 시작/끝
+오프셋 배열을 함께 보관한다. 셀러 한 명의 행은 ``iloc[start:stop]`` 슬라이스 — 전체
+테이블을 ``==``로 스캔하지 않고 O(1)로 얻는 뷰 — 이다.
+
+반환 슬라이스는 공유 프레임의 뷰이므로 값을 쓰려면 ``.copy()`` 후에 쓴다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from claude_eda.dashboard.data.id_codec import IdCodec
+
+
+def sort_by_seller(df: pd.DataFrame) -> pd.DataFrame:
+    """seller_id 코드 기준 안정 정렬 (셀러 내부의 원래 행 순서 유지)."""
+    order = np.argsort(df["seller_id"].to_numpy(), kind="stable")
+    return df.take(order).reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class SellerPartition:
+    """seller_id 코드 → [start, stop) 행 범위."""
+
+    frame: pd.DataFrame
+    offsets: np.ndarray  # 길이 = 셀러 수 + 1, 코드 c의 행은 offsets[c]:offsets[c + 1]
+    codec: IdCodec
+
+    @classmethod
+    def build(cls, frame: pd.DataFrame, codec: IdCodec) -> SellerPartition:
+        """``sort_by_seller``로 정렬된 frame에서 오프셋을 만든다."""
+        codes = frame["seller_id"].to_numpy()
+        if len(codes) > 1 and np.any(codes[1:] < codes[:-1]):
+            raise ValueError("frame은 seller_id 코드 순으로 정렬되어 있어야 합니다.")
+
+        # 미등록 코드(-1) 행은 맨 앞에 모이므로 그 뒤부터 오프셋을 센다
+        known = codes[codes >= 0]
+        counts = np.bincount(known, minlength=len(codec))
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        offsets += len(codes) - len(known)
+        return cls(frame=frame, offsets=offsets, codec=codec)
+
+    def rows_for_code(self, code: int) -> pd.DataFrame:
+        """코드 하나의 행 슬라이스 (없으면 빈 프레임)."""
+        if not 0 <= code < len(self.offsets) - 1:
+            return self.frame.iloc[0:0]
+        return self.frame.iloc[self.offsets[code]:self.offsets[code + 1]]
+
+    def rows(self, seller_id: str) -> pd.DataFrame:
+        """문자열 셀러 ID의 행 슬라이스."""
+        return self.rows_for_code(self.codec.encode_one(seller_id))
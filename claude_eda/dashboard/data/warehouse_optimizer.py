@@ -0,0 +1,290 @@
+"""창고 입지 최적화 — 배송 완료 주문 전체에 대한 k-중앙값(p-median) 휴리스틱.
+
+``warehouse_recommendations.csv`` / ``warehouse_scenario_comparison.csv``와 같은 스키마의
+결과를 만든다 (``claude_eda/plan_warehouses.py``가 실행해 별도 CSV에 쓰고, ``--apply``일
+때만 대시보드가 읽는 CSV를 갱신한다).
+
+1. 수요 지점: 배송 완료 주문 품목(행)을 고객 zip prefix별로 모은다 (가중치 = 품목 수).
+2. 후보·최적화 단위: zip prefix 앞 3자리 권역별 가중 중심점. 권역 수(수백 개)만큼의
+   (권역 × 후보) 거리 행렬 하나로 탐욕적 추가 → 최선 교환(swap)을 반복한다.
+3. 보고: 선택된 거점에 zip prefix 단위 수요 지점을 ``SiteIndex``로 배정해 커버리지와
+   시나리오별 거리 분포를 계산한다.
+
+목적 함수는 주문 가중 고객 거리 합(``"distance"``) 또는 권역별로 적합한 거리 모델의 추정
+운임 합(``"freight"``)이다. 운임 목적 함수는 수요 지점 가중치에 그 권역의 km당 운임을
+곱한 것이다 (절편은 최적해에 영향 없음, 음수 기울기는 0으로 자름). 시나리오 테이블의 추정 운임·배송일도 같은 권역별
+모델로 계산한다.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from claude_eda.dashboard.config import (
+    REGION_MAP,
+    WAREHOUSE_PLAN_RECOMMENDATIONS_PATH,
+    WAREHOUSE_PLAN_SCENARIO_PATH,
+    WAREHOUSE_RECOMMENDATIONS_PATH,
+    WAREHOUSE_SCENARIO_PATH,
+)
+from claude_eda.dashboard.data.batch_logistics import warehouse_scenario_sizes
+from claude_eda.dashboard.data.distance_model import (
+    DistanceModel,
+    distance_model,
+    region_codes,
+)
+from claude_eda.dashboard.data.geo import SiteIndex, distance_matrix, simulate_warehouse_scenarios
+from claude_eda.dashboard.data.loader import build_merged_table
+
+OBJECTIVES = ("distance", "freight")
+CURRENT_SCENARIO = "현재(셀러직배)"
+PRIORITY_LABELS = ["1차 (즉시)", "2차 (6개월)", "3차 (12개월)"]
+ZIP_REGION_DIVISOR = 100  # zip prefix 5자리 → 앞 3자리 권역
+MAX_SWAP_ROUNDS = 100
+
+RECOMMENDATION_COLUMNS = [
+    "warehouse_id", "lat", "lng", "nearest_city", "state", "region",
+    "covered_orders", "coverage_pct", "top_states", "priority",
+]
+SCENARIO_COLUMNS = [
+    "scenario", "avg_distance_km", "median_distance_km", "p90_distance_km",
+    "est_avg_freight", "est_avg_days",
+]
+
+
+@dataclass
+class DemandPoints:
+    """zip prefix별 수요 지점 (배송 완료 주문 품목, 좌표 있는 것만)."""
+
+    zip_prefix: np.ndarray
+    lat: np.ndarray
+    lng: np.ndarray
+    weight: np.ndarray  # 품목 수
+    state: np.ndarray
+    city: np.ndarray
+    current_km: np.ndarray  # 현재 셀러→고객 거리 (행 단위, 현재 시나리오 분포용)
+    current_state: np.ndarray  # current_km 행의 고객 주
+
+
+@dataclass
+class WarehousePlan:
+    """최적화 결과 — 두 테이블 모두 기존 CSV와 같은 컬럼."""
+
+    recommendations: pd.DataFrame
+    scenarios: pd.DataFrame
+    objective: str
+    total_cost: float
+    swap_rounds: int
+    elapsed_sec: float
+
+
+def build_demand_points() -> DemandPoints:
+    """병합 테이블의 배송 완료 주문 품목 → zip prefix별 수요 지점."""
+    merged = build_merged_table()
+    rows = merged[merged["order_status"].eq("delivered") & merged["customer_lat"].notna()]
+    zips = rows["customer_zip_code_prefix"].to_numpy()
+    uniq, first, weight = np.unique(zips, return_index=True, return_counts=True)
+    current = rows[rows["distance_km"].notna()]
+    return DemandPoints(
+        zip_prefix=uniq,
+        lat=rows["customer_lat"].to_numpy(dtype=np.float64)[first],
+        lng=rows["customer_lng"].to_numpy(dtype=np.float64)[first],
+        weight=weight.astype(np.float64),
+        state=rows["customer_state"].astype(str).to_numpy()[first],
+        city=rows["customer_city"].astype(str).to_numpy()[first],
+        current_km=current["distance_km"].to_numpy(dtype=np.float64),
+        current_state=current["customer_state"].astype(str).to_numpy(),
+    )
+
+
+def _region_centroids(
+    points: DemandPoints, cost_weight: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """zip 앞 3자리 권역별 주문 가중 중심점 (lat, lng)과 권역별 목적 함수 가중치 합."""
+    region, inverse = np.unique(points.zip_prefix // ZIP_REGION_DIVISOR, return_inverse=True)
+    weight = np.bincount(inverse, weights=points.weight, minlength=len(region))
+    lat = np.bincount(inverse, weights=points.lat * points.weight, minlength=len(region)) / weight
+    lng = np.bincount(inverse, weights=points.lng * points.weight, minlength=len(region)) / weight
+    return lat, lng, np.bincount(inverse, weights=cost_weight, minlength=len(region))
+
+
+def _nearest_two(dist: np.ndarray, sites: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """선택된 거점 중 점별 가장 가까운 거점 위치(sites 내 순번)와 1·2순위 거리."""
+    sub = dist[:, sites]
+    if len(sites) == 1:
+        return np.zeros(len(sub), dtype=np.intp), sub[:, 0], np.full(len(sub), np.inf, np.float32)
+    order = np.argpartition(sub, 1, axis=1)[:, :2]
+    rows = np.arange(len(sub))
+    d0, d1 = sub[rows, order[:, 0]], sub[rows, order[:, 1]]
+    swap = d1 < d0
+    nearest = np.where(swap, order[:, 1], order[:, 0])
+    return nearest, np.minimum(d0, d1), np.maximum(d0, d1)
+
+
+def _total_cost(dist: np.ndarray, weight: np.ndarray, sites: np.ndarray) -> float:
+    return float(weight @ dist[:, sites].min(axis=1))
+
+
+def solve_k_median(
+    dist: np.ndarray, weight: np.ndarray, k: int, max_rounds: int = MAX_SWAP_ROUNDS,
+) -> tuple[np.ndarray, float, int]:
+    """(수요 × 후보) 거리 행렬에서 가중 거리 합을 최소화하는 후보 k개.
+
+    탐욕적으로 하나씩 추가한 뒤, 선택된 거점 하나를 후보 하나로 바꾸는 교환 중 비용을 가장
+    많이 줄이는 것을 개선이 없을 때까지 적용한다 (Teitz–Bart). 교환 후보 비용은 거점별로
+    (수요 × 후보) 연산 한 번에 모두 계산한다.
+
+    Returns:
+        (선택된 후보 열 번호, 총비용, 교환 라운드 수)
+    """
+    n_candidates = dist.shape[1]
+    if not 0 < k <= n_candidates:
+        raise ValueError(f"k는 1 이상 후보 수({n_candidates}) 이하여야 합니다: {k}")
+
+    # 1) 탐욕적 추가
+    sites: list[int] = []
+    best_km = np.full(dist.shape[0], np.inf, dtype=np.float32)
+    for _ in range(k):
+        cost = weight @ np.minimum(dist, best_km[:, None])
+        cost[sites] = np.inf
+        pick = int(np.argmin(cost))
+        sites.append(pick)
+        best_km = np.minimum(best_km, dist[:, pick])
+    sites_arr = np.array(sites, dtype=np.intp)
+    total = _total_cost(dist, weight, sites_arr)
+
+    # 2) 최선 교환
+    rounds = 0
+    while rounds < max_rounds:
+        nearest, d_first, d_second = _nearest_two(dist, sites_arr)
+        best = (total, -1, -1)
+        for pos in range(k):
+            # pos 거점을 빼면 그 거점에 배정된 점은 2순위 거점으로 간다
+            base = np.where(nearest == pos, d_second, d_first)
+            cost = weight @ np.minimum(dist, base[:, None])
+            cost[sites_arr] = np.inf
+            cand = int(np.argmin(cost))
+            if cost[cand] < best[0] * (1 - 1e-9):
+                best = (float(cost[cand]), pos, cand)
+        if best[1] < 0:
+            break
+        sites_arr[best[1]] = best[2]
+        total = best[0]
+        rounds += 1
+    return sites_arr, total, rounds
+
+
+def _weighted_quantile(values: np.ndarray, weight: np.ndarray, q: float) -> float:
+    order = np.argsort(values, kind="stable")
+    cum = np.cumsum(weight[order])
+    return float(values[order][np.searchsorted(cum, q * cum[-1])])
+
+
+def _scenario_row(
+    name: str, km: np.ndarray, codes: np.ndarray, model: DistanceModel,
+    weight: np.ndarray | None = None,
+) -> dict:
+    weight = np.ones(len(km)) if weight is None else weight
+    return {
+        "scenario": name,
+        "avg_distance_km": float(np.average(km, weights=weight)),
+        "median_distance_km": _weighted_quantile(km, weight, 0.5),
+        "p90_distance_km": _weighted_quantile(km, weight, 0.9),
+        "est_avg_freight": float(np.average(model.freight(km, codes), weights=weight)),
+        "est_avg_days": float(np.average(model.days(km, codes), weights=weight)),
+    }
+
+
+def _recommendation_table(points: DemandPoints, site_lat, site_lng) -> pd.DataFrame:
+    """선택된 거점 → 커버리지·인근 도시·주요 주·우선순위 (커버리지 내림차순)."""
+    index = SiteIndex(site_lat, site_lng)
+    assigned, _ = index.nearest(points.lat, points.lng)
+    covered = np.bincount(assigned, weights=points.weight, minlength=index.size)
+
+    # 거점에서 가장 가까운 수요 지점의 도시·주
+    nearest_point, _ = SiteIndex(points.lat, points.lng).nearest(site_lat, site_lng)
+    state_weight = (
+        pd.DataFrame({"site": assigned, "state": points.state, "w": points.weight})
+        .groupby(["site", "state"], as_index=False)["w"].sum()
+        .sort_values(["site", "w"], ascending=[True, False], kind="stable")
+    )
+    top_states = state_weight.groupby("site").head(3).groupby("site")["state"].agg(", ".join)
+
+    table = pd.DataFrame({
+        "lat": site_lat,
+        "lng": site_lng,
+        "nearest_city": points.city[nearest_point],
+        "state": points.state[nearest_point],
+        "covered_orders": covered.astype(int),
+        "coverage_pct": covered / points.weight.sum() * 100,
+        "top_states": top_states.reindex(range(index.size), fill_value="").to_numpy(),
+    })
+    table["region"] = table["state"].map(REGION_MAP).fillna("Unknown")
+    table = table.sort_values("covered_orders", ascending=False, kind="stable").reset_index(drop=True)
+    table["warehouse_id"] = np.arange(1, len(table) + 1)
+    tiers = np.array_split(np.arange(len(table)), len(PRIORITY_LABELS))
+    table["priority"] = ""
+    for label, rows in zip(PRIORITY_LABELS, tiers):
+        table.loc[rows, "priority"] = label
+    return table[RECOMMENDATION_COLUMNS]
+
+
+def plan_warehouses(k: int = 5, objective: str = "distance") -> WarehousePlan:
+    """배송 완료 주문 전체에 대해 창고 k개를 고르고 추천·시나리오 테이블을 만든다.
+
+    시나리오는 현재(셀러 직배)와, 커버리지 순 상위 n개 창고만 운영하는 경우
+    (``WAREHOUSE_SCENARIO_SIZES`` + 전체 k개)이다.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective는 {OBJECTIVES} 중 하나여야 합니다: {objective!r}")
+    start = time.perf_counter()
+
+    points = build_demand_points()
+    model = distance_model("region")
+    codes = region_codes(points.state)
+    cost_weight = points.weight
+    if objective == "freight":
+        # km당 운임 (거리 모델이 0 이하 기울기를 전체·기본 기울기로 대체해 항상 양수)
+        cost_weight = cost_weight * model.freight_coef[codes, 0]
+    lat, lng, weight = _region_centroids(points, cost_weight)
+    dist = distance_matrix(lat, lng, lat, lng)
+    sites, total, rounds = solve_k_median(dist, weight.astype(np.float32), k)
+
+    recs = _recommendation_table(points, lat[sites], lng[sites])
+    sizes = warehouse_scenario_sizes(len(recs))
+    scenario_km = simulate_warehouse_scenarios(
+        points.lat, points.lng, recs["lat"].to_numpy(), recs["lng"].to_numpy(), sizes,
+    )
+    scenarios = pd.DataFrame(
+        [_scenario_row(CURRENT_SCENARIO, points.current_km, region_codes(points.current_state), model)]
+        + [_scenario_row(f"{n}개 창고", scenario_km[n].astype(np.float64), codes, model, points.weight)
+           for n in sizes],
+        columns=SCENARIO_COLUMNS,
+    )
+    return WarehousePlan(
+        recommendations=recs,
+        scenarios=scenarios,
+        objective=objective,
+        total_cost=total,
+        swap_rounds=rounds,
+        elapsed_sec=time.perf_counter() - start,
+    )
+
+
+def write_warehouse_plan(plan: WarehousePlan, apply: bool = False) -> tuple[Path, Path]:
+    """결과 CSV 저장 (기존 파일과 같은 UTF-8 BOM 인코딩) → (추천, 시나리오) 경로.
+
+    기본은 별도 ``*_planned.csv``에 쓰고, apply=True일 때만 대시보드가 읽는 CSV를 덮어쓴다.
+    """
+    if apply:
+        paths = (WAREHOUSE_RECOMMENDATIONS_PATH, WAREHOUSE_SCENARIO_PATH)
+    else:
+        paths = (WAREHOUSE_PLAN_RECOMMENDATIONS_PATH, WAREHOUSE_PLAN_SCENARIO_PATH)
+    plan.recommendations.to_csv(paths[0], index=False, encoding="utf-8-sig")
+    plan.scenarios.to_csv(paths[1], index=False, encoding="utf-8-sig")
+    return paths
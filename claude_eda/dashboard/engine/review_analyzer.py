@@ -1,75 +1,168 @@
-"""포르투갈어 리뷰 텍스트 키워드 기반 원인 분류기."""
+"""포르투갈어 리뷰 텍스트 키워드 기반 원인 분류기.
+
+모든 키워드를 하나의 정규식으로 컴파일해 리뷰 코퍼스 전체를 한 번에 훑고, 리뷰마다 이슈
+카테고리 비트마스크와 긍정 여부를 남긴다. 셀러별 분석은 이 컬럼들에 대한 벡터 집계다.
+텍스트와 키워드는 모두 소문자·악센트 제거 후 비교한다.
+
+코퍼스 전체 주석은 ``claude_eda/annotate_reviews.py`` 작업이 미리 만들어 저장한다
+(data/review_annotations.py).
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import re
+import unicodedata
 from collections import Counter
+from functools import reduce
+from operator import or_
 
+import numpy as np
 import pandas as pd
 
-# 카테고리별 포르투갈어 키워드
+# 카테고리별 포르투갈어 키워드 (악센트는 매칭 전에 제거되므로 "não"/"nao"를 따로 둘 필요 없다)
 ISSUE_KEYWORDS = {
     "배송 지연": [
         "entrega", "atraso", "atrasou", "demora", "demorou", "demoro",
         "prazo", "dias", "semana", "semanas", "chegou tarde", "não chegou",
-        "nao chegou", "frete", "correios", "transportadora", "encomenda",
+        "frete", "correios", "transportadora", "encomenda",
         "rastreio", "rastreamento", "extraviado", "perdido",
     ],
     "상품 품질": [
         "qualidade", "defeito", "defeituoso", "quebrado", "quebrou",
-        "danificado", "estragado", "ruim", "péssimo", "pessimo",
-        "horrível", "horrivel", "lixo", "porcaria", "não funciona",
-        "nao funciona", "parou", "problema", "falha",
+        "danificado", "estragado", "ruim", "péssimo", "horrível", "lixo",
+        "porcaria", "não funciona", "parou", "problema", "falha",
     ],
     "포장 문제": [
         "embalagem", "amassado", "amassada", "caixa", "proteção",
-        "protecao", "aberta", "aberto", "rasgado", "rasgada",
-        "mal embalado", "sem proteção", "sem protecao",
+        "aberta", "aberto", "rasgado", "rasgada", "mal embalado",
+        "sem proteção",
     ],
     "기대 불일치": [
-        "foto", "imagem", "descrição", "descricao", "tamanho",
-        "cor", "diferente", "parece", "esperava", "não corresponde",
-        "nao corresponde", "enganoso", "propaganda", "falso", "falsa",
+        "foto", "imagem", "descrição", "tamanho", "cor", "diferente",
+        "parece", "esperava", "não corresponde", "enganoso", "propaganda", "falso", "falsa",
         "menor", "maior", "errado", "errada",
     ],
 }
 
 # 긍정 키워드 (강점 분석용)
 POSITIVE_KEYWORDS = [
-    "excelente", "ótimo", "otimo", "perfeito", "maravilhoso",
-    "recomendo", "amei", "adorei", "rápido", "rapido",
+    "excelente", "ótimo", "perfeito", "maravilhoso",
+    "recomendo", "amei", "adorei", "rápido",
     "antes do prazo", "chegou antes", "boa qualidade",
     "muito bom", "satisfeito", "satisfeita", "nota 10",
 ]
 
 
+ISSUE_CATEGORIES = list(ISSUE_KEYWORDS)
+ISSUE_BITS = {cat: 1 << i for i, cat in enumerate(ISSUE_CATEGORIES)}
+POSITIVE_BIT = 1 << len(ISSUE_CATEGORIES)
+
+# 리뷰 주석 컬럼 (loader가 리뷰 테이블에 미리 계산해 둔다)
+ISSUE_MASK_COL = "review_issue_mask"
+POSITIVE_COL = "review_is_positive"
+
+
+# NFKD 분해 후 남는 결합 악센트 부호 (á → a + ◌́)
+_COMBINING_MARKS = re.compile("[\u0300-\u036f]")
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 악센트 제거 ("Péssimo" → "pessimo")."""
+    return _COMBINING_MARKS.sub("", unicodedata.normalize("NFKD", text.lower()))
+
+
+def normalize_texts(texts: pd.Series) -> pd.Series:
+    """``normalize_text``의 벡터 버전 (결측은 그대로)."""
+    return texts.str.lower().str.normalize("NFKD").str.replace(
+        _COMBINING_MARKS, "", regex=True
+    )
+
+
+def keyword_fingerprint() -> str:
+    """키워드 사전 식별자 — 키워드가 바뀌면 저장된 리뷰 주석을 다시 만든다."""
+    key = json.dumps([ISSUE_KEYWORDS, POSITIVE_KEYWORDS], ensure_ascii=False)
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:8]
+
+
+def _keyword_masks() -> dict[str, int]:
+    """정규화된 키워드 → 비트마스크. 키워드 안에 다른 키워드가 들어 있으면 그 비트도 포함한다."""
+    own: dict[str, int] = {}
+    for cat, keywords in ISSUE_KEYWORDS.items():
+        for kw in map(normalize_text, keywords):
+            own[kw] = own.get(kw, 0) | ISSUE_BITS[cat]
+    for kw in map(normalize_text, POSITIVE_KEYWORDS):
+        own[kw] = own.get(kw, 0) | POSITIVE_BIT
+    return {
+        kw: reduce(or_, (mask for sub, mask in own.items() if sub in kw), 0)
+        for kw in own
+    }
+
+
+_KEYWORD_MASKS = _keyword_masks()
+
+# 모든 키워드를 하나의 전방탐색 패턴으로 — 각 위치에서 가장 긴 키워드 하나를 잡는다.
+# 같은 위치에서 시작하는 더 짧은 키워드는 긴 키워드의 접두사이므로 _KEYWORD_MASKS에 포함된다.
+_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(
+        re.escape(kw) for kw in sorted(_KEYWORD_MASKS, key=len, reverse=True)
+    ) + "))"
+)
+
+
+def _mask_of(matches: list[str]) -> int:
+    mask = 0
+    for kw in matches:
+        mask |= _KEYWORD_MASKS[kw]
+    return mask
+
+
+def review_mask(text: str) -> int:
+    """리뷰 텍스트 하나의 이슈 비트마스크 (+ 긍정 비트)."""
+    if not text or not isinstance(text, str):
+        return 0
+    return _mask_of(_KEYWORD_PATTERN.findall(normalize_text(text)))
+
+
+def annotate_reviews(texts: pd.Series) -> pd.DataFrame:
+    """리뷰 텍스트 전체를 한 번에 분류 → 이슈 비트마스크 + 긍정 여부 컬럼."""
+    matches = normalize_texts(texts).str.findall(_KEYWORD_PATTERN)
+    masks = matches.map(_mask_of, na_action="ignore").fillna(0).astype("uint8")
+    return pd.DataFrame({
+        ISSUE_MASK_COL: masks & (POSITIVE_BIT - 1),
+        POSITIVE_COL: (masks & POSITIVE_BIT) > 0,
+    }, index=texts.index)
+
+
 def classify_review(text: str) -> list[str]:
     """리뷰 텍스트를 이슈 카테고리로 분류. 복수 카테고리 가능."""
-    if not text or not isinstance(text, str):
-        return []
-    text_lower = text.lower()
-    categories = []
-    for category, keywords in ISSUE_KEYWORDS.items():
-        for kw in keywords:
-            if kw in text_lower:
-                categories.append(category)
-                break
-    return categories
+    mask = review_mask(text)
+    return [cat for cat in ISSUE_CATEGORIES if mask & ISSUE_BITS[cat]]
 
 
 def is_positive_review(text: str) -> bool:
     """긍정 리뷰 여부 판단."""
-    if not text or not isinstance(text, str):
-        return False
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in POSITIVE_KEYWORDS)
+    return bool(review_mask(text) & POSITIVE_BIT)
+
+
+def _issue_counts(masks: np.ndarray) -> dict[str, int]:
+    """카테고리별 건수 — 처음 등장한 리뷰 순서로 정렬 (동률이면 카테고리 정의 순서)."""
+    first_seen = []
+    for order, cat in enumerate(ISSUE_CATEGORIES):
+        hits = (masks & ISSUE_BITS[cat]) > 0
+        if hits.any():
+            first_seen.append((int(hits.argmax()), order, cat, int(hits.sum())))
+    return {cat: count for _, _, cat, count in sorted(first_seen)}
 
 
 def analyze_seller_reviews(reviews_df: pd.DataFrame) -> dict:
     """셀러의 리뷰 텍스트를 분석하여 이슈 분포 반환.
 
     Args:
-        reviews_df: review_score, review_comment_message 컬럼이 있는 DataFrame
+        reviews_df: review_score, review_comment_message 컬럼이 있는 DataFrame.
+            review_issue_mask / review_is_positive 주석 컬럼이 있으면 그대로 쓰고,
+            없으면 여기서 분류한다.
 
     Returns:
         dict with:
@@ -102,38 +195,31 @@ def analyze_seller_reviews(reviews_df: pd.DataFrame) -> dict:
     if text_reviews.empty:
         return result
 
-    all_issues = Counter()
-    neg_issues = Counter()
-    examples: dict[str, list[str]] = {cat: [] for cat in ISSUE_KEYWORDS}
-
-    for _, row in text_reviews.iterrows():
-        text = row["review_comment_message"]
-        score = row.get("review_score", 3)
-        categories = classify_review(text)
-
-        for cat in categories:
-            all_issues[cat] += 1
-            if len(examples[cat]) < 2:
-                snippet = text[:100] + "..." if len(text) > 100 else text
-                examples[cat].append(snippet)
-
-        if score <= 2:
-            for cat in categories:
-                neg_issues[cat] += 1
-
-        if is_positive_review(text):
-            result["positive_count"] += 1
-
-    result["issue_counts"] = dict(all_issues)
-    if result["analyzed_count"] > 0:
-        result["issue_pct"] = {
-            cat: count / result["analyzed_count"]
-            for cat, count in all_issues.items()
-        }
-    result["negative_issues"] = dict(neg_issues)
-    result["examples"] = {cat: exs for cat, exs in examples.items() if exs}
+    if ISSUE_MASK_COL not in text_reviews.columns:
+        text_reviews = text_reviews.join(annotate_reviews(text_reviews["review_comment_message"]))
+
+    masks = text_reviews[ISSUE_MASK_COL].to_numpy()
+    scores = text_reviews["review_score"].to_numpy() if "review_score" in text_reviews else None
+    texts = text_reviews["review_comment_message"].to_numpy()
+
+    all_issues = _issue_counts(masks)
+    neg_issues = _issue_counts(masks[scores <= 2]) if scores is not None else {}
+    result["positive_count"] = int(text_reviews[POSITIVE_COL].sum())
+
+    examples: dict[str, list[str]] = {}
+    for cat in ISSUE_CATEGORIES:
+        for text in texts[(masks & ISSUE_BITS[cat]) > 0][:2]:
+            snippet = text[:100] + "..." if len(text) > 100 else text
+            examples.setdefault(cat, []).append(snippet)
+
+    result["issue_counts"] = all_issues
+    result["issue_pct"] = {
+        cat: count / result["analyzed_count"] for cat, count in all_issues.items()
+    }
+    result["negative_issues"] = neg_issues
+    result["examples"] = examples
 
     if all_issues:
-        result["primary_issue"] = all_issues.most_common(1)[0][0]
+        result["primary_issue"] = Counter(all_issues).most_common(1)[0][0]
 
     return result
@@ -18,7 +18,7 @@ from claude_eda.dashboard.data.inventory_loader import (
     load_warehouse_inventory,
     load_warehouses,
 )
-from claude_eda.dashboard.data.loader import load_product_names
+from claude_eda.dashboard.data.loader import load_product_names, product_codec
 from claude_eda.dashboard.data.logistics_analyzer import compute_seller_logistics
 from claude_eda.dashboard.data.preprocessor import SellerMetrics
 from claude_eda.dashboard.engine.delivery_rules import (
@@ -125,6 +125,12 @@ def _render_delivery_diagnosis(d: dict) -> None:
             delta=f"{avg_total - platform_total:+.1f}일 vs 평균",
             delta_color="inverse",
         )
+        dist, platform_dist = d["total_delivery_dist"], d["platform_total_delivery_dist"]
+        if dist["count"] > 0:
+            st.caption(
+                f"중앙값 {dist['p50']:.0f}일 · P90 {dist['p90']:.0f}일 "
+                f"(플랫폼 P90 {platform_dist['p90']:.0f}일)"
+            )
     with col4:
         st.metric("분석 주문 수", f"{d['seller_orders']:,}건")
 
@@ -288,7 +294,7 @@ def _render_warehouse_inventory_detail(warehouse_id: str, summary: dict[str, dic
         pnames = load_product_names()[["product_id", "product_name_display"]]
         display = display.merge(pnames, on="product_id", how="left")
         display["product_name_display"] = display["product_name_display"].fillna(
-            display["product_id"].str[:12] + "..."
+            product_codec().decode(display["product_id"]).str[:12] + "..."
         )
         display = display[["product_name_display", "quantity_on_hand", "quantity_reserved",
                            "quantity_available", "last_restock_date"]]
@@ -384,12 +390,18 @@ def _render_inventory_status(inv: dict) -> None:
                             "safety_stock", "urgency"]
             display = alerts[[c for c in display_cols if c in alerts.columns]].copy()
             if "product_id" in display.columns:
+                # 결과 프레임은 문자열 ID, 상품명 매핑은 코드 — 코드로 조인
                 pnames = load_product_names()[["product_id", "product_name_display"]]
-                display = display.merge(pnames, on="product_id", how="left")
+                display["product_code"] = product_codec().encode(display["product_id"])
+                display = display.merge(
+                    pnames.rename(columns={"product_id": "product_code"}),
+                    on="product_code",
+                    how="left",
+                )
                 display["product_name_display"] = display["product_name_display"].fillna(
                     display["product_id"].str[:12] + "..."
                 )
-                display = display.drop(columns=["product_id"])
+                display = display.drop(columns=["product_id", "product_code"])
                 # product_name_display를 첫 번째 컬럼으로 이동
                 cols = ["product_name_display"] + [c for c in display.columns if c != "product_name_display"]
                 display = display[cols]
@@ -156,7 +156,8 @@ def _render_warehouse_recommendation(logi: dict) -> None:
     _section_header(
         "Olist 추천 물류 거점",
         "🏭",
-        "Olist가 데이터 기반으로 도출한 5개 최적 창고 위치와 셀러에게 유리한 순위를 보여줍니다",
+        f"Olist가 데이터 기반으로 도출한 {len(logi['warehouse_recs'])}개 최적 창고 위치와 "
+        "셀러에게 유리한 순위를 보여줍니다",
     )
 
     col_l, col_r = st.columns([3, 2])
@@ -285,7 +286,7 @@ def _render_action_plan(metrics: SellerMetrics, logi: dict) -> None:
         return
 
     current = sim[0]
-    best_sim = sim[-1]  # 5개 창고
+    best_sim = sim[-1]  # 전체 창고
     freight_save = current["est_freight"] - best_sim["est_freight"]
     days_save = current["est_days"] - best_sim["est_days"]
 
@@ -362,12 +363,13 @@ def _render_action_plan(metrics: SellerMetrics, logi: dict) -> None:
 
     # Phase 2: 확장
     re = logi["region_effect"]
-    if len(re) > 1:
+    if len(re) > 1 and len(sim) > 3:
         top_region = re.iloc[0]
+        mid_sim = sim[-2]  # 전체 직전 규모의 다중 창고 시나리오
         phase2_actions = [
             f"주요 고객 권역({top_region['region']})에 가까운 추가 창고 활용 검토",
-            f"3개 창고 활용 시 평균 거리 {sim[2]['avg_distance']:.0f}km — "
-            f"건당 운임 R${current['est_freight'] - sim[2]['est_freight']:.1f} 절감",
+            f"{mid_sim['n_warehouses']}개 창고 활용 시 평균 거리 {mid_sim['avg_distance']:.0f}km — "
+            f"건당 운임 R${current['est_freight'] - mid_sim['est_freight']:.1f} 절감",
         ]
     else:
         phase2_actions = ["고객 분포 확대에 따라 추가 창고 활용 검토"]
@@ -389,7 +391,7 @@ def _render_action_plan(metrics: SellerMetrics, logi: dict) -> None:
 
     # Phase 3: 고도화
     phase3_actions = [
-        f"5개 창고 전체 활용 시 평균 거리 {best_sim['avg_distance']:.0f}km, "
+        f"{best_sim['n_warehouses']}개 창고 전체 활용 시 평균 거리 {best_sim['avg_distance']:.0f}km, "
         f"배송일 {best_sim['est_days']:.1f}일 달성",
         "리뷰 점수 개선 → 거리 감소에 따른 배송 만족도 상승 기대",
         "원거리 지역(North, Northeast) 고객 확대 기회 확보",
@@ -418,12 +420,19 @@ def _render_action_plan(metrics: SellerMetrics, logi: dict) -> None:
         st.write("")
 
     # 참고 사항
+    fallback_note = ""
+    if logi["model_fallback_pct"] > 0:
+        fallback_note = (
+            f"<br>이 셀러 주문의 {logi['model_fallback_pct']:.0f}%는 거리 모델 그룹(권역 등)의 "
+            "적합 기울기가 0 이하여서 전체(또는 기본) 기울기로 추정했습니다."
+        )
     st.markdown(
-        """
+        f"""
         <div style="background: #fff3e0; border-radius: 6px; padding: 12px 16px;
              margin-top: 8px; font-size: 0.85em; color: #e65100;">
-            <b>참고:</b> 운임/배송일 절감은 거리-운임(R$0.0104/km), 거리-배송일(0.006일/km)
-            선형 회귀 모델 기반 추정치입니다. 실제 효과는 상품 무게/부피, 운송사, 계절 등에 따라 달라질 수 있습니다.
+            <b>참고:</b> 운임/배송일 절감은 배송 완료 주문에서 적합한 거리-운임(R${logi['freight_per_km']:.4f}/km),
+            거리-배송일({logi['days_per_km']:.4f}일/km) 선형 회귀 모델 기반 추정치입니다 (이 셀러 주문 기준 평균 계수).
+            실제 효과는 상품 무게/부피, 운송사, 계절 등에 따라 달라질 수 있습니다.{fallback_note}
         </div>
         """,
         unsafe_allow_html=True,
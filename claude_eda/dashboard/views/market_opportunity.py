@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
@@ -21,10 +22,16 @@ from claude_eda.dashboard.data.market_analyzer import (
     compute_price_simulation,
     compute_regional_supply_demand,
     compute_seller_growth_regions,
+    custom_price_bands,
 )
 from claude_eda.dashboard.data.preprocessor import SellerMetrics
 from claude_eda.dashboard.utils.korean import STATE_NAMES_KR
 
+# 가격 포지셔닝 백분위 추정에 쓰는 compute_category_price_stats 컬럼 (백분위 → 컬럼)
+PRICE_PERCENTILE_COLUMNS = {
+    5: "p5", 10: "p10", 25: "p25", 50: "median_price", 75: "p75", 90: "p90", 95: "p95",
+}
+
 
 def render_market_opportunity(metrics: SellerMetrics) -> None:
     """시장 기회 분석 페이지 렌더."""
@@ -224,10 +231,9 @@ def _render_price_sweet_spot(metrics: SellerMetrics) -> None:
     seller_prices = {}
     if metrics.category_revenue is not None and not metrics.category_revenue.empty:
         try:
-            from claude_eda.dashboard.data.loader import build_merged_table
-            merged_data = build_merged_table()
-            sd = merged_data[merged_data["seller_id"] == metrics.seller_id]
-            seller_prices = sd.groupby("product_category_name_english")["price"].mean().to_dict()
+            from claude_eda.dashboard.data.loader import merged_by_seller
+            sd = merged_by_seller().rows(metrics.seller_id)
+            seller_prices = sd.groupby("product_category_name_english", observed=True)["price"].mean().to_dict()
         except Exception:
             pass
 
@@ -263,6 +269,13 @@ def _render_price_sweet_spot(metrics: SellerMetrics) -> None:
         selected_state_label = st.selectbox("지역 선택", state_labels, key="market_state_select")
         selected_state = selected_state_label.split(" (")[0] if selected_state_label else ""
 
+    edges_text = st.text_input(
+        "가격대 경계 (R$, 쉼표로 구분 — 비우면 기본 가격대)",
+        key="market_price_edges",
+        placeholder="예: 30, 100, 200",
+    )
+    bands = _parse_price_bands(edges_text)
+
     col_l2, col_r2 = st.columns(2)
 
     with col_l2:
@@ -274,7 +287,7 @@ def _render_price_sweet_spot(metrics: SellerMetrics) -> None:
 
     with col_r2:
         if selected_cat and selected_state:
-            sim_data = compute_price_simulation(selected_cat, selected_state)
+            sim_data = compute_price_simulation(selected_cat, selected_state, bands)
             fig = revenue_simulation_chart(sim_data)
             fig.update_layout(height=380)
             st.plotly_chart(fig, use_container_width=True)
@@ -287,6 +300,38 @@ def _render_price_sweet_spot(metrics: SellerMetrics) -> None:
                 )
 
 
+def _parse_price_bands(text: str) -> list[tuple[float, float, str]] | None:
+    """쉼표 구분 가격 경계 입력 → 가격대 목록 (비었거나 잘못되면 None = 기본 가격대)."""
+    if not text.strip():
+        return None
+    try:
+        edges = [float(v) for v in text.replace("R$", "").split(",") if v.strip()]
+    except ValueError:
+        st.warning("가격 경계는 숫자를 쉼표로 구분해 입력하세요. 기본 가격대로 계산합니다.")
+        return None
+    if not edges:
+        return None
+    bands = custom_price_bands(edges)
+    used = {low for low, _, _ in bands[1:]}
+    moved = sorted({e for e in edges if e not in used and 0 < e < bands[-1][1]})
+    st.caption(
+        "가격대 경계는 유효숫자 2자리 눈금(예: 125 → 130)으로 맞춰 계산합니다."
+        + (f" 조정된 입력: {', '.join(f'{e:g}' for e in moved)}" if moved else "")
+    )
+    return bands
+
+
+def _price_percentile_label(price: float, row) -> str:
+    """시장 분위수(P5~P95) 사이 선형 보간으로 추정한 가격 백분위 라벨."""
+    levels = list(PRICE_PERCENTILE_COLUMNS)
+    points = [row[col] for col in PRICE_PERCENTILE_COLUMNS.values()]
+    if price < points[0]:
+        return f"P{levels[0]} 미만"
+    if price > points[-1]:
+        return f"P{levels[-1]} 초과"
+    return f"P{np.interp(price, points, levels):.0f}"
+
+
 def _price_position_table(stats_df, seller_prices: dict) -> go.Figure:
     """카테고리별 가격 포지셔닝 Plotly 테이블."""
     if stats_df is None or stats_df.empty:
@@ -300,11 +345,13 @@ def _price_position_table(stats_df, seller_prices: dict) -> go.Figure:
     cats = stats_df["category"].tolist()
     my_prices = []
     positions = []
+    percentiles = []
     for _, row in stats_df.iterrows():
         cat = row["category"]
         mp = seller_prices.get(cat)
         if mp is not None:
             my_prices.append(f"R${mp:,.0f}")
+            percentiles.append(_price_percentile_label(mp, row))
             if mp < row["p25"]:
                 positions.append("저가")
             elif mp <= row["p75"]:
@@ -314,6 +361,7 @@ def _price_position_table(stats_df, seller_prices: dict) -> go.Figure:
         else:
             my_prices.append("-")
             positions.append("-")
+            percentiles.append("-")
 
     # 포지션별 셀 색상
     pos_colors = []
@@ -331,7 +379,7 @@ def _price_position_table(stats_df, seller_prices: dict) -> go.Figure:
 
     fig = go.Figure(go.Table(
         header=dict(
-            values=["카테고리", "내 평균가", "시장 중앙값", "P25", "P75", "포지션"],
+            values=["카테고리", "내 평균가", "시장 중앙값", "P25", "P75", "시장 내 위치", "포지션"],
             fill_color=COLORS["primary"],
             font=dict(color="white", size=11),
             align="center",
@@ -343,9 +391,10 @@ def _price_position_table(stats_df, seller_prices: dict) -> go.Figure:
                 [f"R${v:,.0f}" for v in stats_df["median_price"]],
                 [f"R${v:,.0f}" for v in stats_df["p25"]],
                 [f"R${v:,.0f}" for v in stats_df["p75"]],
+                percentiles,
                 positions,
             ],
-            fill_color=[base_white, base_white, base_white, base_white, base_white, pos_colors],
+            fill_color=[base_white] * 6 + [pos_colors],
             align="center",
             font=dict(size=11),
             height=28,
@@ -410,7 +459,7 @@ def _cross_sell_table(seller_cats: list[str]) -> go.Figure:
     top7 = cross_df.head(7)
     fig = go.Figure(go.Table(
         header=dict(
-            values=["카테고리", "채택률", "평균가(R$)", "매출(R$)", "주문수"],
+            values=["카테고리", "채택률", "리프트", "평균가(R$)", "매출(R$)", "주문수"],
             fill_color=COLORS["primary"],
             font=dict(color="white", size=11),
             align="center",
@@ -419,6 +468,7 @@ def _cross_sell_table(seller_cats: list[str]) -> go.Figure:
             values=[
                 top7["category"],
                 [f"{v:.0%}" for v in top7["adoption_rate"]],
+                [f"{v:.1f}배" for v in top7["lift"]],
                 [f"R${v:,.0f}" for v in top7["avg_price"]],
                 [f"R${v:,.0f}" for v in top7["revenue"]],
                 [f"{v:,}" for v in top7["orders"]],
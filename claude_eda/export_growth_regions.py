@@ -0,0 +1,61 @@
+"""전체 셀러 성장 가능 지역 일괄 추천 작업.
+
+모든 셀러의 진출 추천 주 Top 5(시장 기회 페이지와 같은 점수)를 한 번에 계산해
+seller_growth_regions.csv로 저장한다. 확장 캠페인 대상 선정 등 일괄 활용용.
+
+사용법:
+    python claude_eda/export_growth_regions.py [--output PATH] [--dry-run]
+
+--dry-run: 요약만 출력하고 CSV는 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit.logger  # noqa: E402
+
+# 스트림릿 런타임 밖에서 실행되므로 캐시 경고 로그를 숨긴다
+streamlit.logger.set_log_level("error")
+
+from claude_eda.dashboard.config import GROWTH_REGIONS_EXPORT_PATH  # noqa: E402
+from claude_eda.dashboard.data.batch_growth import compute_all_growth_regions  # noqa: E402
+from claude_eda.dashboard.data.loader import build_merged_table, seller_codec  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", type=Path, default=GROWTH_REGIONS_EXPORT_PATH)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    build_merged_table()  # 원본 테이블 로드·병합은 점수 계산 시간에서 제외
+    start = time.perf_counter()
+    table = compute_all_growth_regions().reset_index()
+    elapsed = time.perf_counter() - start
+
+    table["seller_id"] = seller_codec().decode(table["seller_id"])
+    table["rank"] += 1
+    print(f"셀러 {table['seller_id'].nunique():,}명, 추천 {len(table):,}건: {elapsed:.2f}s")
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(table["state"].value_counts().head(10).to_string())
+        print()
+        print(table.head(10).round(2).to_string(index=False))
+
+    if args.dry_run:
+        return
+    table.to_csv(args.output, index=False)
+    print(f"저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""창고 활용 효과가 큰 셀러 순위 일괄 작업.
+
+전체 셀러 물류 테이블(물류 최적화 페이지와 같은 계산)에서 전체 창고를 운영할 때의 거리
+절감 총량(평균 절감 km × 주문 품목 수) 내림차순 셀러 순위를 seller_warehouse_benefit.csv로
+저장한다. 창고 입점 제안 대상 선정 등 일괄 활용용.
+
+사용법:
+    python claude_eda/export_warehouse_benefit.py [--top N] [--output PATH] [--dry-run]
+
+--top: 상위 N명만 저장 (기본 전체).
+--dry-run: 요약만 출력하고 CSV는 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit.logger  # noqa: E402
+
+# 스트림릿 런타임 밖에서 실행되므로 캐시 경고 로그를 숨긴다
+streamlit.logger.set_log_level("error")
+
+from claude_eda.dashboard.config import WAREHOUSE_BENEFIT_EXPORT_PATH  # noqa: E402
+from claude_eda.dashboard.data.batch_logistics import warehouse_benefit_ranking  # noqa: E402
+from claude_eda.dashboard.data.loader import build_merged_table, seller_codec  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--top", type=int, default=None)
+    parser.add_argument("--output", type=Path, default=WAREHOUSE_BENEFIT_EXPORT_PATH)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    build_merged_table()  # 원본 테이블 로드·병합은 계산 시간에서 제외
+    start = time.perf_counter()
+    table = warehouse_benefit_ranking(args.top).reset_index()
+    elapsed = time.perf_counter() - start
+
+    table["seller_id"] = seller_codec().decode(table["seller_id"])
+    table.insert(0, "rank", range(1, len(table) + 1))
+    print(f"셀러 {len(table):,}명: {elapsed:.2f}s")
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(table.head(10).round(2).to_string(index=False))
+
+    if args.dry_run:
+        return
+    table.to_csv(args.output, index=False)
+    print(f"저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
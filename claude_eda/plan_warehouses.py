@@ -0,0 +1,64 @@
+"""창고 입지 최적화 작업.
+
+배송 완료 주문 전체에 대해 창고 k개를 고르고, 대시보드가 읽는
+warehouse_recommendations.csv / warehouse_scenario_comparison.csv와 같은 스키마로 저장한다.
+
+사용법:
+    python claude_eda/plan_warehouses.py [--k 5] [--objective distance|freight] [--apply | --dry-run]
+
+기본: warehouse_recommendations_planned.csv / warehouse_scenario_comparison_planned.csv에 쓴다.
+--apply: 대시보드가 읽는 CSV를 덮어쓴다.
+--dry-run: 결과만 출력하고 CSV는 쓰지 않는다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import streamlit.logger  # noqa: E402
+
+# 스트림릿 런타임 밖에서 실행되므로 캐시 경고 로그를 숨긴다
+streamlit.logger.set_log_level("error")
+
+from claude_eda.dashboard.data.loader import build_merged_table  # noqa: E402
+from claude_eda.dashboard.data.warehouse_optimizer import (  # noqa: E402
+    OBJECTIVES,
+    plan_warehouses,
+    write_warehouse_plan,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--objective", choices=OBJECTIVES, default="distance")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--apply", action="store_true")
+    mode.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    build_merged_table()  # 원본 테이블 로드·병합은 최적화 시간에서 제외
+    plan = plan_warehouses(args.k, args.objective)
+    print(f"창고 {args.k}개 (objective={plan.objective}): {plan.elapsed_sec:.2f}s, "
+          f"교환 {plan.swap_rounds}회, 총비용 {plan.total_cost:,.0f}")
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(plan.recommendations.to_string(index=False))
+        print()
+        print(plan.scenarios.round(2).to_string(index=False))
+
+    if args.dry_run:
+        return
+    for path in write_warehouse_plan(plan, apply=args.apply):
+        print(f"저장: {path}")
+
+
+if __name__ == "__main__":
+    main()